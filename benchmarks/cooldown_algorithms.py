@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Copyright © tandemdude 2020-present
+#
+# This file is part of Lightbulb.
+#
+# Lightbulb is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Lightbulb is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
+"""Compares the admission rate and acquire overhead of the cooldown algorithms under bursty traffic."""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import timeit
+import typing as t
+
+from lightbulb import cooldowns
+
+
+class _Clock:
+    __slots__ = ("now",)
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+def main(duration: float, length: float = 10.0, usages: int = 5) -> None:
+    algorithms: t.Dict[str, t.Type[cooldowns.Bucket]] = {
+        "fixed window": cooldowns.UserBucket,
+        "sliding window log": cooldowns._bucket_with_algorithm(cooldowns.UserBucket, cooldowns.SlidingWindowLog),
+        "sliding window counter": cooldowns._bucket_with_algorithm(
+            cooldowns.UserBucket, cooldowns.SlidingWindowCounter
+        ),
+        "token bucket": cooldowns._bucket_with_algorithm(cooldowns.UserBucket, cooldowns.TokenBucket),
+    }
+
+    rng = random.Random(0)
+    requests: t.List[float] = []
+    now = 0.0
+    while now < duration:
+        # Bursty traffic averaging four times the permitted rate
+        now += rng.expovariate(4 * usages / length) * rng.choice((0.1, 1.9))
+        requests.append(now)
+
+    clock = _Clock()
+    for name, bucket_type in algorithms.items():
+        setattr(cooldowns, "time", clock)
+        admitted = 0
+        bucket: t.Optional[cooldowns.Bucket] = None
+        for clock.now in requests:
+            status = bucket.acquire() if bucket is not None else cooldowns.CooldownStatus.EXPIRED
+            if status is cooldowns.CooldownStatus.EXPIRED:
+                bucket = bucket_type(length, usages)
+                status = bucket.acquire()
+            admitted += status is cooldowns.CooldownStatus.INACTIVE
+
+        setattr(cooldowns, "time", time)
+        bucket = bucket_type(length, usages)
+        per_call = min(timeit.repeat(bucket.acquire, number=100_000, repeat=5)) / 100_000
+        rate = admitted / duration * length
+        print(f"{name:>24}: {rate:.2f} admitted per window (limit {usages}), {per_call * 1e9:.0f}ns per acquire")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("duration", type=float, nargs="?", default=3600.0, help="Seconds of traffic to simulate.")
+    main(parser.parse_args().duration)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Copyright © tandemdude 2020-present
+#
+# This file is part of Lightbulb.
+#
+# Lightbulb is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Lightbulb is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
+"""Compares the memory used by CooldownManager and CompactCooldownManager to track a large number of keys."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tracemalloc
+import typing as t
+
+from lightbulb import cooldowns
+
+
+class _Author:
+    __slots__ = ("id",)
+
+    def __init__(self) -> None:
+        self.id = 0
+
+
+class _Context:
+    __slots__ = ("author",)
+
+    def __init__(self) -> None:
+        self.author = _Author()
+
+
+async def _fill(manager: cooldowns.CooldownManager, keys: int) -> None:
+    context = _Context()
+    for i in range(keys):
+        # Spread the keys out like user snowflakes
+        context.author.id = 175928847299117063 + i * 4194304
+        await manager.add_cooldown(t.cast(t.Any, context))
+
+
+def main(keys: int) -> None:
+    managers: t.Dict[str, t.Callable[[], cooldowns.CooldownManager]] = {
+        "CooldownManager": lambda: cooldowns.CooldownManager(lambda _: cooldowns.UserBucket(3600, 5)),
+        "CompactCooldownManager": lambda: cooldowns.CompactCooldownManager(3600, 5, cooldowns.UserBucket),
+    }
+    for name, factory in managers.items():
+        tracemalloc.start()
+        manager = factory()
+        asyncio.run(_fill(manager, keys))
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{name}: {used / 2**20:.1f}MiB for {keys} keys ({used / keys:.0f} bytes per key)")
+        del manager
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("keys", type=int, nargs="?", default=1_000_000, help="Number of keys to track.")
+    main(parser.parse_args().keys)
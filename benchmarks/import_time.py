@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Copyright © tandemdude 2020-present
+#
+# This file is part of Lightbulb.
+#
+# Lightbulb is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Lightbulb is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
+"""Measures the time taken by a cold ``import lightbulb``, optionally failing if it is over a budget."""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import typing as t
+
+
+def main(runs: int, budget: t.Optional[float]) -> None:
+    times = []
+    for _ in range(runs):
+        # hikari is imported first so that only the time spent importing lightbulb itself is measured
+        out = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import hikari; import lightbulb"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        line = next(ln for ln in out.splitlines() if ln.rsplit("|", 1)[-1].strip() == "lightbulb")
+        times.append(int(line.split("|")[1]) / 1000)
+
+    median = statistics.median(times)
+    print(f"cold 'import lightbulb': median {median:.1f}ms, min {min(times):.1f}ms over {runs} runs")
+    if budget is not None and median > budget:
+        sys.exit(f"import time regression: {median:.1f}ms is over the {budget:.1f}ms budget")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("budget", type=float, nargs="?", help="Maximum median import time in milliseconds.")
+    parser.add_argument("--runs", type=int, default=15, help="Number of times to import lightbulb.")
+    args = parser.parse_args()
+    main(args.runs, args.budget)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Copyright © tandemdude 2020-present
+#
+# This file is part of Lightbulb.
+#
+# Lightbulb is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Lightbulb is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
+"""Measures name lookups and prefix matching in the name index used by the converters for a large guild."""
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import time
+import timeit
+
+from lightbulb.utils import search
+
+
+def main(members: int) -> None:
+    random.seed(0)
+    names = search._NameMap(prefixes=True)
+    start = time.perf_counter()
+    for i in range(members):
+        # Many members share a common prefix, as in guilds full of default or templated names
+        username = f"user{i}" if i % 2 else "".join(random.choices(string.ascii_letters, k=random.randint(3, 16)))
+        nickname = f"{username.title()} {i % 1000}" if i % 3 == 0 else None
+        names.set(175928847299117063 + i * 4194304, (username, f"{username}#{i % 10000:04}", nickname))
+    build = time.perf_counter() - start
+    print(f"indexed {members} members in {build * 1000:.0f}ms ({build / members * 1e6:.1f}us per member)")
+
+    for query in ("us", "use", "user", "usera", "user1234", "user99999", "User3 3", "zz", "nobody at all"):
+        number, total = timeit.Timer(lambda: names.match(query, 10)).autorange()
+        print(f"match({query!r:>16}): {total / number * 1e6:8.1f}us, {len(names.match(query, 10))} matches")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("members", type=int, nargs="?", default=200_000, help="Number of members in the guild.")
+    main(parser.parse_args().members)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Copyright © tandemdude 2020-present
+#
+# This file is part of Lightbulb.
+#
+# Lightbulb is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Lightbulb is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
+"""Compares permissions_in_bulk with calling permissions_in for each member of a large guild."""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import typing as t
+
+import hikari
+
+from lightbulb.utils import permissions
+
+_GUILD_ID = 574921006817476608
+
+
+class _Role:
+    __slots__ = ("id", "permissions")
+
+    def __init__(self, id_: int, permissions_: hikari.Permissions) -> None:
+        self.id = id_
+        self.permissions = permissions_
+
+
+class _Member:
+    __slots__ = ("id", "guild_id", "role_ids", "_roles")
+
+    def __init__(self, id_: int, roles: t.Sequence[_Role]) -> None:
+        self.id = id_
+        self.guild_id = _GUILD_ID
+        self.role_ids = [_GUILD_ID, *(role.id for role in roles[1:])]
+        self._roles = roles
+
+    def get_roles(self) -> t.Sequence[_Role]:
+        return self._roles
+
+
+class _Channel:
+    __slots__ = ("permission_overwrites",)
+
+    def __init__(self, overwrites: t.Mapping[int, hikari.PermissionOverwrite]) -> None:
+        self.permission_overwrites = overwrites
+
+
+def _overwrite(id_: int, allow: int, deny: int) -> hikari.PermissionOverwrite:
+    return hikari.PermissionOverwrite(
+        id=hikari.Snowflake(id_),
+        type=hikari.PermissionOverwriteType.ROLE,
+        allow=hikari.Permissions(allow),
+        deny=hikari.Permissions(deny),
+    )
+
+
+def main(members_count: int) -> None:
+    random.seed(0)
+    flags = [int(flag) for flag in hikari.Permissions if flag != hikari.Permissions.ADMINISTRATOR]
+    everyone = _Role(_GUILD_ID, hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.SEND_MESSAGES)
+    roles = [_Role(_GUILD_ID + i, hikari.Permissions(sum(random.sample(flags, 4)))) for i in range(1, 21)]
+    roles[0].permissions = hikari.Permissions.ADMINISTRATOR
+    # A few hundred distinct role sets, shared between the members as in a real guild
+    role_sets = [random.sample(roles[1:], random.randint(0, 4)) for _ in range(300)] + [[roles[0]]]
+    members = [_Member(_GUILD_ID + 10_000 + i, [everyone, *random.choice(role_sets)]) for i in range(members_count)]
+
+    overwrites = {_GUILD_ID: _overwrite(_GUILD_ID, 0, hikari.Permissions.SEND_MESSAGES)}
+    for role in roles[::3]:
+        overwrites[role.id] = _overwrite(role.id, sum(random.sample(flags, 2)), sum(random.sample(flags, 2)))
+    for member in members[::500]:
+        overwrites[member.id] = _overwrite(member.id, hikari.Permissions.SEND_MESSAGES, 0)
+    # The benchmark only provides the attributes that permission resolution uses
+    channel = t.cast(hikari.GuildChannel, _Channel(overwrites))
+    guild_members = t.cast(t.List[hikari.Member], members)
+
+    start = time.perf_counter()
+    expected = [(member, permissions.permissions_in(channel, member)) for member in guild_members]
+    loop = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = list(permissions.permissions_in_bulk(channel, guild_members))
+    bulk = time.perf_counter() - start
+
+    assert actual == expected, "permissions_in_bulk disagrees with permissions_in"
+    print(f"per-member loop: {loop * 1000:.1f}ms, permissions_in_bulk: {bulk * 1000:.1f}ms for {members_count} members")
+    print(
+        f"{loop / bulk:.1f}x faster, {loop / members_count * 1e9:.0f}ns -> {bulk / members_count * 1e9:.0f}ns per member"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("members", type=int, nargs="?", default=50_000, help="Number of members to evaluate.")
+    main(parser.parse_args().members)
@@ -18,22 +18,42 @@
 from lightbulb import app
 from lightbulb import checks
 from lightbulb import commands
+from lightbulb import concurrency
 from lightbulb import context
-from lightbulb import converters
 from lightbulb import cooldowns
 from lightbulb import decorators
 from lightbulb import errors
 from lightbulb import events
 from lightbulb import help_command
+from lightbulb import internal
+from lightbulb import metrics
 from lightbulb import plugins
 from lightbulb import utils
 from lightbulb.app import *
 from lightbulb.checks import *
+from lightbulb.concurrency import *
 from lightbulb.cooldowns import *
 from lightbulb.decorators import *
 from lightbulb.errors import *
 from lightbulb.events import *
 from lightbulb.help_command import *
+from lightbulb.metrics import *
 from lightbulb.plugins import *
 
 __version__ = "2.0.1"
+
+# Converters are only needed once a prefix command is parsed, and cooldown backends only by bots which
+# configure one, so are imported on first access. The exported names must match the __all__ of each
+# module, which is checked by the test suite.
+_EXPORTS = {
+    "converters": (),
+    "cooldown_backends": (
+        "CooldownBackend",
+        "BatchingCooldownBackend",
+        "SQLiteCooldownBackend",
+        "RedisClient",
+        "RedisCooldownBackend",
+    ),
+}
+
+__getattr__, __dir__ = internal.lazy_exports(__name__, _EXPORTS)
@@ -17,16 +17,20 @@
 # along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-__all__ = ["BotApp", "when_mentioned_or"]
+__all__ = ["BotApp", "ExtensionTiming", "PrefixCacheInfo", "when_mentioned_or"]
 
 import asyncio
+import collections
+import concurrent.futures
 import functools
 import importlib
 import inspect
 import logging
+import os
 import pathlib
 import re
 import sys
+import time
 import typing as t
 
 import hikari
@@ -36,21 +40,25 @@ from multidict import CIMultiDict
 import lightbulb
 from lightbulb import checks
 from lightbulb import commands
+from lightbulb import concurrency
 from lightbulb import context as context_
+from lightbulb import cooldowns
 from lightbulb import decorators
 from lightbulb import errors
 from lightbulb import events
 from lightbulb import help_command as help_command_
 from lightbulb import internal
+from lightbulb import metrics as metrics_
 from lightbulb import plugins as plugins_
-from lightbulb.utils import data_store
-from lightbulb.utils import parser
+from lightbulb import utils
 
 _LOGGER = logging.getLogger("lightbulb.app")
 _APPLICATION_CMD_ERROR_REGEX: re.Pattern[str] = re.compile(
     r"https?://discord.com/api/v\d+/applications/\d+/guilds/(\d+)/commands"
 )
 
+_MAX_CACHED_PREFIX_MATCHERS: t.Final[int] = 256
+
 _PrefixT = t.Union[
     t.Sequence[str],
     t.Callable[["BotApp", hikari.Message], t.Union[t.Sequence[str], t.Coroutine[t.Any, t.Any, t.Sequence[str]]]],
@@ -137,6 +145,102 @@ def when_mentioned_or(
     return get_prefixes
 
 
+def _timed_import(name: str) -> t.Optional[float]:
+    # Import errors are deliberately swallowed here, they are raised again (in order) when the
+    # extension is loaded on the calling thread
+    start = time.perf_counter()
+    try:
+        importlib.import_module(name)
+    except Exception:
+        return None
+    return time.perf_counter() - start
+
+
+class _PrefixMatcher:
+    """
+    Precomputed matcher for a fixed set of prefixes. Prefixes are bucketed by their first character
+    so that content which cannot start with any of the prefixes is rejected with a single dictionary
+    lookup, and candidate prefixes are only ever compared longest-first within a single bucket.
+    """
+
+    __slots__ = ("prefixes", "_table", "_fallback")
+
+    def __init__(self, prefixes: t.Tuple[str, ...]) -> None:
+        self.prefixes = prefixes
+        table: t.Dict[str, t.List[str]] = {}
+        for prefix in sorted(set(prefixes), key=len, reverse=True):
+            if prefix:
+                table.setdefault(prefix[0], []).append(prefix)
+        self._table: t.Dict[str, t.Tuple[str, ...]] = {k: tuple(v) for k, v in table.items()}
+        # An empty prefix matches any content, but only if no other prefix does
+        self._fallback: t.Optional[str] = "" if "" in prefixes else None
+
+    def match(self, content: str) -> t.Optional[str]:
+        for prefix in self._table.get(content[:1], ()):
+            if content.startswith(prefix):
+                return prefix
+        return self._fallback
+
+
+class PrefixCacheInfo(t.NamedTuple):
+    """Statistics for the prefix cache of a :obj:`~BotApp`."""
+
+    hits: int
+    """Number of prefix lookups that were served from the cache."""
+    misses: int
+    """Number of prefix lookups that required a call to the bot's ``get_prefix`` function."""
+    max_size: int
+    """Maximum number of entries that the cache can hold."""
+    size: int
+    """Number of entries currently held in the cache."""
+
+
+class ExtensionTiming(t.NamedTuple):
+    """Time taken to load a single extension. See :obj:`~BotApp.extension_timings`."""
+
+    import_time: float
+    """Time taken to import the extension's module, in seconds."""
+    load_time: float
+    """Time taken to run the extension's ``load`` function, in seconds."""
+    lazy: bool
+    """Whether the extension was loaded lazily, on first invocation of one of its commands."""
+
+
+class _PrefixCache:
+    __slots__ = ("ttl", "max_size", "hits", "misses", "_entries")
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: collections.OrderedDict[int, t.Tuple[float, t.Tuple[str, ...]]] = collections.OrderedDict()
+
+    def get(self, key: int) -> t.Optional[t.Tuple[str, ...]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.perf_counter():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: int, prefixes: t.Tuple[str, ...]) -> None:
+        self._entries[key] = (time.perf_counter() + self.ttl, prefixes)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: t.Optional[int] = None) -> None:
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def info(self) -> PrefixCacheInfo:
+        return PrefixCacheInfo(self.hits, self.misses, self.max_size, len(self._entries))
+
+
 # str is by definition a sequence of str so these type hints are correct
 def _default_get_prefix(_: BotApp, __: hikari.Message, *, prefixes: t.Sequence[str]) -> t.Sequence[str]:
     return prefixes
@@ -167,6 +271,40 @@ class BotApp(hikari.GatewayBot):
             find an implementation for when the bot starts. Defaults to ``True``.
         case_insensitive_prefix_commands (:obj:`bool`): Whether or not prefix command names should be case-insensitive.
             Defaults to ``False``.
+        prefix_cache_ttl (Optional[:obj:`float`]): Number of seconds that prefixes returned by a ``get_prefix``
+            function should be cached for, per guild (or per channel in DMs). Defaults to ``None`` - prefixes
+            will not be cached. This has no effect if the prefixes are not provided by a function.
+        prefix_cache_max_size (:obj:`int`): Maximum number of guilds and DM channels to cache prefixes for. The
+            least recently used entries will be evicted once this limit is reached. Defaults to ``10000``.
+        max_concurrency (Optional[:obj:`~.concurrency.MaxConcurrencyManager`]): Concurrency limit applied to the
+            invocations of every command registered to the bot, in addition to any per-command limits. Defaults
+            to ``None`` - no global limit.
+        concurrent_checks (:obj:`bool`): Whether a command's asynchronous checks should be evaluated concurrently
+            instead of one after another. Defaults to ``False``.
+        fail_fast_checks (:obj:`bool`): Whether check evaluation should stop as soon as one check fails, cancelling
+            any checks that are still running. Only the first failure is then reported. Defaults to ``False``.
+        metrics (Optional[:obj:`~.metrics.MetricsCollector`]): Collector to record command invocation metrics
+            into. Defaults to ``None`` - no metrics will be recorded.
+        metrics_port (Optional[:obj:`int`]): Port to serve the recorded metrics on in the Prometheus text format.
+            If no ``metrics`` collector was passed then one will be created. Defaults to ``None`` - metrics
+            will not be served.
+        metrics_host (:obj:`str`): Host to serve the recorded metrics on. Only used if ``metrics_port``
+            is set. Defaults to ``127.0.0.1``.
+        cache_permissions (:obj:`bool`): Whether the permissions calculated by the built-in permission checks should
+            be cached in :obj:`~BotApp.permission_cache`. Cached permissions are cleared when a guild's roles or a
+            channel's permission overwrites change. This uses additional memory for each guild and channel that
+            permissions are checked in. Defaults to ``False``.
+        index_names (:obj:`bool`): Whether to maintain a :obj:`~.utils.search.NameIndex` of the names of cached
+            members, users, roles and channels, available as :obj:`~BotApp.name_index`. This allows the built-in
+            converters to resolve names without searching the entire cache, at the cost of additional memory.
+            Defaults to ``False``.
+        fuzzy_name_matching (:obj:`bool`): Whether the built-in member, role and channel converters should
+            resolve names case-insensitively and by prefix if no name matches exactly. Raises
+            :obj:`~.errors.AmbiguousArgument` if multiple objects match equally well. Implies ``index_names``.
+            Defaults to ``False``.
+        cooldown_snapshot_path (Optional[Union[:obj:`str`, :obj:`os.PathLike`]]): Path to save command cooldowns
+            to when the bot is stopping, and restore them from when the bot is starting, so that cooldowns
+            persist across restarts. Defaults to ``None`` - cooldowns will be reset when the bot restarts.
         **kwargs (Any): Additional keyword arguments passed to the constructor of the :obj:`~hikari.impl.bot.GatewayBot`
             class.
     """
@@ -183,12 +321,27 @@ class BotApp(hikari.GatewayBot):
         "_user_commands",
         "_plugins",
         "_checks",
+        "_checks_version",
         "extensions",
         "_current_extension",
         "default_enabled_guilds",
         "_help_command",
         "_delete_unbound_commands",
         "_case_insensitive_prefix_commands",
+        "_prefix_matchers",
+        "_prefix_cache",
+        "_prefix_command_index",
+        "_max_concurrency",
+        "_concurrent_checks",
+        "_fail_fast_checks",
+        "_metrics",
+        "_metrics_exporter",
+        "_cooldown_snapshot_path",
+        "_permission_cache",
+        "_name_index",
+        "_lazy_extensions",
+        "_extension_timings",
+        "_cooldown_sweeper",
     )
 
     def __init__(
@@ -202,21 +355,52 @@ class BotApp(hikari.GatewayBot):
         help_slash_command: bool = False,
         delete_unbound_commands: bool = True,
         case_insensitive_prefix_commands: bool = False,
+        prefix_cache_ttl: t.Optional[float] = None,
+        prefix_cache_max_size: int = 10_000,
+        max_concurrency: t.Optional[concurrency.MaxConcurrencyManager] = None,
+        concurrent_checks: bool = False,
+        fail_fast_checks: bool = False,
+        metrics: t.Optional[metrics_.MetricsCollector] = None,
+        metrics_port: t.Optional[int] = None,
+        metrics_host: str = "127.0.0.1",
+        cache_permissions: bool = False,
+        index_names: bool = False,
+        fuzzy_name_matching: bool = False,
+        cooldown_snapshot_path: t.Optional[t.Union[str, os.PathLike[str]]] = None,
         **kwargs: t.Any,
     ) -> None:
         super().__init__(token, **kwargs)
+        self._prefix_matchers: t.Dict[t.Tuple[str, ...], _PrefixMatcher] = {}
+        self._prefix_cache: t.Optional[_PrefixCache] = None
         # The prefix command handler expects an iterable to be returned from the get_prefix function
         # so we have to wrap a single string prefix in a list here.
         if prefix is not None:
             prefix = [prefix] if isinstance(prefix, str) else prefix
             if isinstance(prefix, t.Sequence):
                 # Create the default get prefix from the passed-in prefixes if a get_prefix function
-                # was not provided
-                prefix = functools.partial(_default_get_prefix, prefixes=prefix)
+                # was not provided. The prefixes are frozen so that the same compiled matcher is
+                # reused for every message.
+                prefix = functools.partial(_default_get_prefix, prefixes=tuple(prefix))
+            elif prefix_cache_ttl is not None:
+                self._prefix_cache = _PrefixCache(prefix_cache_ttl, prefix_cache_max_size)
             self.get_prefix: t.Callable[
                 [BotApp, hikari.Message], t.Union[t.Sequence[str], t.Coroutine[t.Any, t.Any, t.Sequence[str]]]
             ] = prefix
 
+        self._max_concurrency = max_concurrency
+        self._concurrent_checks = concurrent_checks
+        self._fail_fast_checks = fail_fast_checks
+        if metrics is None and metrics_port is not None:
+            metrics = metrics_.MetricsCollector()
+        self._metrics = metrics
+        self._metrics_exporter: t.Optional[metrics_.PrometheusExporter] = None
+        if metrics is not None and metrics_port is not None:
+            self._metrics_exporter = metrics_.PrometheusExporter(metrics, metrics_port, metrics_host)
+        self._cooldown_snapshot_path = cooldown_snapshot_path
+        self._permission_cache = utils.permissions.PermissionCache() if cache_permissions else None
+        self._name_index = (
+            utils.search.NameIndex(prefix_matching=fuzzy_name_matching) if index_names or fuzzy_name_matching else None
+        )
         self._delete_unbound_commands = delete_unbound_commands
         self._case_insensitive_prefix_commands = case_insensitive_prefix_commands
 
@@ -232,15 +416,25 @@ class BotApp(hikari.GatewayBot):
         self.application: t.Optional[hikari.Application] = None
         """The :obj:`~hikari.applications.Application` for the bot account. This will always be ``None`` before the bot has logged in."""
 
-        self.d = data_store.DataStore()
+        self.d = utils.data_store.DataStore()
         """A :obj:`~.utils.data_store.DataStore` instance enabling storage of custom data without subclassing."""
 
         self.extensions: t.List[str] = []
         """A list of the currently loaded extensions."""
         self._current_extension: t.Optional[_ExtensionT] = None
+        self._extension_timings: t.Dict[str, ExtensionTiming] = {}
+        self._cooldown_sweeper: t.Optional[asyncio.Task[None]] = None
 
         self._prefix_commands: t.MutableMapping[str, commands.prefix.PrefixCommand] = (
-            {} if not case_insensitive_prefix_commands else CIMultiDict()  # type: ignore
+            {} if not case_insensitive_prefix_commands else CIMultiDict()
+        )
+        # Mapping of every qualified name and alias path (e.g. "config prefix set") to the prefix command
+        self._prefix_command_index: t.MutableMapping[str, commands.prefix.PrefixCommand] = (
+            {} if not case_insensitive_prefix_commands else CIMultiDict()
+        )
+        # Mapping of prefix command name to the extension that should be loaded when it is first invoked
+        self._lazy_extensions: t.MutableMapping[str, str] = (
+            {} if not case_insensitive_prefix_commands else CIMultiDict()
         )
         self._slash_commands: t.MutableMapping[str, commands.slash.SlashCommand] = {}
         self._message_commands: t.MutableMapping[str, commands.message.MessageCommand] = {}
@@ -249,6 +443,7 @@ class BotApp(hikari.GatewayBot):
         self._plugins: t.MutableMapping[str, plugins_.Plugin] = {}
 
         self._checks: t.List[checks.Check] = []
+        self._checks_version = 0
 
         self._help_command: t.Optional[help_command_.BaseHelpCommand] = None
         if help_class is not None:
@@ -273,6 +468,31 @@ class BotApp(hikari.GatewayBot):
             self.subscribe(hikari.MessageCreateEvent, self.handle_messsage_create_for_prefix_commands)
         self.subscribe(hikari.StartedEvent, self._manage_application_commands)
         self.subscribe(hikari.InteractionCreateEvent, self.handle_interaction_create_for_application_commands)
+        self.subscribe(hikari.StartedEvent, self._start_cooldown_sweeper)
+        self.subscribe(hikari.StoppingEvent, self._stop_cooldown_sweeper)
+        if self._metrics_exporter is not None:
+            self.subscribe(hikari.StartingEvent, self._start_metrics_exporter)
+            self.subscribe(hikari.StoppedEvent, self._stop_metrics_exporter)
+        if self._permission_cache is not None:
+            for guild_event in (hikari.RoleEvent, hikari.GuildUpdateEvent, hikari.GuildAvailableEvent):
+                self.subscribe(guild_event, self._clear_guild_permissions)
+            self.subscribe(hikari.GuildLeaveEvent, self._clear_guild_permissions)
+            self.subscribe(hikari.GuildChannelUpdateEvent, self._clear_channel_permissions)
+            self.subscribe(hikari.GuildChannelDeleteEvent, self._clear_channel_permissions)
+        if self._name_index is not None:
+            for name_event in (
+                hikari.MemberEvent,
+                hikari.MemberChunkEvent,
+                hikari.RoleEvent,
+                hikari.GuildChannelEvent,
+                hikari.GuildAvailableEvent,
+                hikari.GuildJoinEvent,
+                hikari.GuildLeaveEvent,
+            ):
+                self.subscribe(name_event, self._update_name_index)
+        if self._cooldown_snapshot_path is not None:
+            self.subscribe(hikari.StartingEvent, self._load_cooldown_snapshot)
+            self.subscribe(hikari.StoppingEvent, self._save_cooldown_snapshot)
 
     @property
     def help_command(self) -> t.Optional[help_command_.BaseHelpCommand]:
@@ -283,6 +503,74 @@ class BotApp(hikari.GatewayBot):
     def help_command(self, val: help_command_.BaseHelpCommand) -> None:
         self._help_command = val
 
+    @property
+    def metrics(self) -> t.Optional[metrics_.MetricsCollector]:
+        """The collector that command invocation metrics are recorded into, or ``None`` if disabled."""
+        return self._metrics
+
+    @property
+    def metrics_exporter(self) -> t.Optional[metrics_.PrometheusExporter]:
+        """The server exporting the recorded metrics, or ``None`` if ``metrics_port`` was not set."""
+        return self._metrics_exporter
+
+    async def _start_metrics_exporter(self, _: hikari.StartingEvent) -> None:
+        assert self._metrics_exporter is not None
+        await self._metrics_exporter.start()
+
+    async def _stop_metrics_exporter(self, _: hikari.StoppedEvent) -> None:
+        assert self._metrics_exporter is not None
+        await self._metrics_exporter.close()
+
+    async def _start_cooldown_sweeper(self, _: hikari.StartedEvent) -> None:
+        # Expired cooldowns are otherwise only removed when a cooldown is added, so would never be freed
+        # while the bot is idle
+        self._cooldown_sweeper = asyncio.create_task(cooldowns._SWEEPER.sweep_periodically(cooldowns._SWEEP_INTERVAL))
+
+    async def _stop_cooldown_sweeper(self, _: hikari.StoppingEvent) -> None:
+        if self._cooldown_sweeper is not None:
+            self._cooldown_sweeper.cancel()
+            self._cooldown_sweeper = None
+
+    @property
+    def permission_cache(self) -> t.Optional[utils.permissions.PermissionCache]:
+        """The cache of calculated permissions used by the built-in checks, or ``None`` if disabled."""
+        return self._permission_cache
+
+    async def _clear_guild_permissions(
+        self,
+        event: t.Union[hikari.RoleEvent, hikari.GuildUpdateEvent, hikari.GuildAvailableEvent, hikari.GuildLeaveEvent],
+    ) -> None:
+        assert self._permission_cache is not None
+        self._permission_cache.clear_guild(event.guild_id)
+
+    async def _clear_channel_permissions(
+        self, event: t.Union[hikari.GuildChannelUpdateEvent, hikari.GuildChannelDeleteEvent]
+    ) -> None:
+        assert self._permission_cache is not None
+        self._permission_cache.clear_channel(event.guild_id, event.channel_id)
+
+    @property
+    def name_index(self) -> t.Optional[utils.search.NameIndex]:
+        """The index of cached names used by the built-in converters, or ``None`` if disabled."""
+        return self._name_index
+
+    async def _update_name_index(self, event: hikari.Event) -> None:
+        assert self._name_index is not None
+        self._name_index.update_from_event(event)
+
+    def metrics_snapshot(self) -> t.Optional[metrics_.MetricsSnapshot]:
+        """
+        Get a copy of the command invocation metrics recorded so far, suitable for exporting
+        to an external metrics system.
+
+        Returns:
+            Optional[:obj:`~.metrics.MetricsSnapshot`]: Copy of the recorded metrics, or ``None`` if metrics
+                are not enabled.
+        """
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot()
+
     @property
     def prefix_commands(self) -> t.MutableMapping[str, commands.prefix.PrefixCommand]:
         """Mapping of command name to command object containing all prefix commands registered to the bot."""
@@ -308,6 +596,28 @@ class BotApp(hikari.GatewayBot):
         """Mapping of plugin name to plugin object containing all plugins registered to the bot."""
         return self._plugins
 
+    def has_listeners(self, event_type: t.Type[hikari.Event]) -> bool:
+        """
+        Whether or not any listeners, :obj:`~hikari.impl.bot.GatewayBot.wait_for` waiters or
+        :obj:`~hikari.impl.bot.GatewayBot.stream` streams would receive an event of the given type if it were
+        dispatched. This is used to skip creating and dispatching lightbulb's events when nothing would
+        receive them.
+
+        Args:
+            event_type (Type[:obj:`~hikari.events.base_events.Event`]): The event type to check.
+
+        Returns:
+            :obj:`bool`: Whether or not the event type has listeners. This is always ``True`` if the bot's
+            event manager does not expose its subscriptions.
+        """
+        # Mirrors the check the event manager makes when dispatching. The subscriptions are read on every
+        # call rather than cached, as streams and waiters are added directly to the event manager.
+        listeners = getattr(self.event_manager, "_listeners", None)
+        waiters = getattr(self.event_manager, "_waiters", None)
+        if not isinstance(listeners, dict) or not isinstance(waiters, dict):
+            return True
+        return any(cls in listeners or cls in waiters for cls in event_type.__mro__)
+
     def _add_command_to_correct_attr(self, command: commands.base.Command) -> None:
         if isinstance(command, commands.prefix.PrefixCommand):
             for item in [command.name, *command.aliases]:
@@ -317,6 +627,7 @@ class BotApp(hikari.GatewayBot):
                     )
             for item in [command.name, *command.aliases]:
                 self._prefix_commands[item] = command
+            self._index_prefix_command(command)
         elif isinstance(command, commands.slash.SlashCommand):
             if command.name in self._slash_commands:
                 raise errors.CommandAlreadyExists(f"A slash command with name {command.name!r} is already registered.")
@@ -332,6 +643,146 @@ class BotApp(hikari.GatewayBot):
                 raise errors.CommandAlreadyExists(f"A user command with name {command.name!r} is already registered.")
             self._user_commands[command.name] = command
 
+    def _iter_cooldown_managers(self) -> t.Iterator[t.Tuple[commands.base.Command, cooldowns.CooldownManager]]:
+        # Commands are stored under each of their aliases, and commands created from the same command-like
+        # object share a cooldown manager, so both are deduplicated
+        seen: t.Set[int] = set()
+        stack: t.List[commands.base.Command] = [
+            *self._prefix_commands.values(),
+            *self._slash_commands.values(),
+            *self._message_commands.values(),
+            *self._user_commands.values(),
+        ]
+        while stack:
+            command = stack.pop()
+            if id(command) in seen:
+                continue
+            seen.add(id(command))
+            if isinstance(command, (commands.prefix.PrefixGroupMixin, commands.slash.SlashGroupMixin)):
+                stack.extend(command._subcommands.values())
+            if (manager := command.cooldown_manager) is not None and id(manager) not in seen:
+                seen.add(id(manager))
+                yield command, manager
+
+    def iter_active_cooldowns(self) -> t.Iterator[t.Tuple[commands.base.Command, t.Hashable, cooldowns.Bucket]]:
+        """
+        Lazily iterate over the cooldowns that are currently active for every command registered to the bot.
+        Cooldowns stored in a :obj:`~.cooldown_backends.CooldownBackend` are not included. Cooldowns can be
+        added, reset or expire while the iterator is in use - see :obj:`~.cooldowns.CooldownManager.iter_active`.
+
+        Returns:
+            Iterator[Tuple[:obj:`~.commands.base.Command`, Hashable, :obj:`~.cooldowns.Bucket`]]: Iterator of
+                command, cooldown hash and bucket for each active cooldown.
+        """
+        for command, manager in self._iter_cooldown_managers():
+            for cooldown_hash, bucket in manager.iter_active():
+                yield command, cooldown_hash, bucket
+
+    def active_cooldown_count(self) -> int:
+        """
+        Get the number of cooldowns that are currently active across every command registered to the bot.
+
+        Returns:
+            :obj:`int`: Number of active cooldowns.
+        """
+        return sum(manager.active_count() for _, manager in self._iter_cooldown_managers())
+
+    def reset_cooldowns(self, predicate: t.Optional[t.Callable[[t.Hashable, cooldowns.Bucket], bool]] = None) -> int:
+        """
+        Reset cooldowns across every command registered to the bot, for example to clear cooldowns
+        after an incident.
+
+        Args:
+            predicate (Optional[Callable[[Hashable, :obj:`~.cooldowns.Bucket`], :obj:`bool`]]): Function called
+                with the hash and bucket of each stored cooldown, returning whether to reset it. Defaults to
+                ``None`` - every cooldown is reset.
+
+        Returns:
+            :obj:`int`: Number of cooldowns reset.
+        """
+        if predicate is None:
+            return sum(manager.reset_all() for _, manager in self._iter_cooldown_managers())
+        return sum(manager.reset_where(predicate) for _, manager in self._iter_cooldown_managers())
+
+    def save_cooldowns(self, path: t.Union[str, os.PathLike[str]]) -> int:
+        """
+        Save the cooldowns of every command registered to the bot to a file. Cooldowns are saved under the
+        qualified name of their command. See :obj:`~.cooldowns.save_cooldown_snapshot` for which cooldowns can
+        be saved.
+
+        Args:
+            path (Union[:obj:`str`, :obj:`os.PathLike`]): Path to the file to save cooldowns to.
+
+        Returns:
+            :obj:`int`: Number of cooldowns saved.
+        """
+        managers = {command.qualname: manager for command, manager in self._iter_cooldown_managers()}
+        return cooldowns.save_cooldown_snapshot(managers, path)
+
+    def load_cooldowns(self, path: t.Union[str, os.PathLike[str]]) -> int:
+        """
+        Restore cooldowns saved using :obj:`~BotApp.save_cooldowns` into the commands registered to the bot.
+        Cooldowns for commands that are not registered when this is called are dropped.
+
+        Args:
+            path (Union[:obj:`str`, :obj:`os.PathLike`]): Path to the file to restore cooldowns from.
+
+        Returns:
+            :obj:`int`: Number of cooldowns restored.
+
+        Raises:
+            :obj:`ValueError`: If the file is not a valid cooldown snapshot.
+        """
+        managers = {command.qualname: manager for command, manager in self._iter_cooldown_managers()}
+        return cooldowns.load_cooldown_snapshot(managers, path)
+
+    async def _load_cooldown_snapshot(self, _: hikari.StartingEvent) -> None:
+        assert self._cooldown_snapshot_path is not None
+        if not os.path.exists(self._cooldown_snapshot_path):
+            return
+        try:
+            restored = self.load_cooldowns(self._cooldown_snapshot_path)
+        except (OSError, ValueError):
+            _LOGGER.warning("Failed to restore cooldowns from %r", self._cooldown_snapshot_path, exc_info=True)
+        else:
+            _LOGGER.info("Restored %s cooldowns from %r", restored, self._cooldown_snapshot_path)
+
+    async def _save_cooldown_snapshot(self, _: hikari.StoppingEvent) -> None:
+        assert self._cooldown_snapshot_path is not None
+        try:
+            saved = self.save_cooldowns(self._cooldown_snapshot_path)
+        except OSError:
+            _LOGGER.warning("Failed to save cooldowns to %r", self._cooldown_snapshot_path, exc_info=True)
+        else:
+            _LOGGER.info("Saved %s cooldowns to %r", saved, self._cooldown_snapshot_path)
+
+    def _index_prefix_command(self, command: commands.prefix.PrefixCommand, path: str = "") -> None:
+        for name in [command.name, *command.aliases]:
+            self._prefix_command_index[path + name] = command
+            if isinstance(command, commands.prefix.PrefixGroupMixin):
+                # Subcommands are stored under their name and each of their aliases so we dedupe them here
+                for subcommand in {id(c): c for c in command._subcommands.values()}.values():
+                    self._index_prefix_command(subcommand, f"{path}{name} ")
+
+    def _unindex_prefix_command(self, command: commands.prefix.PrefixCommand, path: str = "") -> None:
+        for name in [command.name, *command.aliases]:
+            # The path may have since been taken by another command which shouldn't be removed
+            if self._prefix_command_index.get(path + name) is command:
+                del self._prefix_command_index[path + name]
+            if isinstance(command, commands.prefix.PrefixGroupMixin):
+                for subcommand in {id(c): c for c in command._subcommands.values()}.values():
+                    self._unindex_prefix_command(subcommand, f"{path}{name} ")
+
+    def _prefix_command_paths(self, command: commands.prefix.PrefixCommand) -> t.List[str]:
+        # Paths the command's names are indexed under - empty if it is not part of a command registered to the bot
+        if command.parent is None:
+            return [""] if self._prefix_commands.get(command.name) is command else []
+        parent = command.parent
+        assert isinstance(parent, commands.prefix.PrefixCommand)
+        return [
+            f"{path}{name} " for path in self._prefix_command_paths(parent) for name in [parent.name, *parent.aliases]
+        ]
+
     def _get_application_command(
         self, interaction: hikari.CommandInteraction
     ) -> t.Optional[commands.base.ApplicationCommand]:
@@ -389,15 +840,18 @@ class BotApp(hikari.GatewayBot):
             for extension in extensions:
                 self.load_extensions(extension)
             return
-        extension = extensions[0]
+        self._load_extension(extensions[0])
 
+    def _load_extension(self, extension: str, import_time: t.Optional[float] = None, lazy: bool = False) -> None:
         if extension in self.extensions:
             raise errors.ExtensionAlreadyLoaded(f"Extension {extension!r} is already loaded.")
 
+        start = time.perf_counter()
         try:
             module = importlib.import_module(extension)
         except ModuleNotFoundError:
             raise errors.ExtensionNotFound(f"No extension by the name {extension!r} was found") from None
+        loaded = time.perf_counter()
 
         ext = t.cast(_ExtensionT, module)
         self._current_extension = ext
@@ -407,9 +861,86 @@ class BotApp(hikari.GatewayBot):
         else:
             ext.load(self)
             self.extensions.append(extension)
+            self._discard_lazy_extension(extension)
+            self._extension_timings[extension] = ExtensionTiming(
+                (loaded - start) if import_time is None else import_time, time.perf_counter() - loaded, lazy
+            )
             _LOGGER.info("Extension loaded %r", extension)
         self._current_extension = None
 
+    def load_extension_lazily(self, extension: str, *command_names: str) -> None:
+        """
+        Defer loading an extension until one of the given prefix commands is first invoked, or help is requested
+        for one of them through the help command. The extension's module is not imported until then, so the
+        names of the commands it provides must be declared here. If the extension is loaded explicitly before
+        then, the declared names are discarded.
+
+        The module is imported in a thread so that the event loop is not blocked. If the extension fails to
+        load, the error is logged and the declared names are discarded, so it is not retried.
+
+        Lazy loading is only supported for prefix commands. Application commands must be registered with
+        Discord when the bot starts, so extensions containing them should be loaded normally.
+
+        Args:
+            extension (:obj:`str`): The name of the extension to load lazily.
+            *command_names (:obj:`str`): Names and aliases of the prefix commands that the extension provides.
+
+        Returns:
+            ``None``
+
+        Raises:
+            :obj:`~.errors.ExtensionAlreadyLoaded`: If the extension has already been loaded.
+        """
+        if extension in self.extensions:
+            raise errors.ExtensionAlreadyLoaded(f"Extension {extension!r} is already loaded.")
+
+        for name in command_names:
+            self._lazy_extensions[name] = extension
+
+    def _discard_lazy_extension(self, extension: str) -> None:
+        if not self._lazy_extensions:
+            return
+        for name in [name for name, ext in self._lazy_extensions.items() if ext == extension]:
+            self._lazy_extensions.pop(name, None)
+
+    async def _maybe_load_lazy_extension(self, command_name: str) -> bool:
+        if (extension := self._lazy_extensions.get(command_name)) is None:
+            return False
+        # The module is imported off the event loop so that events from every shard keep being handled.
+        # Only the extension's load function then runs on the event loop.
+        start = time.perf_counter()
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, importlib.import_module, extension)
+        except Exception:
+            self._lazy_extension_failed(extension)
+            return False
+        if self._lazy_extensions.get(command_name) != extension:
+            # Loaded, or failed to load, by another invocation while the module was being imported
+            return extension in self.extensions
+        return self._load_lazy_extension(extension, time.perf_counter() - start)
+
+    def _load_lazy_extension(self, extension: str, import_time: float) -> bool:
+        try:
+            self._load_extension(extension, import_time, lazy=True)
+        except Exception:
+            self._current_extension = None
+            self._lazy_extension_failed(extension)
+            return False
+        return True
+
+    def _lazy_extension_failed(self, extension: str) -> None:
+        # The extension's commands are forgotten so that the failed load is not retried on every invocation
+        self._discard_lazy_extension(extension)
+        _LOGGER.warning("Failed to lazily load extension %r", extension, exc_info=True)
+
+    @property
+    def extension_timings(self) -> t.Mapping[str, ExtensionTiming]:
+        """
+        Mapping of extension name to the time taken to import and load it, for every extension
+        currently loaded. Useful for finding the extensions that dominate startup time.
+        """
+        return {name: timing for name, timing in self._extension_timings.items() if name in self.extensions}
+
     def unload_extensions(self, *extensions: str) -> None:
         """
         Unload external extension(s) from the bot. This method relies on a function, ``unload``
@@ -484,7 +1015,12 @@ class BotApp(hikari.GatewayBot):
             del old
 
     def load_extensions_from(
-        self, *paths: t.Union[str, pathlib.Path], recursive: bool = False, must_exist: bool = False
+        self,
+        *paths: t.Union[str, pathlib.Path],
+        recursive: bool = False,
+        must_exist: bool = False,
+        parallel: bool = False,
+        max_workers: t.Optional[int] = None,
     ) -> None:
         """
         Load all external extensions from the given directories. Files that begin with an underscore ( _ ) are ignored.
@@ -499,6 +1035,11 @@ class BotApp(hikari.GatewayBot):
             must_exist (:obj:`bool`): Whether the directory must exist before extensions can be loaded. If this is
                 False and the directory does not exist, no extensions will be loaded. If this is True, a
                 :obj:`FileNotFoundError` is thrown if the directory does not exist. Defaults to False.
+            parallel (:obj:`bool`): Whether to import the extension modules in parallel using a thread pool before
+                loading them. The ``load`` functions are still called one at a time, in the same order as they would
+                be otherwise, from the calling thread. Defaults to False.
+            max_workers (Optional[:obj:`int`]): Maximum number of threads to use when ``parallel`` is True. Defaults
+                to ``None`` - the :obj:`concurrent.futures.ThreadPoolExecutor` default.
 
         Returns:
             ``None``
@@ -512,7 +1053,9 @@ class BotApp(hikari.GatewayBot):
         """
         if len(paths) > 1 or not paths:
             for path_ in paths:
-                self.load_extensions_from(path_, recursive=recursive, must_exist=must_exist)
+                self.load_extensions_from(
+                    path_, recursive=recursive, must_exist=must_exist, parallel=parallel, max_workers=max_workers
+                )
             return
         path = paths[0]
 
@@ -525,8 +1068,18 @@ class BotApp(hikari.GatewayBot):
 
             return
 
-        for ext in path.glob(("**/" if recursive else "") + "[!_]*.py"):
-            self.load_extensions(".".join([*ext.parts[:-1], ext.stem]))
+        names = [".".join([*ext.parts[:-1], ext.stem]) for ext in path.glob(("**/" if recursive else "") + "[!_]*.py")]
+        if not parallel:
+            for name in names:
+                self.load_extensions(name)
+            return
+
+        to_import = [name for name in names if name not in self.extensions]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            import_times = dict(zip(to_import, pool.map(_timed_import, to_import)))
+
+        for name in names:
+            self._load_extension(name, import_times.get(name))
 
     async def fetch_owner_ids(self) -> t.Sequence[hikari.SnowflakeishOr[int]]:
         """
@@ -574,10 +1127,10 @@ class BotApp(hikari.GatewayBot):
                 handled = bool(await listener(event))
 
         if not handled:
-            if self.get_listeners(type(event), polymorphic=True):
+            if self.has_listeners(type(event)):
                 await self.dispatch(event)
                 handled = True
-            elif self.get_listeners(events.CommandErrorEvent, polymorphic=True):
+            elif self.has_listeners(events.CommandErrorEvent):
                 await self.dispatch(event)
                 handled = True
 
@@ -602,6 +1155,7 @@ class BotApp(hikari.GatewayBot):
             if not isinstance(check, checks.Check):
                 check = checks.Check(check)
             self._checks.append(check)
+            self.invalidate_check_chains()
             return check
 
         def decorate(
@@ -609,10 +1163,23 @@ class BotApp(hikari.GatewayBot):
         ) -> checks.Check:
             new_check = checks.Check(check_func)
             self._checks.append(new_check)
+            self.invalidate_check_chains()
             return new_check
 
         return decorate
 
+    def invalidate_check_chains(self) -> None:
+        """
+        Discard the checks collected for each command, so that they are collected again the next time each
+        command is invoked. This is called automatically when checks are added to the bot or a plugin, or a
+        plugin is added or removed, but must be called manually after modifying the checks of a command or
+        the bot's list of checks directly.
+
+        Returns:
+            ``None``
+        """
+        self._checks_version += 1
+
     def get_prefix_command(self, name: str) -> t.Optional[commands.prefix.PrefixCommand]:
         """
         Gets the prefix command with the given name, or ``None`` if no command with that name was found.
@@ -623,26 +1190,16 @@ class BotApp(hikari.GatewayBot):
         Returns:
             Optional[:obj:`~.commands.prefix.PrefixCommand`]: Prefix command object with the given name, or ``None``
                 if not found.
-        """
-        parts = name.split()
-        if len(parts) == 1:
-            return self._prefix_commands.get(name)
-
-        maybe_group = self._prefix_commands.get(parts.pop(0))
-        if not isinstance(maybe_group, commands.prefix.PrefixCommandGroup):
-            return None
-
-        this: t.Optional[
-            t.Union[
-                commands.prefix.PrefixCommandGroup, commands.prefix.PrefixSubGroup, commands.prefix.PrefixSubCommand
-            ]
-        ] = maybe_group
-        for part in parts:
-            if this is None or isinstance(this, commands.prefix.PrefixSubCommand):
-                return None
-            this = this.get_subcommand(part)
 
-        return this
+        Note:
+            Commands provided by an extension passed to :obj:`~BotApp.load_extension_lazily` are not found
+            until the extension has been loaded.
+        """
+        command = self._prefix_command_index.get(name)
+        if command is None:
+            # Retry with any irregular whitespace collapsed
+            command = self._prefix_command_index.get(" ".join(name.split()))
+        return command
 
     def get_slash_command(self, name: str) -> t.Optional[commands.slash.SlashCommand]:
         """
@@ -736,6 +1293,7 @@ class BotApp(hikari.GatewayBot):
         if isinstance(command, commands.prefix.PrefixCommand):
             for item in [command.name, *command.aliases]:
                 self._prefix_commands.pop(item, None)
+            self._unindex_prefix_command(command)
         elif isinstance(command, commands.slash.SlashCommand):
             self._slash_commands.pop(command.name, None)
         elif isinstance(command, commands.message.MessageCommand):
@@ -790,6 +1348,7 @@ class BotApp(hikari.GatewayBot):
                 self.subscribe(event, listener)
         _LOGGER.debug("Plugin registered %r", plugin.name)
         self._plugins[plugin.name] = plugin
+        self.invalidate_check_chains()
 
     def remove_plugin(self, plugin_or_name: t.Union[plugins_.Plugin, str]) -> None:
         """
@@ -822,6 +1381,7 @@ class BotApp(hikari.GatewayBot):
                 assert maybe_coro is not None
                 asyncio.create_task(maybe_coro)
 
+        self.invalidate_check_chains()
         _LOGGER.debug("Plugin removed %r", plugin.name)
 
     async def purge_application_commands(self, *guild_ids: hikari.Snowflakeish, global_commands: bool = False) -> None:
@@ -847,6 +1407,60 @@ class BotApp(hikari.GatewayBot):
             for guild_id in guild_ids:
                 await self.rest.set_application_commands(self.application, (), guild_id)
 
+    @property
+    def prefix_cache_info(self) -> t.Optional[PrefixCacheInfo]:
+        """
+        Statistics for the bot's prefix cache, or ``None`` if prefix caching is not enabled.
+        """
+        if self._prefix_cache is None:
+            return None
+        return self._prefix_cache.info()
+
+    def invalidate_prefix_cache(self, guild_id: t.Optional[hikari.Snowflakeish] = None) -> None:
+        """
+        Removes the cached prefixes for the guild with the given ID, or all cached prefixes if no ID
+        was provided. You should call this whenever the prefixes for a guild are changed. For prefixes
+        used in DMs, the ID of the DM channel should be passed instead of a guild ID.
+
+        Args:
+            guild_id (Optional[:obj:`hikari.Snowflakeish`]): ID of the guild to invalidate the cached
+                prefixes for, or ``None`` to invalidate the entire cache.
+
+        Returns:
+            ``None``
+        """
+        if self._prefix_cache is not None:
+            self._prefix_cache.invalidate(None if guild_id is None else int(guild_id))
+
+    async def _resolve_prefixes(self, message: hikari.Message) -> t.Sequence[str]:
+        cache, key = self._prefix_cache, message.guild_id or message.channel_id
+        if cache is not None and (cached := cache.get(key)) is not None:
+            return cached
+
+        prefixes = self.get_prefix(self, message)
+        if inspect.iscoroutine(prefixes):
+            assert not isinstance(prefixes, t.Sequence)
+            prefixes = await prefixes
+        prefixes = t.cast(t.Sequence[str], prefixes)
+
+        if cache is not None:
+            prefixes = (prefixes,) if isinstance(prefixes, str) else tuple(prefixes)
+            cache.put(key, prefixes)
+        return prefixes
+
+    def _get_prefix_matcher(self, prefixes: t.Union[str, t.Sequence[str]]) -> _PrefixMatcher:
+        if isinstance(prefixes, str):
+            prefixes = (prefixes,)
+        elif not isinstance(prefixes, tuple):
+            prefixes = tuple(prefixes)
+
+        matcher = self._prefix_matchers.get(prefixes)
+        if matcher is None:
+            if len(self._prefix_matchers) >= _MAX_CACHED_PREFIX_MATCHERS:
+                self._prefix_matchers.pop(next(iter(self._prefix_matchers)))
+            matcher = self._prefix_matchers[prefixes] = _PrefixMatcher(prefixes)
+        return matcher
+
     async def get_prefix_context(
         self,
         event: hikari.MessageCreateEvent,
@@ -863,44 +1477,75 @@ class BotApp(hikari.GatewayBot):
 
         Returns:
             Optional[:obj:`~.context.prefix.PrefixContext`]: Prefix context instance for the given event.
+
+        Note:
+            If the message does not invoke a registered command or alias then ``None`` will be returned
+            unless a listener is subscribed to :obj:`~.events.PrefixCommandErrorEvent` (or one of its
+            superclasses), in which case a context with no command will be returned so that
+            :obj:`~.errors.CommandNotFound` can be raised and handled.
         """
-        assert event.message.content is not None
+        metrics = self._metrics
+        if metrics is None:
+            resolved = await self._resolve_prefix_invocation(event.message)
+        else:
+            with metrics.time(None, metrics_.InvocationPhase.PREFIX_RESOLUTION):
+                resolved = await self._resolve_prefix_invocation(event.message)
 
-        prefixes = self.get_prefix(self, event.message)
-        if inspect.iscoroutine(prefixes):
-            assert not isinstance(prefixes, t.Sequence)
-            prefixes = await prefixes
-        prefixes = t.cast(t.Sequence[str], prefixes)
+        if resolved is None:
+            return None
+        invoked_prefix, invoked_with, args, command = resolved
 
-        if isinstance(prefixes, str):
-            prefixes = [prefixes]
-        prefixes = sorted(prefixes, key=len, reverse=True)
+        if metrics is None or command is None:
+            return self._new_prefix_context(cls, event, command, invoked_with, invoked_prefix, args)
+        with metrics.time(command.qualname, metrics_.InvocationPhase.CONTEXT_BUILD):
+            return self._new_prefix_context(cls, event, command, invoked_with, invoked_prefix, args)
 
-        invoked_prefix = None
-        for prefix in prefixes:
-            if event.message.content.startswith(prefix):
-                invoked_prefix = prefix
-                break
+    async def _resolve_prefix_invocation(
+        self, message: hikari.Message
+    ) -> t.Optional[t.Tuple[str, str, str, t.Optional[commands.prefix.PrefixCommand]]]:
+        assert message.content is not None
 
+        prefixes = await self._resolve_prefixes(message)
+        invoked_prefix = self._get_prefix_matcher(prefixes).match(message.content)
         if invoked_prefix is None:
             return None
 
-        new_content = event.message.content[len(invoked_prefix) :]
+        new_content = message.content[len(invoked_prefix) :]
         if not new_content or new_content.isspace():
             return None
 
         split_content = new_content.split(maxsplit=1)
-        invoked_with, args = split_content[0], "".join(split_content[1:])
-
-        if not invoked_with:
+        invoked_with = split_content[0]
+
+        # Reject messages that do not invoke a registered command or alias before creating any
+        # objects, unless something is listening for the resulting CommandNotFound error
+        command = self._prefix_commands.get(invoked_with)
+        if command is None and self._lazy_extensions and await self._maybe_load_lazy_extension(invoked_with):
+            command = self._prefix_commands.get(invoked_with)
+        if command is None and not self._command_not_found_is_handled():
             return None
 
-        command = self.get_prefix_command(invoked_with)
+        return invoked_prefix, invoked_with, "".join(split_content[1:]), command
+
+    def _new_prefix_context(
+        self,
+        cls: t.Type[context_.prefix.PrefixContext],
+        event: hikari.MessageCreateEvent,
+        command: t.Optional[commands.prefix.PrefixCommand],
+        invoked_with: str,
+        invoked_prefix: str,
+        args: str,
+    ) -> context_.prefix.PrefixContext:
         ctx = cls(self, event, command, invoked_with, invoked_prefix)
-        if ctx.command is not None:
-            ctx._parser = (ctx.command.parser or parser.Parser)(ctx, args)
+        if command is not None:
+            ctx._parser = (command.parser or utils.parser.Parser)(ctx, args)
         return ctx
 
+    def _command_not_found_is_handled(self) -> bool:
+        # An unknown command has no command or plugin error handler, so CommandNotFound
+        # can only ever be handled by a global error listener
+        return self.has_listeners(events.PrefixCommandErrorEvent)
+
     async def process_prefix_commands(self, context: context_.prefix.PrefixContext) -> None:
         """
         Invokes the appropriate command for the given context.
@@ -941,7 +1586,8 @@ class BotApp(hikari.GatewayBot):
         if context is None:
             return
 
-        if context.command is not None:
+        # Avoid creating and dispatching lifecycle events when nothing is listening for them
+        if context.command is not None and self.has_listeners(events.PrefixCommandInvocationEvent):
             await self.dispatch(events.PrefixCommandInvocationEvent(app=self, command=context.command, context=context))
 
         try:
@@ -955,19 +1601,28 @@ class BotApp(hikari.GatewayBot):
                 )
             assert isinstance(new_exc, errors.LightbulbError)
             error_event = events.PrefixCommandErrorEvent(app=self, exception=new_exc, context=context)
-            handled = await self.maybe_dispatch_error_event(
-                error_event,
-                [
-                    getattr(context.command, "error_handler", None),
-                    getattr(context.command.plugin, "_error_handler", None) if context.command is not None else None,
-                ],
-            )
+            handlers = [
+                getattr(context.command, "error_handler", None),
+                getattr(context.command.plugin, "_error_handler", None) if context.command is not None else None,
+            ]
+            if self._metrics is None:
+                handled = await self.maybe_dispatch_error_event(error_event, handlers)
+            else:
+                qualname = context.command.qualname if context.command is not None else None
+                if qualname is None:
+                    # Errors raised during command invocation are already recorded by the command
+                    self._metrics.record_error(None, new_exc)
+                with self._metrics.time(qualname, metrics_.InvocationPhase.ERROR_HANDLING):
+                    handled = await self.maybe_dispatch_error_event(error_event, handlers)
 
             if not handled:
                 raise new_exc
         else:
             assert context.command is not None
-            await self.dispatch(events.PrefixCommandCompletionEvent(app=self, command=context.command, context=context))
+            if self.has_listeners(events.PrefixCommandCompletionEvent):
+                await self.dispatch(
+                    events.PrefixCommandCompletionEvent(app=self, command=context.command, context=context)
+                )
 
     async def get_slash_context(
         self,
@@ -1048,7 +1703,10 @@ class BotApp(hikari.GatewayBot):
             return None
         # TODO - make this work for other application command types
         assert isinstance(cmd, commands.slash.SlashCommand)
-        return await self.get_slash_context(event, cmd)
+        if self._metrics is None:
+            return await self.get_slash_context(event, cmd)
+        with self._metrics.time(cmd.qualname, metrics_.InvocationPhase.CONTEXT_BUILD):
+            return await self.get_slash_context(event, cmd)
 
     async def invoke_application_command(self, context: context_.base.ApplicationContext) -> None:
         """
@@ -1062,7 +1720,8 @@ class BotApp(hikari.GatewayBot):
             ``None``
         """
         cmd_events = self._get_events_for_application_command(context.command)
-        await self.dispatch(cmd_events[0](app=self, command=context.command, context=context))
+        if self.has_listeners(cmd_events[0]):
+            await self.dispatch(cmd_events[0](app=self, command=context.command, context=context))
 
         try:
             await context.invoke()
@@ -1074,18 +1733,21 @@ class BotApp(hikari.GatewayBot):
                 )
             assert isinstance(new_exc, errors.LightbulbError)
             error_event = cmd_events[2](app=self, exception=new_exc, context=context)
-            handled = await self.maybe_dispatch_error_event(
-                error_event,
-                [
-                    getattr(context.command, "error_handler", None),
-                    getattr(context.command.plugin, "_error_handler", None),
-                ],
-            )
+            handlers = [
+                getattr(context.command, "error_handler", None),
+                getattr(context.command.plugin, "_error_handler", None),
+            ]
+            if self._metrics is None:
+                handled = await self.maybe_dispatch_error_event(error_event, handlers)
+            else:
+                with self._metrics.time(context.command.qualname, metrics_.InvocationPhase.ERROR_HANDLING):
+                    handled = await self.maybe_dispatch_error_event(error_event, handlers)
 
             if not handled:
                 raise new_exc
         else:
-            await self.dispatch(cmd_events[1](app=self, command=context.command, context=context))
+            if self.has_listeners(cmd_events[1]):
+                await self.dispatch(cmd_events[1](app=self, command=context.command, context=context))
 
     async def handle_interaction_create_for_application_commands(self, event: hikari.InteractionCreateEvent) -> None:
         """
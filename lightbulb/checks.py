@@ -42,7 +42,6 @@ import hikari
 
 from lightbulb import context as context_
 from lightbulb import errors
-from lightbulb.utils import permissions
 
 T = t.TypeVar("T")
 _CallbackT = t.Union[
@@ -132,6 +131,21 @@ class Check:
             return self.prefix_callback.func.__name__
         return self.prefix_callback.__name__
 
+    def _callback_for(self, context_type: t.Type[context_.base.Context]) -> t.Optional[_CallbackT]:
+        # The callback __call__ would use for contexts of the given type, or None if the check always passes
+        if type(self).__call__ is not Check.__call__:
+            # Subclasses may override how the callback is chosen, so must be called as-is
+            return self
+        if issubclass(context_type, context_.prefix.PrefixContext):
+            return self.prefix_callback
+        elif issubclass(context_type, context_.slash.SlashContext):
+            return self.slash_callback
+        elif issubclass(context_type, context_.message.MessageContext):
+            return self.message_callback
+        elif issubclass(context_type, context_.user.UserContext):
+            return self.user_callback
+        return None
+
     def __call__(self, context: context_.base.Context) -> t.Union[bool, t.Coroutine[t.Any, t.Any, bool]]:
         if isinstance(context, context_.prefix.PrefixContext):
             return self.prefix_callback(context)
@@ -191,7 +205,7 @@ def _human_only(context: context_.base.Context) -> bool:
 def _nsfw_channel_only(context: context_.base.Context) -> bool:
     if context.guild_id is None:
         raise errors.NSFWChannelOnly("This command can only be used in NSFW channels")
-    channel = context.get_channel()
+    channel = context.check_cache.channel
     if not isinstance(channel, hikari.GuildChannel) or not channel.is_nsfw:
         raise errors.NSFWChannelOnly("This command can only be used in NSFW channels")
     return True
@@ -207,18 +221,33 @@ def _has_roles(
     return True
 
 
+def _resolve_channel_and_guild(
+    cache: context_.base.CheckCache,
+) -> t.Tuple[t.Union[hikari.GuildChannel, hikari.Snowflake], hikari.Guild]:
+    channel, guild = cache.channel, cache.guild
+    if channel is None or guild is None:
+        raise errors.InsufficientCache("Some objects required for this check could not be resolved from the cache")
+    return channel, guild
+
+
+def _resolve_my_member(cache: context_.base.CheckCache) -> hikari.Member:
+    member = cache.my_member
+    if member is None:
+        raise errors.InsufficientCache("Some objects required for this check could not be resolved from the cache")
+    return member
+
+
 def _has_guild_permissions(context: context_.base.Context, *, perms: hikari.Permissions) -> bool:
     _guild_only(context)
 
-    channel, guild = context.get_channel(), context.get_guild()
-    if channel is None or guild is None:
-        raise errors.InsufficientCache("Some objects required for this check could not be resolved from the cache")
+    cache = context.check_cache
+    channel, guild = _resolve_channel_and_guild(cache)
 
     if guild.owner_id == context.author.id:
         return True
 
     assert context.member is not None and isinstance(channel, hikari.GuildChannel)
-    missing_perms = ~permissions.permissions_in(channel, context.member) & perms
+    missing_perms = ~cache.permissions_in(channel, context.member) & perms
     if missing_perms is not hikari.Permissions.NONE:
         raise errors.MissingRequiredPermission(
             "You are missing one or more permissions required in order to run this command", perms=missing_perms
@@ -230,7 +259,7 @@ def _has_role_permissions(context: context_.base.Context, *, perms: hikari.Permi
     _guild_only(context)
 
     assert context.member is not None
-    missing_perms = ~permissions.permissions_for(context.member) & perms
+    missing_perms = ~context.check_cache.permissions_for(context.member) & perms
     if missing_perms is not hikari.Permissions.NONE:
         raise errors.MissingRequiredPermission(
             "You are missing one or more permissions required in order to run this command", perms=missing_perms
@@ -241,12 +270,13 @@ def _has_role_permissions(context: context_.base.Context, *, perms: hikari.Permi
 def _has_channel_permissions(context: context_.base.Context, *, perms: hikari.Permissions) -> bool:
     _guild_only(context)
 
-    channel = context.get_channel()
+    cache = context.check_cache
+    channel = cache.channel
     if channel is None:
         raise errors.InsufficientCache("Some objects required for this check could not be resolved from the cache")
 
     assert context.member is not None and isinstance(channel, hikari.GuildChannel)
-    missing_perms = ~permissions.permissions_in(channel, context.member, include_guild_permissions=False) & perms
+    missing_perms = ~cache.permissions_in(channel, context.member, include_guild_permissions=False) & perms
     if missing_perms is not hikari.Permissions.NONE:
         raise errors.MissingRequiredPermission(
             "You are missing one or more permissions required in order to run this command", perms=missing_perms
@@ -257,18 +287,15 @@ def _has_channel_permissions(context: context_.base.Context, *, perms: hikari.Pe
 def _bot_has_guild_permissions(context: context_.base.Context, *, perms: hikari.Permissions) -> bool:
     _guild_only(context)
 
-    channel, guild = context.get_channel(), context.get_guild()
-    if channel is None or guild is None:
-        raise errors.InsufficientCache("Some objects required for this check could not be resolved from the cache")
-    member = guild.get_my_member()
-    if member is None:
-        raise errors.InsufficientCache("Some objects required for this check could not be resolved from the cache")
+    cache = context.check_cache
+    channel, guild = _resolve_channel_and_guild(cache)
+    member = _resolve_my_member(cache)
 
     if guild.owner_id == member.id:
         return True
 
     assert isinstance(channel, hikari.GuildChannel)
-    missing_perms = ~permissions.permissions_in(channel, member) & perms
+    missing_perms = ~cache.permissions_in(channel, member) & perms
     if missing_perms is not hikari.Permissions.NONE:
         raise errors.BotMissingRequiredPermission(
             "The bot is missing one or more permissions required in order to run this command", perms=missing_perms
@@ -279,14 +306,12 @@ def _bot_has_guild_permissions(context: context_.base.Context, *, perms: hikari.
 def _bot_has_role_permissions(context: context_.base.Context, *, perms: hikari.Permissions) -> bool:
     _guild_only(context)
 
-    guild = context.get_guild()
-    if guild is None:
-        raise errors.InsufficientCache("Some objects required for this check could not be resolved from the cache")
-    member = guild.get_my_member()
-    if member is None:
+    cache = context.check_cache
+    if cache.guild is None:
         raise errors.InsufficientCache("Some objects required for this check could not be resolved from the cache")
+    member = _resolve_my_member(cache)
 
-    missing_perms = ~permissions.permissions_for(member) & perms
+    missing_perms = ~cache.permissions_for(member) & perms
     if missing_perms is not hikari.Permissions.NONE:
         raise errors.BotMissingRequiredPermission(
             "The bot is missing one or more permissions required in order to run this command", perms=missing_perms
@@ -297,15 +322,12 @@ def _bot_has_role_permissions(context: context_.base.Context, *, perms: hikari.P
 def _bot_has_channel_permissions(context: context_.base.Context, *, perms: hikari.Permissions) -> bool:
     _guild_only(context)
 
-    channel, guild = context.get_channel(), context.get_guild()
-    if channel is None or guild is None:
-        raise errors.InsufficientCache("Some objects required for this check could not be resolved from the cache")
-    member = guild.get_my_member()
-    if member is None:
-        raise errors.InsufficientCache("Some objects required for this check could not be resolved from the cache")
+    cache = context.check_cache
+    channel, _ = _resolve_channel_and_guild(cache)
+    member = _resolve_my_member(cache)
 
     assert isinstance(channel, hikari.GuildChannel)
-    missing_perms = ~permissions.permissions_in(channel, member, include_guild_permissions=False) & perms
+    missing_perms = ~cache.permissions_in(channel, member, include_guild_permissions=False) & perms
     if missing_perms is not hikari.Permissions.NONE:
         raise errors.BotMissingRequiredPermission(
             "The bot is missing one or more permissions required in order to run this command", perms=missing_perms
@@ -20,6 +20,7 @@ from __future__ import annotations
 __all__ = ["OptionModifier", "OptionLike", "CommandLike", "Command", "ApplicationCommand", "SubCommandTrait"]
 
 import abc
+import asyncio
 import collections
 import dataclasses
 import datetime
@@ -30,10 +31,12 @@ import typing as t
 import hikari
 
 from lightbulb import errors
+from lightbulb import metrics as metrics_
 
 if t.TYPE_CHECKING:
     from lightbulb import app as app_
     from lightbulb import checks
+    from lightbulb import concurrency
     from lightbulb import context as context_
     from lightbulb import cooldowns
     from lightbulb import events
@@ -83,6 +86,25 @@ class _SubcommandListProxy(collections.UserList):  # type: ignore
         self.parent.recreate_subcommands(self.data, self.parent.app)
 
 
+_CheckT = t.Callable[["context_.base.Context"], t.Union[bool, t.Coroutine[t.Any, t.Any, bool]]]
+
+
+class _CheckChain:
+    # The checks that apply to a command for one type of context, flattened in evaluation order. Each
+    # entry holds the check, the function to call for the context type and whether that function is a
+    # coroutine function. Checks that always pass for the context type are left out.
+    __slots__ = ("exempt", "exempt_is_async", "entries")
+
+    def __init__(self, exempt: t.Optional[_CheckT], entries: t.Sequence[t.Tuple[t.Any, _CheckT, bool]]) -> None:
+        self.exempt = exempt
+        self.exempt_is_async = inspect.iscoroutinefunction(exempt)
+        self.entries = tuple(entries)
+
+
+def _never_exempt(_: context_.base.Context) -> bool:
+    return False
+
+
 def _get_choice_objects_from_choices(
     choices: t.Sequence[t.Union[str, int, float, hikari.CommandChoice]]
 ) -> t.Sequence[hikari.CommandChoice]:
@@ -179,6 +201,8 @@ class CommandLike:
     parser: t.Optional[t.Type[parser_.BaseParser]] = None
     """The argument parser to use for prefix commands."""
     cooldown_manager: t.Optional[cooldowns.CooldownManager] = None
+    max_concurrency: t.Optional[concurrency.MaxConcurrencyManager] = None
+    """The manager limiting the number of concurrent invocations of the command."""
     help_getter: t.Optional[t.Callable[[Command, context_.base.Context], str]] = None
     """The function to call to get the command's long help text."""
     auto_defer: bool = False
@@ -271,13 +295,18 @@ class Command(abc.ABC):
         "aliases",
         "parser",
         "cooldown_manager",
+        "max_concurrency",
         "auto_defer",
         "default_ephemeral",
         "check_exempt",
         "hidden",
         "inherit_checks",
+        "_check_chains",
+        "_check_chains_version",
     )
 
+    _parses_arguments: t.ClassVar[bool] = False
+
     def __init__(self, app: app_.BotApp, initialiser: CommandLike) -> None:
         self._initialiser = initialiser
         self._help_getter = initialiser.help_getter
@@ -305,16 +334,20 @@ class Command(abc.ABC):
         """The argument parser to use for prefix commands."""
         self.cooldown_manager = initialiser.cooldown_manager
         """The cooldown manager instance to use for the command."""
+        self.max_concurrency = initialiser.max_concurrency
+        """The manager limiting the number of concurrent invocations of the command."""
         self.auto_defer = initialiser.auto_defer
         """Whether or not to automatically defer the response when the command is invoked."""
         self.default_ephemeral = initialiser.ephemeral
         """Whether or not to send responses from this command as ephemeral messages by default."""
-        self.check_exempt = initialiser.check_exempt or (lambda _: False)
+        self.check_exempt = initialiser.check_exempt or _never_exempt
         """Check exempt predicate to use for the command."""
         self.hidden = initialiser.hidden
         """Whether or not the command should be hidden from the help command."""
         self.inherit_checks = initialiser.inherit_checks
         """Whether or not the command should inherit checks from the parent group."""
+        self._check_chains: t.Dict[t.Type[context_.base.Context], _CheckChain] = {}
+        self._check_chains_version = -1
 
     def __hash__(self) -> int:
         return hash(self.name)
@@ -367,38 +400,118 @@ class Command(abc.ABC):
         Invokes the command under the given context. All checks and cooldowns will be processed
         prior to invocation.
         """
+        metrics = self.app._metrics
+        if metrics is not None:
+            await self._invoke_with_metrics(context, metrics)
+            return
+
         await self.evaluate_checks(context)
         await self.evaluate_cooldowns(context)
-        await self(context)
+        await self._parse_arguments(context)
+        await self._call_with_concurrency_limits(context)
+
+    async def _invoke_with_metrics(self, context: context_.base.Context, metrics: metrics_.MetricsCollector) -> None:
+        qualname = self.qualname
+        metrics.record_invocation(qualname)
+        try:
+            with metrics.time(qualname, metrics_.InvocationPhase.CHECKS):
+                await self.evaluate_checks(context)
+            with metrics.time(qualname, metrics_.InvocationPhase.COOLDOWNS):
+                await self.evaluate_cooldowns(context)
+            if self._parses_arguments:
+                with metrics.time(qualname, metrics_.InvocationPhase.PARSING):
+                    await self._parse_arguments(context)
+            with metrics.time(qualname, metrics_.InvocationPhase.CALLBACK):
+                await self._call_with_concurrency_limits(context)
+        except Exception as ex:
+            metrics.record_error(qualname, ex)
+            raise
+
+    async def _parse_arguments(self, context: context_.base.Context) -> None:
+        pass
+
+    async def _call_with_concurrency_limits(self, context: context_.base.Context) -> None:
+        cmd_limiter, app_limiter = self.max_concurrency, self.app._max_concurrency
+        if cmd_limiter is None and app_limiter is None:
+            await self(context)
+            return
+
+        # Acquire the command's slot first so that waiting for it does not hold up a global slot
+        cmd_key = await cmd_limiter.acquire(context) if cmd_limiter is not None else None
+        try:
+            app_key = await app_limiter.acquire(context) if app_limiter is not None else None
+            try:
+                await self(context)
+            finally:
+                if app_limiter is not None:
+                    app_limiter.release(app_key)
+        finally:
+            if cmd_limiter is not None:
+                cmd_limiter.release(cmd_key)
+
+    def _compile_check_chain(self, context_type: t.Type[context_.base.Context]) -> _CheckChain:
+        parent_checks = self.parent.checks if self.inherit_checks and self.parent is not None else []
+        entries = []
+        for check in [*self.app._checks, *getattr(self.plugin, "_checks", []), *self.checks, *parent_checks]:
+            if (callback_for := getattr(check, "_callback_for", None)) is None:
+                # Check-like objects, such as those created by combining checks, are called as-is
+                entries.append((check, check, False))
+            elif (callback := callback_for(context_type)) is not None:
+                entries.append((check, callback, inspect.iscoroutinefunction(callback)))
+        exempt = self.check_exempt if self.check_exempt is not _never_exempt else None
+        return _CheckChain(exempt, entries)
+
+    def _get_check_chain(self, context: context_.base.Context) -> _CheckChain:
+        if self._check_chains_version != self.app._checks_version:
+            # The bot's or a plugin's checks have changed since the chains were compiled
+            self._check_chains.clear()
+            self._check_chains_version = self.app._checks_version
+        if (chain := self._check_chains.get(context.__class__)) is None:
+            chain = self._check_chains[context.__class__] = self._compile_check_chain(context.__class__)
+        return chain
 
     async def evaluate_checks(self, context: context_.base.Context) -> bool:
         """
         Evaluate the command's checks under the given context. This method will either return
         ``True`` if all the checks passed or it will raise :obj:`~.errors.CheckFailure`.
+
+        The checks that apply to the command are collected once per type of context and reused until
+        :obj:`~.app.BotApp.invalidate_check_chains` is called, which happens automatically when checks
+        are added to the bot or to a plugin, or a plugin is added or removed.
         """
-        exempt = self.check_exempt(context)
-        if inspect.iscoroutine(exempt):
-            assert not isinstance(exempt, bool)
-            exempt = await exempt
-        if exempt:
+        chain = self._get_check_chain(context)
+        if chain.exempt is not None:
+            exempt = chain.exempt(context)
+            if chain.exempt_is_async or inspect.iscoroutine(exempt):
+                assert not isinstance(exempt, bool)
+                exempt = await exempt
+            if exempt:
+                return True
+
+        if not chain.entries:
             return True
 
-        parent_checks = self.parent.checks if self.inherit_checks and self.parent is not None else []
-
-        failed_checks: t.List[errors.CheckFailure] = []
-        for check in [*self.app._checks, *getattr(self.plugin, "_checks", []), *self.checks, *parent_checks]:
-            try:
-                result = check(context)
-                if inspect.iscoroutine(result):
-                    assert not isinstance(result, bool)
-                    result = await result
-
-                if not result:
-                    failed_checks.append(errors.CheckFailure(f"Check {check.__name__} failed for command {self.name}"))
-            except Exception as ex:
-                error = errors.CheckFailure(str(ex))
-                error.__cause__ = ex
-                failed_checks.append(error)
+        failed_checks: t.List[errors.CheckFailure]
+        if self.app._concurrent_checks:
+            failed_checks = await self._evaluate_checks_concurrently(context, chain)
+        else:
+            failed_checks = []
+            for check, callback, is_async in chain.entries:
+                try:
+                    result = callback(context)
+                    if result is True:
+                        continue
+                    if is_async or inspect.iscoroutine(result):
+                        # Synchronous functions returning a coroutine are still awaited
+                        assert not isinstance(result, bool)
+                        result = await result
+                except Exception as ex:
+                    result = ex
+
+                if (failure := self._check_failure(check, result)) is not None:
+                    failed_checks.append(failure)
+                    if self.app._fail_fast_checks:
+                        break
 
         if len(failed_checks) > 1:
             raise errors.CheckFailure("Multiple checks failed: " + ", ".join(str(ex) for ex in failed_checks))
@@ -407,6 +520,72 @@ class Command(abc.ABC):
 
         return True
 
+    def _check_failure(self, check: checks.Check, result: t.Any) -> t.Optional[errors.CheckFailure]:
+        # Converts the result of a check, or the exception it raised, into the error reported for it
+        if isinstance(result, Exception):
+            error = errors.CheckFailure(str(result))
+            error.__cause__ = result
+            return error
+        if not result:
+            return errors.CheckFailure(f"Check {check.__name__} failed for command {self.name}")
+        return None
+
+    async def _evaluate_checks_concurrently(
+        self, context: context_.base.Context, chain: _CheckChain
+    ) -> t.List[errors.CheckFailure]:
+        fail_fast = self.app._fail_fast_checks
+        checks_ = [check for check, _, _ in chain.entries]
+        results: t.List[t.Any] = [None] * len(checks_)
+        coros: t.List[t.Tuple[int, t.Coroutine[t.Any, t.Any, bool]]] = []
+        for i, (check, callback, _) in enumerate(chain.entries):
+            try:
+                result = callback(context)
+            except Exception as ex:
+                # Includes async checks that raised before returning a coroutine
+                result = ex
+
+            if inspect.iscoroutine(result):
+                coros.append((i, result))
+                continue
+            if fail_fast and (failure := self._check_failure(check, result)) is not None:
+                for _, coro in coros:
+                    coro.close()
+                return [failure]
+            results[i] = result
+
+        if len(coros) == 1:
+            # Nothing to run concurrently with, so avoid the overhead of creating a task
+            ((i, coro),) = coros
+            try:
+                results[i] = await coro
+            except Exception as ex:
+                results[i] = ex
+        elif coros and not fail_fast:
+            gathered = await asyncio.gather(*(coro for _, coro in coros), return_exceptions=True)
+            for (i, _), gathered_result in zip(coros, gathered):
+                if isinstance(gathered_result, BaseException) and not isinstance(gathered_result, Exception):
+                    raise gathered_result
+                results[i] = gathered_result
+        elif coros:
+            tasks: t.Dict[asyncio.Future[bool], int] = {asyncio.ensure_future(coro): i for i, coro in coros}
+            pending: t.Set[asyncio.Future[bool]] = set(tasks)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    # Report failures in the order the checks were added, as sequential evaluation would
+                    for task, i in tasks.items():
+                        if task not in done:
+                            continue
+                        results[i] = task.exception() or task.result()
+                        if (failure := self._check_failure(checks_[i], results[i])) is not None:
+                            return [failure]
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        failures = (self._check_failure(check, result) for check, result in zip(checks_, results))
+        return [failure for failure in failures if failure is not None]
+
     async def evaluate_cooldowns(self, context: context_.base.Context) -> None:
         """
         Evaluate the command's cooldown under the given context. This method will either return
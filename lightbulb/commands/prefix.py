@@ -65,8 +65,15 @@ class PrefixGroupMixin(abc.ABC):
                         self._subcommands[name] = cmd
 
     def recreate_subcommands(self, raw_cmds: t.Sequence[base.CommandLike], app: app_.BotApp) -> None:
+        assert isinstance(self, PrefixCommand)
+        # The bot's index of qualified names and alias paths is updated to point at the recreated subcommands
+        paths = app._prefix_command_paths(self)
+        for path in paths:
+            app._unindex_prefix_command(self, path)
         self._subcommands.clear()
         self.create_subcommands(raw_cmds, app)
+        for path in paths:
+            app._index_prefix_command(self, path)
 
     def get_subcommand(self, name: str) -> t.Optional[t.Union[PrefixSubGroup, PrefixSubCommand]]:
         return self._subcommands.get(name)
@@ -84,6 +91,8 @@ class PrefixCommand(base.Command):
 
     __slots__ = ()
 
+    _parses_arguments = True
+
     @property
     def signature(self) -> str:
         sig = self.qualname
@@ -91,12 +100,9 @@ class PrefixCommand(base.Command):
             sig += f" {' '.join(f'<{o.name}>' if o.required else f'[{o.name}={o.default}]' for o in self.options.values())}"
         return sig
 
-    async def invoke(self, context: context_.base.Context) -> None:
-        await self.evaluate_checks(context)
-        await self.evaluate_cooldowns(context)
+    async def _parse_arguments(self, context: context_.base.Context) -> None:
         assert isinstance(context, context_.prefix.PrefixContext)
         await context._parser.inject_args_to_context()
-        await self(context)
 
     def _validate_attributes(self) -> None:
         if " " in self.name:
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# Copyright © tandemdude 2020-present
+#
+# This file is part of Lightbulb.
+#
+# Lightbulb is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Lightbulb is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+__all__ = ["MaxConcurrencyManager"]
+
+import asyncio
+import collections
+import typing as t
+
+from lightbulb import errors
+
+if t.TYPE_CHECKING:
+    from lightbulb import cooldowns
+    from lightbulb.context import base as ctx_base
+
+
+class _ConcurrencyState:
+    __slots__ = ("active", "waiters")
+
+    def __init__(self) -> None:
+        self.active: int = 0
+        self.waiters: t.Deque[asyncio.Future[None]] = collections.deque()
+
+
+class MaxConcurrencyManager:
+    """
+    Limits the number of invocations of a command (or of all commands, if set on the
+    :obj:`~.app.BotApp`) that can run at the same time. Invocations are grouped using the same
+    buckets as cooldowns, so for example using :obj:`~.cooldowns.UserBucket` allows each user
+    to run ``limit`` invocations concurrently.
+
+    Args:
+        limit (:obj:`int`): Maximum number of invocations that can run concurrently per bucket.
+        bucket (Type[:obj:`~.cooldowns.Bucket`]): The bucket to group invocations by.
+        wait (:obj:`bool`): Whether invocations over the limit should wait for a running invocation to
+            finish instead of failing immediately. Defaults to ``False``.
+        max_waiting (Optional[:obj:`int`]): Maximum number of invocations that can wait per bucket
+            when ``wait`` is ``True``. Defaults to ``None`` - no limit.
+
+    Invocations that cannot be run or queued will raise :obj:`~.errors.MaxConcurrencyReached`.
+    """
+
+    __slots__ = ("limit", "bucket", "wait", "max_waiting", "_states")
+
+    def __init__(
+        self, limit: int, bucket: t.Type[cooldowns.Bucket], wait: bool = False, max_waiting: t.Optional[int] = None
+    ) -> None:
+        if limit < 1:
+            raise ValueError("limit must be greater than zero")
+        self.limit = limit
+        """Maximum number of invocations that can run concurrently per bucket."""
+        self.bucket = bucket
+        """The bucket that invocations are grouped by."""
+        self.wait = wait
+        """Whether invocations over the limit wait for a free slot."""
+        self.max_waiting = max_waiting
+        """Maximum number of invocations that can wait per bucket."""
+        self._states: t.Dict[t.Hashable, _ConcurrencyState] = {}
+
+    def running(self, key: t.Hashable) -> int:
+        """
+        Get the number of invocations currently running for the given bucket hash.
+
+        Args:
+            key (Hashable): The bucket hash to get the number of running invocations for.
+
+        Returns:
+            :obj:`int`: Number of running invocations.
+        """
+        state = self._states.get(key)
+        return state.active if state is not None else 0
+
+    async def acquire(self, context: ctx_base.Context) -> t.Hashable:
+        """
+        Acquire a slot under the given context, waiting for one to become free if configured to do so.
+        Every successful call **must** be paired with a call to :obj:`~MaxConcurrencyManager.release`.
+
+        Args:
+            context (:obj:`~.context.base.Context`): The context to acquire a slot under.
+
+        Returns:
+            Hashable: The bucket hash that the slot was acquired for.
+
+        Raises:
+            :obj:`~.errors.MaxConcurrencyReached`: If no slot is free and the invocation cannot wait for one.
+        """
+        key = self.bucket.extract_hash(context)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _ConcurrencyState()
+
+        if state.active < self.limit and not state.waiters:
+            state.active += 1
+            return key
+
+        if not self.wait or (self.max_waiting is not None and len(state.waiters) >= self.max_waiting):
+            raise errors.MaxConcurrencyReached(
+                "This command has reached its maximum number of concurrent invocations", limit=self.limit
+            )
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed to us just before we were cancelled
+                self.release(key)
+            else:
+                state.waiters.remove(waiter)
+            raise
+        # The releasing invocation handed its slot over without decrementing the active count
+        return key
+
+    def release(self, key: t.Hashable) -> None:
+        """
+        Release a slot previously acquired using :obj:`~MaxConcurrencyManager.acquire`, handing it
+        to the next waiting invocation if there is one.
+
+        Args:
+            key (Hashable): The bucket hash returned by :obj:`~MaxConcurrencyManager.acquire`.
+
+        Returns:
+            ``None``
+        """
+        state = self._states[key]
+        while state.waiters:
+            waiter = state.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        state.active -= 1
+        if not state.active:
+            del self._states[key]
@@ -17,13 +17,15 @@
 # along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-__all__ = ["Context", "ApplicationContext", "OptionsProxy", "ResponseProxy"]
+__all__ = ["Context", "ApplicationContext", "OptionsProxy", "ResponseProxy", "CheckCache"]
 
 import abc
 import typing as t
 
 import hikari
 
+from lightbulb import utils
+
 if t.TYPE_CHECKING:
     from lightbulb import app as app_
     from lightbulb import commands
@@ -102,6 +104,103 @@ class ResponseProxy:
         await msg.delete()
 
 
+_UNRESOLVED: t.Any = object()
+
+
+class CheckCache:
+    """
+    Memo of the objects and permissions resolved from the cache while evaluating the checks for a single
+    invocation, so that checks needing the same objects don't each repeat the lookups. All the built-in
+    checks use this, and custom checks can access it through :obj:`~Context.check_cache`.
+
+    Objects are resolved from the cache the first time they are accessed, and are not updated afterwards.
+    Permissions are taken from the bot's :obj:`~.app.BotApp.permission_cache` if it is enabled.
+
+    Args:
+        context (:obj:`~Context`): The context to resolve objects for.
+    """
+
+    __slots__ = ("_context", "_guild", "_channel", "_my_member", "_permissions")
+
+    def __init__(self, context: Context) -> None:
+        self._context = context
+        self._guild: t.Optional[hikari.Guild] = _UNRESOLVED
+        self._channel: t.Optional[t.Union[hikari.GuildChannel, hikari.Snowflake]] = _UNRESOLVED
+        self._my_member: t.Optional[hikari.Member] = _UNRESOLVED
+        self._permissions: t.Dict[t.Tuple[t.Optional[int], int, bool], hikari.Permissions] = {}
+
+    @property
+    def guild(self) -> t.Optional[hikari.Guild]:
+        """The result of :obj:`~Context.get_guild` for the context."""
+        if self._guild is _UNRESOLVED:
+            self._guild = self._context.get_guild()
+        return self._guild
+
+    @property
+    def channel(self) -> t.Optional[t.Union[hikari.GuildChannel, hikari.Snowflake]]:
+        """The result of :obj:`~Context.get_channel` for the context."""
+        if self._channel is _UNRESOLVED:
+            self._channel = self._context.get_channel()
+        return self._channel
+
+    @property
+    def my_member(self) -> t.Optional[hikari.Member]:
+        """The bot's member object for the context's guild, or ``None`` if it could not be resolved."""
+        if self._my_member is _UNRESOLVED:
+            guild = self.guild
+            self._my_member = guild.get_my_member() if guild is not None else None
+        return self._my_member
+
+    def permissions_for(self, member: hikari.Member) -> hikari.Permissions:
+        """
+        Get the guild permissions for the given member. See :obj:`~.utils.permissions.permissions_for`.
+
+        Args:
+            member (:obj:`hikari.Member`): Member to get permissions for.
+
+        Returns:
+            :obj:`hikari.Permissions`: Member's guild permissions.
+        """
+        key = (None, member.id, True)
+        if (perms := self._permissions.get(key)) is not None:
+            return perms
+        if (shared := self._context.app.permission_cache) is not None:
+            perms = shared.permissions_for(member)
+        else:
+            perms = utils.permissions.permissions_for(member)
+        self._permissions[key] = perms
+        return perms
+
+    def permissions_in(
+        self, channel: hikari.GuildChannel, member: hikari.Member, include_guild_permissions: bool = True
+    ) -> hikari.Permissions:
+        """
+        Get the permissions for the given member in the given guild channel. See
+        :obj:`~.utils.permissions.permissions_in`.
+
+        Args:
+            channel (:obj:`hikari.GuildChannel`): Channel to get the permissions in.
+            member (:obj:`hikari.Member`): Member to get the permissions for.
+            include_guild_permissions (:obj:`bool`): Whether or not to include the member's guild permissions.
+                Defaults to ``True``.
+
+        Returns:
+            :obj:`hikari.Permissions`: Member's permissions in the given channel.
+        """
+        key = (channel.id, member.id, include_guild_permissions)
+        if (perms := self._permissions.get(key)) is not None:
+            return perms
+        if (shared := self._context.app.permission_cache) is not None:
+            perms = shared.permissions_in(channel, member, include_guild_permissions)
+        else:
+            guild_perms = self.permissions_for(member) if include_guild_permissions else None
+            perms = utils.permissions.permissions_in(
+                channel, member, include_guild_permissions, guild_permissions=guild_perms
+            )
+        self._permissions[key] = perms
+        return perms
+
+
 class Context(abc.ABC):
     """
     Abstract base class for all context types.
@@ -110,18 +209,26 @@ class Context(abc.ABC):
         app (:obj:`~.app.BotApp`): The ``BotApp`` instance that the context is linked to.
     """
 
-    __slots__ = ("_app", "_responses", "_responded", "_deferred")
+    __slots__ = ("_app", "_responses", "_responded", "_deferred", "_check_cache")
 
     def __init__(self, app: app_.BotApp):
         self._app = app
         self._responses: t.List[ResponseProxy] = []
         self._responded: bool = False
         self._deferred: bool = False
+        self._check_cache: t.Optional[CheckCache] = None
 
     @abc.abstractmethod
     async def _maybe_defer(self) -> None:
         ...
 
+    @property
+    def check_cache(self) -> CheckCache:
+        """Memo of the objects and permissions resolved from the cache by the checks for this context."""
+        if self._check_cache is None:
+            self._check_cache = CheckCache(self)
+        return self._check_cache
+
     @property
     def deferred(self) -> bool:
         """Whether or not the response from this context is currently deferred."""
@@ -15,7 +15,40 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
-from lightbulb.converters import base
-from lightbulb.converters import special
-from lightbulb.converters.base import *
-from lightbulb.converters.special import *
+import typing as t
+
+from lightbulb import internal
+
+if t.TYPE_CHECKING:
+    from lightbulb.converters import base
+    from lightbulb.converters import special
+    from lightbulb.converters.base import *
+    from lightbulb.converters.special import *
+
+# Submodules are imported on first access, as they are only needed once a prefix command is parsed.
+# The exported names must match the __all__ of each submodule, which is checked by the test suite.
+_EXPORTS: t.Final[t.Mapping[str, t.Sequence[str]]] = {
+    "base": ["BaseConverter"],
+    "special": [
+        "BooleanConverter",
+        "UserConverter",
+        "MemberConverter",
+        "GuildChannelConverter",
+        "TextableGuildChannelConverter",
+        "GuildCategoryConverter",
+        "GuildVoiceChannelConverter",
+        "RoleConverter",
+        "EmojiConverter",
+        "GuildConverter",
+        "MessageConverter",
+        "InviteConverter",
+        "ColourConverter",
+        "ColorConverter",
+        "TimestampConverter",
+        "SnowflakeConverter",
+    ],
+}
+
+__all__ = [*_EXPORTS, *(name for names in _EXPORTS.values() for name in names)]
+
+__getattr__, __dir__ = internal.lazy_exports(__name__, _EXPORTS)
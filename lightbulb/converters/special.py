@@ -42,6 +42,7 @@ import typing as t
 
 import hikari
 
+from lightbulb import errors
 from lightbulb.converters import base
 from lightbulb.utils import search
 
@@ -80,13 +81,36 @@ async def _try_convert_to_guild_channel(context: context_.base.Context, arg: str
     try:
         channel_id = _resolve_id_from_arg(arg, CHANNEL_MENTION_REGEX)
     except ValueError:
-        channels = context.app.cache.get_guild_channels_view_for_guild(context.guild_id)
-        channel = search.get(channels.values(), name=arg)
+        if (index := context.app.name_index) is not None:
+            channel_id = index.get_channel_id(context.guild_id, arg)
+            if channel_id is not None:
+                channel = context.app.cache.get_guild_channel(channel_id)
+            elif index.prefix_matching:
+                matches = index.match_channel_names(context.guild_id, arg)
+                channel = _resolve_name_matches(matches, arg, context.app.cache.get_guild_channel)
+            else:
+                channel = None
+        else:
+            channels = context.app.cache.get_guild_channels_view_for_guild(context.guild_id)
+            channel = search.get(channels.values(), name=arg)
     else:
         channel = await _get_or_fetch_guild_channel_from_id(context, channel_id)
     return channel
 
 
+def _resolve_name_matches(
+    matches: t.Sequence[search.NameMatch], arg: str, get: t.Callable[[hikari.Snowflake], t.Optional[T]]
+) -> t.Optional[T]:
+    if not matches:
+        return None
+    if len(matches) > 1 and matches[0].rank == matches[1].rank:
+        candidates = [obj for match in matches if (obj := get(match.id)) is not None]
+        raise errors.AmbiguousArgument(
+            f"Argument {arg!r} matches multiple objects equally well", argument=arg, candidates=candidates
+        )
+    return get(matches[0].id)
+
+
 def _raise_if_not_none(obj: t.Optional[T]) -> T:
     if obj is None:
         raise TypeError("No object could be resolved from the argument")
@@ -114,8 +138,15 @@ class UserConverter(base.BaseConverter[hikari.User]):
         try:
             user_id = _resolve_id_from_arg(arg, USER_MENTION_REGEX)
         except ValueError:
-            users = self.context.app.cache.get_users_view()
-            user = search.find(users.values(), lambda u: u.username == arg or f"{u.username}#{u.discriminator}" == arg)
+            user = None
+            if (index := self.context.app.name_index) is not None and (user_id := index.get_user_id(arg)) is not None:
+                user = self.context.app.cache.get_user(user_id)
+            if user is None:
+                # Users can be cached without being a member of any guild, so are not guaranteed to be indexed
+                users = self.context.app.cache.get_users_view()
+                user = search.find(
+                    users.values(), lambda u: u.username == arg or f"{u.username}#{u.discriminator}" == arg
+                )
         else:
             user = self.context.app.cache.get_user(user_id)
             if user is None:
@@ -134,11 +165,24 @@ class MemberConverter(base.BaseConverter[hikari.Member]):
         try:
             user_id = _resolve_id_from_arg(arg, USER_MENTION_REGEX)
         except ValueError:
-            members = self.context.app.cache.get_members_view_for_guild(self.context.guild_id)
-            member = search.find(
-                members.values(),
-                lambda m: m.username == arg or m.nickname == arg or f"{m.username}#{m.discriminator}" == arg,
-            )
+            if (index := self.context.app.name_index) is not None:
+                guild_id = self.context.guild_id
+                member_id = index.get_member_id(guild_id, arg)
+                if member_id is not None:
+                    member = self.context.app.cache.get_member(guild_id, member_id)
+                elif index.prefix_matching:
+                    matches = index.match_member_names(guild_id, arg)
+                    member = _resolve_name_matches(
+                        matches, arg, lambda user_id: self.context.app.cache.get_member(guild_id, user_id)
+                    )
+                else:
+                    member = None
+            else:
+                members = self.context.app.cache.get_members_view_for_guild(self.context.guild_id)
+                member = search.find(
+                    members.values(),
+                    lambda m: m.username == arg or m.nickname == arg or f"{m.username}#{m.discriminator}" == arg,
+                )
         else:
             member = self.context.app.cache.get_member(self.context.guild_id, user_id)
             if member is None:
@@ -205,8 +249,18 @@ class RoleConverter(base.BaseConverter[hikari.Role]):
         try:
             role_id = _resolve_id_from_arg(arg, ROLE_MENTION_REGEX)
         except ValueError:
-            roles = self.context.app.cache.get_roles_view_for_guild(self.context.guild_id)
-            role = search.get(roles.values(), name=arg)
+            if (index := self.context.app.name_index) is not None:
+                role_id = index.get_role_id(self.context.guild_id, arg)
+                if role_id is not None:
+                    role = self.context.app.cache.get_role(role_id)
+                elif index.prefix_matching:
+                    matches = index.match_role_names(self.context.guild_id, arg)
+                    role = _resolve_name_matches(matches, arg, self.context.app.cache.get_role)
+                else:
+                    role = None
+            else:
+                roles = self.context.app.cache.get_roles_view_for_guild(self.context.guild_id)
+                role = search.get(roles.values(), name=arg)
         else:
             role = self.context.app.cache.get_role(role_id)
             if role is None:
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+# Copyright © tandemdude 2020-present
+#
+# This file is part of Lightbulb.
+#
+# Lightbulb is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Lightbulb is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+__all__ = ["CooldownBackend", "BatchingCooldownBackend", "SQLiteCooldownBackend", "RedisClient", "RedisCooldownBackend"]
+
+import abc
+import asyncio
+import concurrent.futures
+import sqlite3
+import time
+import typing as t
+
+_AcquireRequestT = t.Tuple[str, float, int]
+
+
+class CooldownBackend(abc.ABC):
+    """
+    Base class for storage backends that a :obj:`~.cooldowns.CooldownManager` can use to share cooldowns
+    between multiple processes, for example when a bot's shards are split over several processes.
+
+    Backends implement a fixed window algorithm - after ``usages`` acquisitions within ``length`` seconds
+    of the first, the key is on cooldown for ``length`` seconds. Keys are removed once their window or
+    cooldown ends. As state is shared between processes, all
+    times are measured using :func:`time.time`, so the clocks of the processes must be synchronised.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    async def acquire(self, key: str, length: float, usages: int) -> t.Optional[float]:
+        """
+        Atomically add a usage under the given key.
+
+        Args:
+            key (:obj:`str`): The key to add a usage under.
+            length (:obj:`float`): Length of the cooldown, in seconds.
+            usages (:obj:`int`): Number of usages before the cooldown is activated.
+
+        Returns:
+            Optional[:obj:`float`]: Time in seconds until the key can next be used if it is on cooldown, otherwise
+                ``None``.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def reset(self, key: str) -> None:
+        """
+        Reset the cooldown under the given key.
+
+        Args:
+            key (:obj:`str`): The key to reset the cooldown for.
+
+        Returns:
+            ``None``
+        """
+        ...
+
+    async def close(self) -> None:
+        """
+        Release any resources held by the backend.
+
+        Returns:
+            ``None``
+        """
+
+
+class BatchingCooldownBackend(CooldownBackend, abc.ABC):
+    """
+    Base class for backends where each operation requires a round trip to the storage. Calls to
+    :obj:`~BatchingCooldownBackend.acquire` made during the same iteration of the event loop are
+    collected and sent together in a single call to :obj:`~BatchingCooldownBackend.acquire_many`.
+    """
+
+    __slots__ = ("_pending", "_flush_task")
+
+    def __init__(self) -> None:
+        self._pending: t.List[t.Tuple[_AcquireRequestT, asyncio.Future[t.Optional[float]]]] = []
+        # The event loop only keeps a weak reference to tasks, so the flush task must be kept alive here
+        self._flush_task: t.Optional[asyncio.Task[None]] = None
+
+    @abc.abstractmethod
+    async def acquire_many(self, requests: t.Sequence[_AcquireRequestT]) -> t.Sequence[t.Optional[float]]:
+        """
+        Atomically add usages under the given keys, in order.
+
+        Args:
+            requests (Sequence[Tuple[:obj:`str`, :obj:`float`, :obj:`int`]]): The key, cooldown length and usages
+                for each usage to add.
+
+        Returns:
+            Sequence[Optional[:obj:`float`]]: The result of :obj:`~CooldownBackend.acquire` for each request.
+        """
+        ...
+
+    async def acquire(self, key: str, length: float, usages: int) -> t.Optional[float]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[t.Optional[float]] = loop.create_future()
+        self._pending.append(((key, length, usages), future))
+        if self._flush_task is None:
+            # The flush runs on the next iteration of the event loop, after any other acquisitions made
+            # during this iteration have been added to the batch
+            self._flush_task = loop.create_task(self._flush())
+            self._flush_task.add_done_callback(self._flush_done)
+        return await future
+
+    def _flush_done(self, task: asyncio.Task[None]) -> None:
+        if task.cancelled() and task is self._flush_task:
+            # Cancelled before it started running, so the batch was never taken
+            pending, self._pending, self._flush_task = self._pending, [], None
+            for _, future in pending:
+                future.cancel()
+
+    async def _flush(self) -> None:
+        pending, self._pending, self._flush_task = self._pending, [], None
+        try:
+            results = await self.acquire_many([request for request, _ in pending])
+        except BaseException as ex:
+            # Every waiting acquire must be resolved, including when the flush is cancelled, or it would
+            # wait forever
+            for _, future in pending:
+                if future.done():
+                    continue
+                if isinstance(ex, Exception):
+                    future.set_exception(ex)
+                else:
+                    future.cancel()
+            if not isinstance(ex, Exception):
+                raise
+            return
+
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class SQLiteCooldownBackend(BatchingCooldownBackend):
+    """
+    Cooldown backend storing cooldowns in an SQLite database in WAL mode, allowing processes on the same host
+    to share cooldowns. Database access happens on a dedicated thread, and each batch of acquisitions is
+    applied in a single transaction. Expired cooldowns are deleted periodically.
+
+    Args:
+        path (:obj:`str`): Path to the database file. This will be created if it does not exist.
+        timeout (:obj:`float`): How long, in seconds, to wait for another process to release the database
+            lock before failing. Defaults to ``5``.
+    """
+
+    __slots__ = ("path", "_connection", "_executor", "_batches")
+
+    _PURGE_EVERY: t.Final[int] = 1000
+
+    def __init__(self, path: str, timeout: float = 5) -> None:
+        super().__init__()
+        self.path = path
+        """Path to the database file."""
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="lightbulb-sqlite")
+        self._connection = self._executor.submit(self._connect, timeout).result()
+        self._batches = 0
+
+    def _connect(self, timeout: float) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        # expires is when the cooldown finishes once activated, otherwise when the window started by the
+        # key's first usage ends, so every row is eventually purged
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS lightbulb_cooldowns (key TEXT PRIMARY KEY, usages INTEGER, expires REAL)"
+        )
+        return connection
+
+    def _acquire_many(self, requests: t.Sequence[_AcquireRequestT]) -> t.List[t.Optional[float]]:
+        connection, now = self._connection, time.time()
+        results: t.List[t.Optional[float]] = []
+        # IMMEDIATE takes the write lock up front so the reads and writes below are atomic across processes
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for key, length, usages in requests:
+                row = connection.execute(
+                    "SELECT usages, expires FROM lightbulb_cooldowns WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[0] >= usages and now < row[1]:
+                    results.append(row[1] - now)
+                    continue
+
+                # Missing or expired keys start a new window which expires a cooldown length after its first usage
+                if row is None or now >= row[1]:
+                    count, expires = 1, now + length
+                else:
+                    count, expires = row[0] + 1, row[1]
+                if count >= usages:
+                    expires = now + length
+                connection.execute("INSERT OR REPLACE INTO lightbulb_cooldowns VALUES (?, ?, ?)", (key, count, expires))
+                results.append(None)
+
+            self._batches += 1
+            if self._batches % self._PURGE_EVERY == 0:
+                connection.execute("DELETE FROM lightbulb_cooldowns WHERE expires <= ?", (now,))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return results
+
+    def _reset(self, key: str) -> None:
+        self._connection.execute("DELETE FROM lightbulb_cooldowns WHERE key = ?", (key,))
+
+    async def acquire_many(self, requests: t.Sequence[_AcquireRequestT]) -> t.Sequence[t.Optional[float]]:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._acquire_many, requests)
+
+    async def reset(self, key: str) -> None:
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._reset, key)
+
+    async def close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._connection.close)
+        self._executor.shutdown()
+
+
+class RedisClient(t.Protocol):
+    """
+    The subset of a Redis-compatible client required by :obj:`~RedisCooldownBackend`. The asyncio client
+    from ``redis-py`` (``redis.asyncio.Redis``) implements this.
+    """
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: t.Union[str, int, float]) -> t.Any:
+        ...
+
+    async def delete(self, *names: str) -> t.Any:
+        ...
+
+
+# KEYS are the cooldown keys, ARGV is the cooldown length in milliseconds followed by the usages for each key.
+# Returns, for each key, the milliseconds until it can next be used, or -1 if the usage was added.
+_REDIS_ACQUIRE_SCRIPT: t.Final[
+    str
+] = """
+local results = {}
+for i, key in ipairs(KEYS) do
+    -- Keys expire a cooldown length after their first usage, or after the cooldown is activated. Activated
+    -- keys are stored with a negative count, as the cooldown length is also reset when they are activated.
+    local count = tonumber(redis.call('GET', key) or '0')
+    if count < 0 then
+        results[i] = redis.call('PTTL', key)
+    else
+        count = redis.call('INCR', key)
+        if count >= tonumber(ARGV[i * 2]) then
+            redis.call('SET', key, -1, 'PX', ARGV[i * 2 - 1])
+        elseif count == 1 then
+            redis.call('PEXPIRE', key, ARGV[i * 2 - 1])
+        end
+        results[i] = -1
+    end
+end
+return results
+"""
+
+
+class RedisCooldownBackend(BatchingCooldownBackend):
+    """
+    Cooldown backend storing cooldowns in a Redis-compatible server, allowing processes on any number of
+    hosts to share cooldowns. Each batch of acquisitions is applied atomically using a single ``EVAL``,
+    and so takes a single round trip. Keys expire automatically once their cooldown has finished.
+
+    Args:
+        client (:obj:`~RedisClient`): The client to use to communicate with the server.
+        prefix (:obj:`str`): Prefix for the keys stored in the server. Defaults to ``lightbulb:cooldown:``.
+    """
+
+    __slots__ = ("client", "prefix")
+
+    def __init__(self, client: RedisClient, prefix: str = "lightbulb:cooldown:") -> None:
+        super().__init__()
+        self.client = client
+        """The client used to communicate with the server."""
+        self.prefix = prefix
+        """Prefix for the keys stored in the server."""
+
+    async def acquire_many(self, requests: t.Sequence[_AcquireRequestT]) -> t.Sequence[t.Optional[float]]:
+        args: t.List[int] = []
+        for _, length, usages in requests:
+            args.extend((max(1, int(length * 1000)), usages))
+        results = await self.client.eval(
+            _REDIS_ACQUIRE_SCRIPT, len(requests), *(self.prefix + key for key, _, _ in requests), *args
+        )
+        return [None if int(result) < 0 else int(result) / 1000 for result in results]
+
+    async def reset(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
@@ -17,17 +17,43 @@
 # along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-__all__ = ["CooldownStatus", "Bucket", "UserBucket", "GuildBucket", "GlobalBucket", "ChannelBucket", "CooldownManager"]
+__all__ = [
+    "CooldownStatus",
+    "Bucket",
+    "UserBucket",
+    "GuildBucket",
+    "GlobalBucket",
+    "ChannelBucket",
+    "SlidingWindowLog",
+    "SlidingWindowCounter",
+    "TokenBucket",
+    "CooldownStats",
+    "CooldownManager",
+    "CompactCooldownManager",
+    "save_cooldown_snapshot",
+    "load_cooldown_snapshot",
+]
 
 import abc
+import array
+import asyncio
+import collections
 import enum
+import functools
+import heapq
 import inspect
+import itertools
+import os
+import struct
+import sys
 import time
 import typing as t
+import weakref
 
 from lightbulb import errors
 
 if t.TYPE_CHECKING:
+    from lightbulb import cooldown_backends
     from lightbulb.context import base as ctx_base
 
 
@@ -46,7 +72,7 @@ class Bucket(abc.ABC):
         max_usages (:obj:`int`): Number of command usages before the cooldown is activated.
     """
 
-    __slots__ = ("length", "usages", "commands_run", "activated", "start_time")
+    __slots__ = ("length", "usages", "commands_run", "activated", "start_time", "_last_used")
 
     def __init__(self, length: float, max_usages: int) -> None:
         self.length = length
@@ -56,6 +82,7 @@ class Bucket(abc.ABC):
         self.activated = False
         self.start_time: t.Optional[float] = None
         """The start time of the bucket cooldown. This is relative to :meth:`time.perf_counter`."""
+        self._last_used = time.perf_counter()
 
     @classmethod
     @abc.abstractmethod
@@ -85,9 +112,10 @@ class Bucket(abc.ABC):
             return CooldownStatus.EXPIRED
 
         self.commands_run += 1
+        self._last_used = time.perf_counter()
         if self.commands_run >= self.usages:
             self.activated = True
-            self.start_time = time.perf_counter()
+            self.start_time = self._last_used
         return CooldownStatus.INACTIVE
 
     @property
@@ -106,6 +134,39 @@ class Bucket(abc.ABC):
             return time.perf_counter() >= (self.start_time + self.length)
         return True
 
+    @property
+    def retry_after(self) -> float:
+        """
+        Time in seconds until the bucket will next permit a command usage. This will be ``0`` if the
+        cooldown is not currently active.
+        """
+        if not self.active:
+            return 0.0
+        assert self.start_time is not None
+        return (self.start_time + self.length) - time.perf_counter()
+
+    @property
+    def idle_at(self) -> t.Optional[float]:
+        """
+        The time, relative to :meth:`time.perf_counter`, after which the bucket can be discarded, or ``None``
+        if this is not yet known. A bucket whose cooldown has not been activated can be discarded once it has
+        not been used for ``length`` seconds, which resets its usage count.
+        """
+        if self.activated and self.start_time is not None:
+            return self.start_time + self.length
+        return self._last_used + self.length
+
+    def _get_state(self) -> t.Tuple[t.Sequence[float], t.Sequence[float]]:
+        # Returns the times, relative to time.perf_counter, and the other values making up the bucket's
+        # state, so that it can be saved and restored by a cooldown snapshot
+        times = (self.start_time,) if self.activated and self.start_time is not None else ()
+        return times, (self.commands_run,)
+
+    def _set_state(self, times: t.Sequence[float], values: t.Sequence[float]) -> None:
+        self.commands_run = int(values[0])
+        if times:
+            self.activated, self.start_time = True, times[0]
+
 
 class GlobalBucket(Bucket):
     """
@@ -157,20 +218,466 @@ class GuildBucket(Bucket):
         return context.guild_id if context.guild_id is not None else context.channel_id
 
 
+def _validate_limits(length: float, max_usages: int) -> None:
+    if length <= 0:
+        raise ValueError("length must be greater than zero")
+    if max_usages < 1:
+        raise ValueError("max_usages must be greater than zero")
+
+
+class SlidingWindowLog(Bucket):
+    """
+    Cooldown algorithm permitting at most ``max_usages`` command usages within any ``length`` second window,
+    by storing the times of the last ``max_usages`` usages. Unlike the fixed window used by :obj:`~Bucket`,
+    usages are not permitted in a burst at the boundary of two windows.
+
+    This must be combined with one of the buckets to decide how usages are grouped, for example
+    ``class UserSlidingBucket(SlidingWindowLog, UserBucket)``, or passed to
+    :obj:`~.decorators.add_cooldown` using the ``algorithm`` kwarg.
+
+    Args:
+        length (:obj:`float`): Length of the sliding window.
+        max_usages (:obj:`int`): Number of command usages permitted within the window.
+
+    Raises:
+        :obj:`ValueError`: If ``length`` is not positive or ``max_usages`` is less than one.
+    """
+
+    __slots__ = ("_log",)
+
+    def __init__(self, length: float, max_usages: int) -> None:
+        _validate_limits(length, max_usages)
+        super().__init__(length, max_usages)
+        self._log: t.Deque[float] = collections.deque(maxlen=max_usages)
+
+    def acquire(self) -> CooldownStatus:
+        now = time.perf_counter()
+        log = self._log
+        if len(log) >= self.usages and now < log[0] + self.length:
+            return CooldownStatus.ACTIVE
+
+        log.append(now)
+        self.commands_run += 1
+        return CooldownStatus.INACTIVE
+
+    @property
+    def active(self) -> bool:
+        return len(self._log) >= self.usages and time.perf_counter() < self._log[0] + self.length
+
+    @property
+    def expired(self) -> bool:
+        return not self._log or time.perf_counter() >= self._log[-1] + self.length
+
+    @property
+    def retry_after(self) -> float:
+        if not self.active:
+            return 0.0
+        return (self._log[0] + self.length) - time.perf_counter()
+
+    @property
+    def idle_at(self) -> t.Optional[float]:
+        return self._log[-1] + self.length if self._log else None
+
+    def _get_state(self) -> t.Tuple[t.Sequence[float], t.Sequence[float]]:
+        return tuple(self._log), (self.commands_run,)
+
+    def _set_state(self, times: t.Sequence[float], values: t.Sequence[float]) -> None:
+        self.commands_run = int(values[0])
+        self._log.extend(times)
+
+
+class SlidingWindowCounter(Bucket):
+    """
+    Cooldown algorithm approximating a sliding window by weighting the usage count of the previous fixed
+    window by how much of it still overlaps the sliding window. This uses constant memory regardless of
+    ``max_usages``, at the cost of occasionally permitting slightly fewer usages than :obj:`~SlidingWindowLog`.
+
+    This must be combined with one of the buckets to decide how usages are grouped, for example
+    ``class UserSlidingBucket(SlidingWindowCounter, UserBucket)``, or passed to
+    :obj:`~.decorators.add_cooldown` using the ``algorithm`` kwarg.
+
+    Args:
+        length (:obj:`float`): Length of the sliding window.
+        max_usages (:obj:`int`): Number of command usages permitted within the window.
+
+    Raises:
+        :obj:`ValueError`: If ``length`` is not positive or ``max_usages`` is less than one.
+    """
+
+    __slots__ = ("_window_start", "_previous", "_current")
+
+    def __init__(self, length: float, max_usages: int) -> None:
+        _validate_limits(length, max_usages)
+        super().__init__(length, max_usages)
+        self._window_start = time.perf_counter()
+        self._previous = 0
+        self._current = 0
+
+    def _windows_at(self, now: float) -> t.Tuple[float, int, int]:
+        elapsed = now - self._window_start
+        if elapsed < self.length:
+            return self._window_start, self._previous, self._current
+        windows = int(elapsed // self.length)
+        return self._window_start + windows * self.length, self._current if windows == 1 else 0, 0
+
+    def _estimate(self, now: float, window_start: float, previous: int, current: int) -> float:
+        return previous * (1 - (now - window_start) / self.length) + current
+
+    def acquire(self) -> CooldownStatus:
+        now = time.perf_counter()
+        self._window_start, self._previous, self._current = self._windows_at(now)
+        if self._estimate(now, self._window_start, self._previous, self._current) + 1 > self.usages:
+            return CooldownStatus.ACTIVE
+
+        self._current += 1
+        self.commands_run += 1
+        return CooldownStatus.INACTIVE
+
+    @property
+    def active(self) -> bool:
+        now = time.perf_counter()
+        return self._estimate(now, *self._windows_at(now)) + 1 > self.usages
+
+    @property
+    def expired(self) -> bool:
+        return time.perf_counter() >= self._window_start + 2 * self.length
+
+    @property
+    def retry_after(self) -> float:
+        now = time.perf_counter()
+        window_start, previous, current = self._windows_at(now)
+        if self._estimate(now, window_start, previous, current) + 1 <= self.usages:
+            return 0.0
+
+        allowed = self.usages - 1
+        if current > allowed:
+            # The current window's usages will become the previous window's usages
+            window_start, previous, current = window_start + self.length, current, 0
+        return max(0.0, window_start + self.length * (1 - (allowed - current) / previous) - now)
+
+    @property
+    def idle_at(self) -> t.Optional[float]:
+        return self._window_start + 2 * self.length
+
+    def _get_state(self) -> t.Tuple[t.Sequence[float], t.Sequence[float]]:
+        return (self._window_start,), (self.commands_run, self._previous, self._current)
+
+    def _set_state(self, times: t.Sequence[float], values: t.Sequence[float]) -> None:
+        self._window_start = times[0]
+        self.commands_run, self._previous, self._current = (int(v) for v in values)
+
+
+class TokenBucket(Bucket):
+    """
+    Token bucket cooldown algorithm. Each command usage consumes a token, and tokens are refilled at a
+    constant rate of ``max_usages`` tokens per ``length`` seconds, up to a maximum of ``burst`` tokens.
+    This smooths usages out over time while still permitting short bursts.
+
+    This must be combined with one of the buckets to decide how usages are grouped, for example
+    ``class UserTokenBucket(TokenBucket, UserBucket)``, or passed to :obj:`~.decorators.add_cooldown`
+    using the ``algorithm`` kwarg.
+
+    Args:
+        length (:obj:`float`): Time in seconds taken to refill ``max_usages`` tokens.
+        max_usages (:obj:`int`): Number of tokens refilled every ``length`` seconds.
+        burst (Optional[:obj:`int`]): Maximum number of tokens that can be stored, and so the number of
+            usages that can be made at once. Defaults to ``max_usages``.
+
+    Raises:
+        :obj:`ValueError`: If ``length`` is not positive, or ``max_usages`` or ``burst`` is less than one.
+    """
+
+    __slots__ = ("burst", "rate", "_tokens", "_updated")
+
+    def __init__(self, length: float, max_usages: int, burst: t.Optional[int] = None) -> None:
+        _validate_limits(length, max_usages)
+        super().__init__(length, max_usages)
+        self.burst = burst if burst is not None else max_usages
+        """Maximum number of tokens that can be stored."""
+        if self.burst < 1:
+            raise ValueError("burst must be greater than zero")
+        self.rate = max_usages / length
+        """Number of tokens refilled per second."""
+        self._tokens = float(self.burst)
+        self._updated = time.perf_counter()
+
+    def _tokens_at(self, now: float) -> float:
+        return min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+
+    def acquire(self) -> CooldownStatus:
+        now = time.perf_counter()
+        tokens = self._tokens_at(now)
+        if tokens < 1:
+            return CooldownStatus.ACTIVE
+
+        self._tokens, self._updated = tokens - 1, now
+        self.commands_run += 1
+        return CooldownStatus.INACTIVE
+
+    @property
+    def active(self) -> bool:
+        return self._tokens_at(time.perf_counter()) < 1
+
+    @property
+    def expired(self) -> bool:
+        return self._tokens_at(time.perf_counter()) >= self.burst
+
+    @property
+    def retry_after(self) -> float:
+        return max(0.0, (1 - self._tokens_at(time.perf_counter())) / self.rate)
+
+    @property
+    def idle_at(self) -> t.Optional[float]:
+        return self._updated + (self.burst - self._tokens) / self.rate
+
+    def _get_state(self) -> t.Tuple[t.Sequence[float], t.Sequence[float]]:
+        return (self._updated,), (self.commands_run, self._tokens)
+
+    def _set_state(self, times: t.Sequence[float], values: t.Sequence[float]) -> None:
+        self._updated = times[0]
+        self.commands_run, self._tokens = int(values[0]), values[1]
+
+
+@functools.lru_cache(maxsize=None)
+def _bucket_with_algorithm(bucket: t.Type[Bucket], algorithm: t.Type[Bucket]) -> t.Type[Bucket]:
+    if issubclass(bucket, algorithm):
+        return bucket
+    return type(f"{algorithm.__name__}{bucket.__name__}", (algorithm, bucket), {"__slots__": ()})
+
+
+class _StaticBucketFactory:
+    # Callback creating buckets of a fixed class, length and usages. Cooldown managers recognise this
+    # and extract the cooldown hash directly from the bucket class, only creating a bucket when one is stored.
+    __slots__ = ("bucket", "length", "usages", "kwargs", "extract_hash")
+
+    def __init__(self, bucket: t.Type[Bucket], length: float, usages: int, **kwargs: t.Any) -> None:
+        self.bucket = bucket
+        self.length = length
+        self.usages = usages
+        # Additional arguments for the bucket's algorithm, such as the burst of a TokenBucket
+        self.kwargs = kwargs
+        self.extract_hash: t.Callable[[ctx_base.Context], t.Hashable] = bucket.extract_hash
+
+    def create(self) -> Bucket:
+        return self.bucket(self.length, self.usages, **self.kwargs)
+
+    def __call__(self, _: ctx_base.Context) -> Bucket:
+        return self.create()
+
+
+class CooldownStats(t.NamedTuple):
+    """Statistics about the cooldowns stored by a :obj:`~CooldownManager`."""
+
+    entries: int
+    """Number of buckets currently stored."""
+    max_entries: t.Optional[int]
+    """Maximum number of buckets that can be stored, or ``None`` if unbounded."""
+    expired: int
+    """Number of buckets removed because their cooldown expired."""
+    evicted: int
+    """Number of buckets evicted because the maximum number of entries was reached."""
+    memory: int
+    """Approximate memory used by the stored buckets and their keys, in bytes."""
+
+
+class _ExpirySweeper:
+    # Heap of (expiry time, tiebreaker, manager, hash, bucket id) shared by every cooldown manager. Due
+    # entries are removed whenever any manager adds a cooldown, so the cost of removing dead buckets
+    # is spread over command invocations instead of requiring a timer per bucket, and periodically by
+    # sweep_periodically so that an idle bot still frees them.
+    #
+    # Buckets are only scheduled when stored, not on every usage. A bucket used since it was scheduled is
+    # rescheduled for its new expiry when its entry comes due, so each stored bucket has one entry. Managers
+    # are weakly referenced and buckets only by id, so reset and evicted buckets are freed immediately.
+    __slots__ = ("_heap", "_counter")
+
+    def __init__(self) -> None:
+        self._heap: t.List[t.Tuple[float, int, weakref.ReferenceType[CooldownManager], t.Hashable, int]] = []
+        self._counter = itertools.count()
+
+    def schedule(self, manager: CooldownManager, cooldown_hash: t.Hashable, bucket: Bucket) -> None:
+        if (idle_at := bucket.idle_at) is not None:
+            heapq.heappush(self._heap, (idle_at, next(self._counter), weakref.ref(manager), cooldown_hash, id(bucket)))
+
+    def sweep(self, now: float) -> None:
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, manager_ref, cooldown_hash, bucket_id = heapq.heappop(heap)
+            if (manager := manager_ref()) is None:
+                continue
+            if (idle_at := manager._expire(cooldown_hash, bucket_id, now)) is not None:
+                heapq.heappush(heap, (idle_at, next(self._counter), manager_ref, cooldown_hash, bucket_id))
+
+    async def sweep_periodically(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.sweep(time.perf_counter())
+
+
+_SWEEPER = _ExpirySweeper()
+# Seconds between sweeps made by a running BotApp
+_SWEEP_INTERVAL: t.Final[float] = 60.0
+
+
 class CooldownManager:
     """
     The cooldown manager for a command.
+
+    Buckets are removed from :obj:`~CooldownManager.cooldowns` once their cooldown has expired, or if their
+    cooldown was never activated, once they have not been used for the length of the cooldown. Expired buckets
+    are removed whenever a cooldown is added to any manager, and every minute while a :obj:`~.app.BotApp`
+    is running.
+
+    Args:
+        callback (Callable[[:obj:`~.context.base.Context`], Union[:obj:`~Bucket`, Coroutine[Any, Any, :obj:`~Bucket`]]]):
+            Callable that returns the bucket to use for cooldowns in the given context.
+        max_entries (Optional[:obj:`int`]): Maximum number of buckets to store. When exceeded, the least recently
+            used bucket is evicted, which resets its cooldown. Defaults to ``None`` - unbounded.
+        backend (Optional[:obj:`~.cooldown_backends.CooldownBackend`]): Backend to store cooldowns in, allowing them
+            to be shared between processes. Defaults to ``None`` - cooldowns are stored in this manager.
+        namespace (Optional[:obj:`str`]): Namespace for this manager's keys in the backend. Managers in different
+            processes share cooldowns when they use the same namespace. Defaults to ``None`` - the qualified name
+            of the invoked command.
+
+    Note:
+        The methods for inspecting and resetting cooldowns without a context only cover cooldowns stored in
+        this manager, not those stored in a backend.
+
+    Note:
+        Backends only implement the fixed window algorithm. When a backend is set, only the bucket's length and
+        usages are used, so alternative algorithms such as :obj:`~TokenBucket` behave as a fixed window.
     """
 
-    __slots__ = ("callback", "cooldowns")
+    __slots__ = (
+        "callback",
+        "cooldowns",
+        "max_entries",
+        "backend",
+        "namespace",
+        "_static",
+        "_expired",
+        "_evicted",
+        "__weakref__",
+    )
 
     def __init__(
         self,
         callback: t.Callable[[ctx_base.Context], t.Union[Bucket, t.Coroutine[t.Any, t.Any, Bucket]]],
+        max_entries: t.Optional[int] = None,
+        backend: t.Optional[cooldown_backends.CooldownBackend] = None,
+        namespace: t.Optional[str] = None,
     ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be greater than zero")
+        self.backend = backend
+        """Backend that cooldowns are stored in, or ``None`` if they are stored in this manager."""
+        self.namespace = namespace
+        """Namespace for this manager's keys in the backend, or ``None`` to use the invoked command's name."""
         self.callback = callback
-        self.cooldowns: t.MutableMapping[t.Hashable, Bucket] = {}
+        # Buckets declared with a fixed class, length and usages don't need to be created to find their hash
+        self._static = callback if isinstance(callback, _StaticBucketFactory) else None
+        self.cooldowns: t.MutableMapping[t.Hashable, Bucket] = {} if max_entries is None else collections.OrderedDict()
         """Mapping of a hashable to a :obj:`~Bucket` representing the currently stored cooldowns."""
+        self.max_entries = max_entries
+        """Maximum number of buckets to store, or ``None`` if unbounded."""
+        self._expired = 0
+        self._evicted = 0
+
+    def _expire(self, cooldown_hash: t.Hashable, bucket_id: int, now: float) -> t.Optional[float]:
+        # Returns when to check the bucket again if it has been used since being scheduled. The bucket may
+        # have already been replaced, reset or evicted, in which case its entry is dropped.
+        bucket = self.cooldowns.get(cooldown_hash)
+        if bucket is None or id(bucket) != bucket_id:
+            return None
+        if (idle_at := bucket.idle_at) is None or idle_at > now:
+            return idle_at
+        del self.cooldowns[cooldown_hash]
+        self._expired += 1
+        return None
+
+    def stats(self) -> CooldownStats:
+        """
+        Get statistics about the cooldowns stored by this manager. Calculating the memory usage
+        requires iterating over every stored bucket.
+
+        Returns:
+            :obj:`~CooldownStats`: Statistics about the stored cooldowns.
+        """
+        memory = sys.getsizeof(self.cooldowns) + sum(
+            sys.getsizeof(key) + sys.getsizeof(bucket) for key, bucket in self.cooldowns.items()
+        )
+        return CooldownStats(len(self.cooldowns), self.max_entries, self._expired, self._evicted, memory)
+
+    def iter_active(self) -> t.Iterator[t.Tuple[t.Hashable, Bucket]]:
+        """
+        Lazily iterate over the cooldowns that are currently active, for example to find every user currently
+        rate-limited on a command.
+
+        The hashes of the stored cooldowns are copied when iteration starts and each bucket is looked up as the
+        iterator advances, so the iterator can be used while cooldowns are added, reset or expire. Cooldowns
+        which are reset or expire before they are reached are skipped, and cooldowns added after iteration
+        starts are not included.
+
+        Returns:
+            Iterator[Tuple[Hashable, :obj:`~Bucket`]]: Iterator of cooldown hash and bucket for each active cooldown.
+        """
+        cooldowns = self.cooldowns
+        for cooldown_hash in list(cooldowns):
+            if (bucket := cooldowns.get(cooldown_hash)) is not None and bucket.active:
+                yield cooldown_hash, bucket
+
+    def active_count(self) -> int:
+        """
+        Get the number of cooldowns that are currently active.
+
+        Returns:
+            :obj:`int`: Number of active cooldowns.
+        """
+        return sum(1 for bucket in self.cooldowns.values() if bucket.active)
+
+    def reset(self, cooldown_hash: t.Hashable) -> bool:
+        """
+        Reset the cooldown with the given hash. Unlike :obj:`~CooldownManager.reset_cooldown`, this does not
+        require a context, so can be used to reset a cooldown from outside of a command.
+
+        Args:
+            cooldown_hash (Hashable): The hash of the cooldown to reset, as returned by
+                :obj:`~Bucket.extract_hash`.
+
+        Returns:
+            :obj:`bool`: Whether a cooldown was stored for the hash.
+        """
+        return self.cooldowns.pop(cooldown_hash, None) is not None
+
+    def reset_where(self, predicate: t.Callable[[t.Hashable, Bucket], bool]) -> int:
+        """
+        Reset every cooldown for which the given predicate returns ``True``.
+
+        Args:
+            predicate (Callable[[Hashable, :obj:`~Bucket`], :obj:`bool`]): Function called with the hash and
+                bucket of each stored cooldown.
+
+        Returns:
+            :obj:`int`: Number of cooldowns reset.
+        """
+        # Only the matching hashes are collected, as the mapping cannot be modified while iterating over it
+        matching = [
+            cooldown_hash for cooldown_hash, bucket in self.cooldowns.items() if predicate(cooldown_hash, bucket)
+        ]
+        for cooldown_hash in matching:
+            self.reset(cooldown_hash)
+        return len(matching)
+
+    def reset_all(self) -> int:
+        """
+        Reset every cooldown stored by this manager.
+
+        Returns:
+            :obj:`int`: Number of cooldowns reset.
+        """
+        count = len(self.cooldowns)
+        self.cooldowns.clear()
+        return count
 
     async def _get_bucket(self, context: ctx_base.Context) -> Bucket:
         bucket = self.callback(context)
@@ -180,6 +687,20 @@ class CooldownManager:
         assert isinstance(bucket, Bucket)
         return bucket
 
+    async def _resolve(self, context: ctx_base.Context) -> t.Tuple[t.Hashable, t.Optional[Bucket]]:
+        # Returns the cooldown hash and, if the callback had to be called to find it, the new bucket
+        if (static := self._static) is not None:
+            return static.extract_hash(context), None
+        bucket = await self._get_bucket(context)
+        return bucket.extract_hash(context), bucket
+
+    def _backend_key(self, context: ctx_base.Context, cooldown_hash: t.Hashable) -> str:
+        namespace = self.namespace
+        if namespace is None:
+            assert context.command is not None
+            namespace = context.command.qualname
+        return f"{namespace}:{cooldown_hash}"
+
     async def add_cooldown(self, context: ctx_base.Context) -> None:
         """
         Add a cooldown under the given context. If an expired bucket already exists then it
@@ -191,26 +712,62 @@ class CooldownManager:
         Returns:
             ``None``
         """
-        bucket = await self._get_bucket(context)
+        cooldown_hash, bucket = await self._resolve(context)
+
+        if self.backend is not None:
+            limits = bucket if bucket is not None else self._static
+            assert limits is not None
+            key = self._backend_key(context, cooldown_hash)
+            if (retry_after := await self.backend.acquire(key, limits.length, limits.usages)) is not None:
+                raise errors.CommandIsOnCooldown("This command is on cooldown", retry_after=retry_after)
+            return
 
-        cooldown_hash = bucket.extract_hash(context)
+        _SWEEPER.sweep(time.perf_counter())
         cooldown_bucket = self.cooldowns.get(cooldown_hash)
 
         if cooldown_bucket is not None:
+            if self.max_entries is not None:
+                t.cast("collections.OrderedDict[t.Hashable, Bucket]", self.cooldowns).move_to_end(cooldown_hash)
+            unscheduled = cooldown_bucket.idle_at is None
             cooldown_status = cooldown_bucket.acquire()
             if cooldown_status is CooldownStatus.ACTIVE:
                 # Cooldown has been activated
-                assert cooldown_bucket.start_time is not None
-                raise errors.CommandIsOnCooldown(
-                    "This command is on cooldown",
-                    retry_after=(cooldown_bucket.start_time + cooldown_bucket.length) - time.perf_counter(),
-                )
+                raise errors.CommandIsOnCooldown("This command is on cooldown", retry_after=cooldown_bucket.retry_after)
             elif cooldown_status is CooldownStatus.INACTIVE:
-                # Cooldown has not yet been activated.
+                # Cooldown has not yet been activated. Buckets are scheduled for removal once their expiry is
+                # known, and rescheduled by the sweeper if they are used again before then.
+                if unscheduled:
+                    _SWEEPER.schedule(self, cooldown_hash, cooldown_bucket)
                 return
 
+        if bucket is None:
+            assert self._static is not None
+            bucket = self._static(context)
+        bucket.acquire()
+        self._store(cooldown_hash, bucket)
+
+    def _store(self, cooldown_hash: t.Hashable, bucket: Bucket) -> None:
         self.cooldowns[cooldown_hash] = bucket
-        self.cooldowns[cooldown_hash].acquire()
+        _SWEEPER.schedule(self, cooldown_hash, bucket)
+        if self.max_entries is not None and len(self.cooldowns) > self.max_entries:
+            t.cast("collections.OrderedDict[t.Hashable, Bucket]", self.cooldowns).popitem(last=False)
+            self._evicted += 1
+
+    def _snapshot_entries(self) -> t.Iterator[t.Tuple[t.Hashable, t.Sequence[float], t.Sequence[float]]]:
+        for cooldown_hash, bucket in self.cooldowns.items():
+            yield (cooldown_hash, *bucket._get_state())
+
+    def _restore_entry(self, cooldown_hash: t.Hashable, times: t.Sequence[float], values: t.Sequence[float]) -> bool:
+        # Cooldowns added since the bot started take priority over the restored state
+        assert self._static is not None
+        if cooldown_hash in self.cooldowns:
+            return False
+        bucket = self._static.create()
+        bucket._set_state(times, values)
+        if (idle_at := bucket.idle_at) is not None and idle_at <= time.perf_counter():
+            return False
+        self._store(cooldown_hash, bucket)
+        return True
 
     async def reset_cooldown(self, context: ctx_base.Context) -> None:
         """
@@ -222,5 +779,367 @@ class CooldownManager:
         Returns:
             ``None``
         """
-        bucket = await self._get_bucket(context)
-        del self.cooldowns[bucket.extract_hash(context)]
+        cooldown_hash, _ = await self._resolve(context)
+        if self.backend is not None:
+            await self.backend.reset(self._backend_key(context, cooldown_hash))
+            return
+        del self.cooldowns[cooldown_hash]
+
+
+_EMPTY: t.Final[int] = -1
+_DELETED: t.Final[int] = -2
+_MIN_CAPACITY: t.Final[int] = 8
+
+
+class _CompactCooldownsView(t.Mapping[t.Hashable, Bucket]):
+    __slots__ = ("_manager",)
+
+    def __init__(self, manager: CompactCooldownManager) -> None:
+        self._manager = manager
+
+    def __getitem__(self, key: t.Hashable) -> Bucket:
+        manager = self._manager
+        if not isinstance(key, int) or (idx := manager._find(key)) < 0:
+            raise KeyError(key)
+        bucket = manager.bucket(manager.length, manager.usages)
+        bucket.commands_run = count = manager._counts[idx]
+        bucket._last_used = start = manager._starts[idx]
+        if count >= manager.usages:
+            bucket.activated = True
+            bucket.start_time = start
+        return bucket
+
+    def __iter__(self) -> t.Iterator[t.Hashable]:
+        manager = self._manager
+        return (key for key, count in zip(manager._keys, manager._counts) if count)
+
+    def __len__(self) -> int:
+        return self._manager._live
+
+
+class CompactCooldownManager(CooldownManager):
+    """
+    A cooldown manager which stores only the usage count and cooldown start time for each key, in compact
+    arrays indexed by an open-addressing hash table, instead of a :obj:`~Bucket` object per key. The bucket
+    length and usages are shared by all keys. This uses several times less memory than :obj:`~CooldownManager`
+    for commands with a large number of distinct cooldown keys, such as user cooldowns on a large bot.
+
+    The bucket's :obj:`~Bucket.extract_hash` must return an :obj:`int` that fits in 64 bits, as all the
+    built-in buckets do. As with :obj:`~CooldownManager`, a key whose cooldown was never activated expires once
+    it has not been used for the length of the cooldown. Expired entries are discarded whenever the table is
+    resized.
+
+    :obj:`~CompactCooldownManager.cooldowns` is a read-only view, which creates a :obj:`~Bucket` representing
+    the stored state for a key whenever it is accessed.
+
+    Args:
+        length (:obj:`float`): Length of the cooldown timer.
+        usages (:obj:`int`): Number of command usages before the cooldown is activated.
+        bucket (Type[:obj:`~Bucket`]): The bucket to use for cooldowns.
+    """
+
+    __slots__ = ("length", "usages", "bucket", "_keys", "_counts", "_starts", "_index", "_mask", "_live", "_filled")
+
+    def __init__(self, length: float, usages: int, bucket: t.Type[Bucket]) -> None:
+        # CooldownManager.__init__ is not called as this class replaces the cooldowns mapping
+        self.callback = self._static = _StaticBucketFactory(bucket, length, usages)
+        self.max_entries = None
+        self.backend = None
+        self.namespace = None
+        self._expired = 0
+        self._evicted = 0
+        self.length = length
+        """Length of the cooldown timer."""
+        self.usages = usages
+        """Number of command usages before the cooldown is activated."""
+        self.bucket = bucket
+        """The bucket used to extract cooldown keys."""
+        self._keys: array.array[int] = array.array("q")
+        self._counts: array.array[int] = array.array("I")
+        # Time of each key's last usage, which is when the cooldown started if it has been activated
+        self._starts: array.array[float] = array.array("d")
+        self._rebuild(_MIN_CAPACITY)
+
+    @property
+    def cooldowns(self) -> t.Mapping[t.Hashable, Bucket]:  # type: ignore[override]
+        """Read-only view mapping cooldown key to a :obj:`~Bucket` representing its stored state."""
+        return _CompactCooldownsView(self)
+
+    def _slot_for(self, key: int) -> int:
+        # Fibonacci hashing spreads sequential keys (such as snowflakes) over the table
+        return ((key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> (64 - self._mask.bit_length())
+
+    def _find(self, key: int) -> int:
+        index, keys, mask = self._index, self._keys, self._mask
+        slot = self._slot_for(key)
+        while (idx := index[slot]) != _EMPTY:
+            if idx != _DELETED and keys[idx] == key:
+                return idx
+            slot = (slot + 1) & mask
+        return -1
+
+    def _insert_slot(self, key: int) -> int:
+        index, mask = self._index, self._mask
+        slot = self._slot_for(key)
+        while index[slot] >= 0:
+            slot = (slot + 1) & mask
+        return slot
+
+    def _rebuild(self, min_capacity: int) -> None:
+        now = time.perf_counter()
+        old = zip(self._keys, self._counts, self._starts)
+        self._keys, self._counts, self._starts = array.array("q"), array.array("I"), array.array("d")
+        for key, count, start in old:
+            if not count:
+                continue
+            if now >= start + self.length:
+                self._expired += 1
+                continue
+            self._keys.append(key)
+            self._counts.append(count)
+            self._starts.append(start)
+
+        capacity = _MIN_CAPACITY
+        while capacity < max(min_capacity, len(self._keys) * 2):
+            capacity *= 2
+        self._index = array.array("q", [_EMPTY]) * capacity
+        self._mask = capacity - 1
+        self._live = self._filled = len(self._keys)
+        for idx, key in enumerate(self._keys):
+            self._index[self._insert_slot(key)] = idx
+
+    def _add(self, key: int, now: float) -> None:
+        if (self._filled + 1) * 3 > (self._mask + 1) * 2:
+            # Drop deleted and expired entries, and grow the table if it is still too full
+            self._rebuild(self._live * 2)
+        self._index[self._insert_slot(key)] = len(self._keys)
+        self._keys.append(key)
+        self._counts.append(1)
+        self._starts.append(now)
+        self._live += 1
+        self._filled += 1
+
+    def _delete(self, key: int) -> bool:
+        index, keys, mask = self._index, self._keys, self._mask
+        slot = self._slot_for(key)
+        while (idx := index[slot]) != _EMPTY:
+            if idx != _DELETED and keys[idx] == key:
+                index[slot] = _DELETED
+                self._counts[idx] = 0
+                self._live -= 1
+                return True
+            slot = (slot + 1) & mask
+        return False
+
+    def _extract_key(self, context: ctx_base.Context) -> int:
+        key = self.bucket.extract_hash(context)
+        if not isinstance(key, int):
+            raise TypeError(f"CompactCooldownManager requires integer cooldown hashes, got {type(key).__name__!r}")
+        return key
+
+    async def add_cooldown(self, context: ctx_base.Context) -> None:
+        key = self._extract_key(context)
+        now = time.perf_counter()
+
+        if (idx := self._find(key)) < 0:
+            self._add(key, now)
+            return
+
+        start = self._starts[idx]
+        if now >= start + self.length:
+            # Cooldown has expired, or was not used for its length before being activated, start a new one in place
+            self._counts[idx] = 1
+        elif (count := self._counts[idx]) >= self.usages:
+            raise errors.CommandIsOnCooldown("This command is on cooldown", retry_after=(start + self.length) - now)
+        else:
+            self._counts[idx] = count + 1
+        self._starts[idx] = now
+
+    async def reset_cooldown(self, context: ctx_base.Context) -> None:
+        if not self._delete(self._extract_key(context)):
+            raise KeyError(self.bucket.extract_hash(context))
+
+    def stats(self) -> CooldownStats:
+        memory = sum(sys.getsizeof(a) for a in (self._keys, self._counts, self._starts, self._index))
+        return CooldownStats(self._live, None, self._expired, 0, memory)
+
+    def _snapshot_entries(self) -> t.Iterator[t.Tuple[t.Hashable, t.Sequence[float], t.Sequence[float]]]:
+        for key, count, start in zip(self._keys, self._counts, self._starts):
+            if count:
+                yield key, (start,) if count >= self.usages else (), (count,)
+
+    def _restore_entry(self, cooldown_hash: t.Hashable, times: t.Sequence[float], values: t.Sequence[float]) -> bool:
+        now = time.perf_counter()
+        if not isinstance(cooldown_hash, int) or self._find(cooldown_hash) >= 0:
+            return False
+        if times and times[0] + self.length <= now:
+            return False
+        self._add(cooldown_hash, now)
+        idx = len(self._keys) - 1
+        self._counts[idx] = int(values[0])
+        self._starts[idx] = times[0] if times else now
+        return True
+
+    def _iter_active_keys(self) -> t.Iterator[int]:
+        now, length, usages = time.perf_counter(), self.length, self.usages
+        for key, count, start in zip(self._keys, self._counts, self._starts):
+            if count >= usages and now < start + length:
+                yield key
+
+    def iter_active(self) -> t.Iterator[t.Tuple[t.Hashable, Bucket]]:
+        view = self.cooldowns
+        for key in self._iter_active_keys():
+            # The keys are read from the arrays as they were when iteration started, so the cooldown may
+            # have been reset or expired since
+            if (bucket := view.get(key)) is not None and bucket.active:
+                yield key, bucket
+
+    def active_count(self) -> int:
+        # Avoids creating a bucket for each active cooldown
+        return sum(1 for _ in self._iter_active_keys())
+
+    def reset(self, cooldown_hash: t.Hashable) -> bool:
+        return isinstance(cooldown_hash, int) and self._delete(cooldown_hash)
+
+    def reset_all(self) -> int:
+        count = self._live
+        self._keys, self._counts, self._starts = array.array("q"), array.array("I"), array.array("d")
+        self._rebuild(_MIN_CAPACITY)
+        return count
+
+
+_SNAPSHOT_HEADER: t.Final[bytes] = b"LBCD\x02"
+_KEY_END: t.Final[int] = 0
+_KEY_INT: t.Final[int] = 1
+_KEY_STR: t.Final[int] = 2
+
+
+def _write_str(fp: t.BinaryIO, value: str) -> None:
+    encoded = value.encode("utf-8")
+    fp.write(struct.pack("<I", len(encoded)))
+    fp.write(encoded)
+
+
+def _read(fp: t.BinaryIO, fmt: str) -> t.Tuple[t.Any, ...]:
+    size = struct.calcsize(fmt)
+    data = fp.read(size)
+    if len(data) != size:
+        raise ValueError("Cooldown snapshot is truncated")
+    return struct.unpack(fmt, data)
+
+
+def _read_str(fp: t.BinaryIO) -> str:
+    (size,) = _read(fp, "<I")
+    data = fp.read(size)
+    if len(data) != size:
+        raise ValueError("Cooldown snapshot is truncated")
+    return data.decode("utf-8")
+
+
+def _snapshot_spec(manager: CooldownManager) -> t.Optional[t.Tuple[str, float, int, str]]:
+    # Only managers with a fixed bucket can create buckets to restore into without a context. The algorithm's
+    # additional arguments, such as the burst of a TokenBucket, are compared by their sorted representation.
+    if (static := manager._static) is None or manager.backend is not None:
+        return None
+    bucket_name = f"{static.bucket.__module__}.{static.bucket.__qualname__}"
+    return bucket_name, static.length, static.usages, repr(sorted(static.kwargs.items()))
+
+
+def save_cooldown_snapshot(managers: t.Mapping[str, CooldownManager], path: t.Union[str, os.PathLike[str]]) -> int:
+    """
+    Save the cooldowns stored by the given managers to a file, so that they can be restored after a restart
+    using :obj:`~load_cooldown_snapshot`. Cooldowns are written as they are read from each manager, to a
+    temporary file which then replaces the given file. Times are stored relative to the wall clock.
+
+    Only managers created with the args length,uses,bucket of :obj:`~.decorators.add_cooldown` and without a
+    backend can be saved, as can only cooldowns whose hash is an :obj:`int` or :obj:`str`.
+
+    Args:
+        managers (Mapping[:obj:`str`, :obj:`~CooldownManager`]): Mapping of a unique name, such as the qualified
+            name of the command, to the manager to save cooldowns from.
+        path (Union[:obj:`str`, :obj:`os.PathLike`]): Path to the file to save cooldowns to.
+
+    Returns:
+        :obj:`int`: Number of cooldowns saved.
+    """
+    offset = time.time() - time.perf_counter()
+    saved = 0
+    temp_path = f"{os.fspath(path)}.tmp"
+    with open(temp_path, "wb") as fp:
+        fp.write(_SNAPSHOT_HEADER)
+        for name, manager in managers.items():
+            if (spec := _snapshot_spec(manager)) is None:
+                continue
+
+            bucket_name, length, usages, kwargs = spec
+            fp.write(b"M")
+            _write_str(fp, name)
+            _write_str(fp, bucket_name)
+            fp.write(struct.pack("<dI", length, usages))
+            _write_str(fp, kwargs)
+            for cooldown_hash, times, values in manager._snapshot_entries():
+                if isinstance(cooldown_hash, int) and -(2**63) <= cooldown_hash < 2**63:
+                    fp.write(struct.pack("<Bq", _KEY_INT, cooldown_hash))
+                elif isinstance(cooldown_hash, str):
+                    fp.write(struct.pack("<B", _KEY_STR))
+                    _write_str(fp, cooldown_hash)
+                else:
+                    continue
+                fp.write(struct.pack(f"<I{len(times)}d", len(times), *(time_ + offset for time_ in times)))
+                fp.write(struct.pack(f"<I{len(values)}d", len(values), *values))
+                saved += 1
+            fp.write(struct.pack("<B", _KEY_END))
+        fp.write(b"E")
+    os.replace(temp_path, path)
+    return saved
+
+
+def load_cooldown_snapshot(managers: t.Mapping[str, CooldownManager], path: t.Union[str, os.PathLike[str]]) -> int:
+    """
+    Restore cooldowns saved using :obj:`~save_cooldown_snapshot` into the given managers. Cooldowns which have
+    expired since the snapshot was saved are dropped, as are those saved for a manager with a different bucket,
+    length, usages or algorithm arguments (such as the ``burst`` of a :obj:`~TokenBucket`) than the manager
+    under the same name now has. Cooldowns already stored by a manager are not overwritten.
+
+    Args:
+        managers (Mapping[:obj:`str`, :obj:`~CooldownManager`]): Mapping of the names the managers were saved under
+            to the manager to restore cooldowns into.
+        path (Union[:obj:`str`, :obj:`os.PathLike`]): Path to the file to restore cooldowns from.
+
+    Returns:
+        :obj:`int`: Number of cooldowns restored.
+
+    Raises:
+        :obj:`ValueError`: If the file is not a valid cooldown snapshot.
+    """
+    offset = time.time() - time.perf_counter()
+    restored = 0
+    with open(path, "rb") as fp:
+        if fp.read(len(_SNAPSHOT_HEADER)) != _SNAPSHOT_HEADER:
+            raise ValueError("File is not a cooldown snapshot or was saved by an incompatible version")
+
+        while (tag := fp.read(1)) == b"M":
+            name, bucket_name = _read_str(fp), _read_str(fp)
+            length, usages = _read(fp, "<dI")
+            spec = (bucket_name, length, usages, _read_str(fp))
+            manager = managers.get(name)
+            compatible = manager is not None and _snapshot_spec(manager) == spec
+
+            while (key_type := _read(fp, "<B")[0]) != _KEY_END:
+                cooldown_hash: t.Hashable
+                if key_type == _KEY_INT:
+                    (cooldown_hash,) = _read(fp, "<q")
+                elif key_type == _KEY_STR:
+                    cooldown_hash = _read_str(fp)
+                else:
+                    raise ValueError(f"Cooldown snapshot contains an invalid key type {key_type}")
+                (n_times,) = _read(fp, "<I")
+                times = [time_ - offset for time_ in _read(fp, f"<{n_times}d")]
+                (n_values,) = _read(fp, "<I")
+                values = _read(fp, f"<{n_values}d")
+                if compatible and manager._restore_entry(cooldown_hash, times, values):  # type: ignore[union-attr]
+                    restored += 1
+
+        if tag != b"E":
+            raise ValueError("Cooldown snapshot is truncated")
+    return restored
@@ -17,20 +17,30 @@
 # along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-__all__ = ["implements", "command", "option", "add_checks", "check_exempt", "add_cooldown", "set_help"]
+__all__ = [
+    "implements",
+    "command",
+    "option",
+    "add_checks",
+    "check_exempt",
+    "add_cooldown",
+    "set_max_concurrency",
+    "set_help",
+]
 
-import functools
 import inspect
 import typing as t
 
 import hikari
 
 from lightbulb import commands
+from lightbulb import concurrency
 from lightbulb import cooldowns
 
 if t.TYPE_CHECKING:
     from lightbulb import checks as checks_
     from lightbulb import context
+    from lightbulb import cooldown_backends
 
 T = t.TypeVar("T")
 
@@ -169,7 +179,15 @@ def check_exempt(
 
 @t.overload
 def add_cooldown(
-    length: float, uses: int, bucket: t.Type[cooldowns.Bucket]
+    length: float,
+    uses: int,
+    bucket: t.Type[cooldowns.Bucket],
+    *,
+    algorithm: t.Optional[t.Type[cooldowns.Bucket]] = None,
+    burst: t.Optional[int] = None,
+    max_entries: t.Optional[int] = None,
+    backend: t.Optional[cooldown_backends.CooldownBackend] = None,
+    namespace: t.Optional[str] = None,
 ) -> t.Callable[[commands.base.CommandLike], commands.base.CommandLike]:
     ...
 
@@ -180,6 +198,9 @@ def add_cooldown(
     callback: t.Callable[
         [context.base.Context], t.Union[cooldowns.Bucket, t.Coroutine[t.Any, t.Any, cooldowns.Bucket]]
     ],
+    max_entries: t.Optional[int] = None,
+    backend: t.Optional[cooldown_backends.CooldownBackend] = None,
+    namespace: t.Optional[str] = None,
 ) -> t.Callable[[commands.base.CommandLike], commands.base.CommandLike]:
     ...
 
@@ -193,6 +214,11 @@ def add_cooldown(
         t.Callable[[context.base.Context], t.Union[cooldowns.Bucket, t.Coroutine[t.Any, t.Any, cooldowns.Bucket]]]
     ] = None,
     cls: t.Type[cooldowns.CooldownManager] = cooldowns.CooldownManager,
+    algorithm: t.Optional[t.Type[cooldowns.Bucket]] = None,
+    burst: t.Optional[int] = None,
+    max_entries: t.Optional[int] = None,
+    backend: t.Optional[cooldown_backends.CooldownBackend] = None,
+    namespace: t.Optional[str] = None,
 ) -> t.Callable[[commands.base.CommandLike], commands.base.CommandLike]:
     """
     Second order decorator that sets the cooldown manager for a command.
@@ -207,22 +233,85 @@ def add_cooldown(
             that takes the context the command was invoked under and returns the appropriate bucket object to use for
             cooldowns in the context.
         cls (Type[:obj:`~.cooldowns.CooldownManager`]): The cooldown manager class to use. Defaults to
-            :obj:`~.cooldowns.CooldownManager`.
+            :obj:`~.cooldowns.CooldownManager`. :obj:`~.cooldowns.CompactCooldownManager` can only be used with
+            the args length,uses,bucket.
+        algorithm (Optional[Type[:obj:`~.cooldowns.Bucket`]]): The cooldown algorithm to use with the given
+            bucket, one of :obj:`~.cooldowns.SlidingWindowLog`, :obj:`~.cooldowns.SlidingWindowCounter` or
+            :obj:`~.cooldowns.TokenBucket`. Defaults to ``None`` - the fixed window implemented by the bucket.
+        burst (Optional[:obj:`int`]): Maximum number of usages that can be made at once when using the
+            :obj:`~.cooldowns.TokenBucket` algorithm. Defaults to ``None`` - the same as ``uses``.
+        max_entries (Optional[:obj:`int`]): Maximum number of cooldown buckets to store for the command. The least
+            recently used bucket is evicted when exceeded. Defaults to ``None`` - unbounded.
+        backend (Optional[:obj:`~.cooldown_backends.CooldownBackend`]): Backend to store the command's cooldowns in,
+            allowing them to be shared between processes. Backends only implement the fixed window algorithm, so
+            cannot be used with ``algorithm``. Defaults to ``None`` - cooldowns are stored in-process.
+        namespace (Optional[:obj:`str`]): Namespace for the command's keys in the backend. Defaults to ``None`` -
+            the qualified name of the command.
     """
+    if backend is not None and algorithm is not None:
+        raise TypeError("Cooldown backends cannot be used with an algorithm")
+
     getter: t.Callable[[context.base.Context], t.Union[cooldowns.Bucket, t.Coroutine[t.Any, t.Any, cooldowns.Bucket]]]
     if length is not None and uses is not None and bucket is not None:
+        if algorithm is not None:
+            bucket = cooldowns._bucket_with_algorithm(bucket, algorithm)
 
-        def _get_bucket(_: context.base.Context, b: t.Type[cooldowns.Bucket], l: float, u: int) -> cooldowns.Bucket:
-            return b(l, u)
-
-        getter = functools.partial(_get_bucket, b=bucket, l=length, u=uses)
+        if burst is None:
+            getter = cooldowns._StaticBucketFactory(bucket, length, uses)
+        elif issubclass(bucket, cooldowns.TokenBucket):
+            getter = cooldowns._StaticBucketFactory(bucket, length, uses, burst=burst)
+        else:
+            raise TypeError("burst can only be used with the TokenBucket algorithm")
     elif callback is not None:
         getter = callback
     else:
         raise TypeError("Invalid arguments - either provided all of the args length,uses,bucket or the kwarg callback")
 
     def decorate(c_like: commands.base.CommandLike) -> commands.base.CommandLike:
-        c_like.cooldown_manager = cls(getter)
+        if issubclass(cls, cooldowns.CompactCooldownManager):
+            if length is None or uses is None or bucket is None or algorithm or backend or burst is not None:
+                raise TypeError(
+                    "CompactCooldownManager requires the args length,uses,bucket and no algorithm,burst,backend"
+                )
+            c_like.cooldown_manager = cls(length, uses, bucket)
+        else:
+            kwargs: t.Dict[str, t.Any] = {}
+            if max_entries is not None:
+                kwargs["max_entries"] = max_entries
+            if backend is not None:
+                kwargs.update(backend=backend, namespace=namespace)
+            c_like.cooldown_manager = cls(getter, **kwargs)
+        return c_like
+
+    return decorate
+
+
+def set_max_concurrency(
+    limit: int,
+    bucket: t.Type[cooldowns.Bucket],
+    *,
+    wait: bool = False,
+    max_waiting: t.Optional[int] = None,
+    cls: t.Type[concurrency.MaxConcurrencyManager] = concurrency.MaxConcurrencyManager,
+) -> t.Callable[[commands.base.CommandLike], commands.base.CommandLike]:
+    """
+    Second order decorator that limits the number of invocations of a command that can run at the same time.
+
+    Args:
+        limit (:obj:`int`): The maximum number of concurrent invocations per bucket.
+        bucket (Type[:obj:`~.cooldowns.Bucket`]): The bucket to group invocations by.
+
+    Keyword Args:
+        wait (:obj:`bool`): Whether invocations over the limit should wait for a running invocation to finish
+            instead of raising :obj:`~.errors.MaxConcurrencyReached`. Defaults to ``False``.
+        max_waiting (Optional[:obj:`int`]): The maximum number of invocations that can wait per bucket. Defaults
+            to ``None`` - no limit.
+        cls (Type[:obj:`~.concurrency.MaxConcurrencyManager`]): The concurrency manager class to use. Defaults to
+            :obj:`~.concurrency.MaxConcurrencyManager`.
+    """
+
+    def decorate(c_like: commands.base.CommandLike) -> commands.base.CommandLike:
+        c_like.max_concurrency = cls(limit, bucket, wait=wait, max_waiting=max_waiting)
         return c_like
 
     return decorate
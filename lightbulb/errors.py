@@ -23,7 +23,9 @@ __all__ = [
     "CommandNotFound",
     "CommandInvocationError",
     "CommandIsOnCooldown",
+    "MaxConcurrencyReached",
     "ConverterFailure",
+    "AmbiguousArgument",
     "NotEnoughArguments",
     "CheckFailure",
     "InsufficientCache",
@@ -134,6 +136,20 @@ class CommandIsOnCooldown(LightbulbError):
         """The amount of time in seconds remaining until the cooldown expires."""
 
 
+class MaxConcurrencyReached(LightbulbError):
+    """
+    Error raised when a command could not be invoked because the maximum number of concurrent
+    invocations was reached and the invocation could not wait for one to finish.
+    """
+
+    __slots__ = ("limit",)
+
+    def __init__(self, *args: t.Any, limit: int) -> None:
+        super().__init__(*args)
+        self.limit: int = limit
+        """The maximum number of concurrent invocations that was reached."""
+
+
 class ConverterFailure(LightbulbError):
     """
     Error raised when option type conversion fails while prefix command arguments are being parsed.
@@ -147,6 +163,22 @@ class ConverterFailure(LightbulbError):
         """The option that could not be converted."""
 
 
+class AmbiguousArgument(LightbulbError):
+    """
+    Error raised by a converter when an argument matches multiple objects equally well. This will be
+    the ``__cause__`` of the :obj:`~ConverterFailure` raised for the option.
+    """
+
+    __slots__ = ("argument", "candidates")
+
+    def __init__(self, *args: t.Any, argument: str, candidates: t.Sequence[t.Any]) -> None:
+        super().__init__(*args)
+        self.argument: str = argument
+        """The argument which could not be resolved."""
+        self.candidates: t.Sequence[t.Any] = candidates
+        """The objects matching the argument, from best to worst match."""
+
+
 class NotEnoughArguments(LightbulbError):
     """
     Error raised when a prefix command expects more options than could be parsed from the user's input.
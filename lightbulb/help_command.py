@@ -25,7 +25,7 @@ import typing as t
 
 from lightbulb import commands
 from lightbulb import errors
-from lightbulb.utils import nav
+from lightbulb import utils
 
 if t.TYPE_CHECKING:
     from lightbulb import app as app_
@@ -103,6 +103,10 @@ class BaseHelpCommand(abc.ABC):
             return
 
         p_cmd = self.app.get_prefix_command(obj)
+        if p_cmd is None and self.app._lazy_extensions and obj.split():
+            # Help for a lazily loaded command loads its extension, as invoking the command would
+            if await self.app._maybe_load_lazy_extension(obj.split()[0]):
+                p_cmd = self.app.get_prefix_command(obj)
         if p_cmd is not None and not p_cmd.hidden:
             if isinstance(p_cmd, (commands.prefix.PrefixCommandGroup, commands.prefix.PrefixSubGroup)):
                 await self.send_group_help(context, p_cmd)
@@ -281,7 +285,7 @@ class DefaultHelpCommand(BaseHelpCommand):
                 )
             )
 
-        navigator = nav.ButtonNavigator(pages)
+        navigator = utils.nav.ButtonNavigator(pages)
         await navigator.run(context)
 
     async def send_command_help(self, context: context_.base.Context, command: commands.base.Command) -> None:
@@ -17,8 +17,9 @@
 # along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-__all__ = ["serialise_command", "manage_application_commands"]
+__all__ = ["serialise_command", "manage_application_commands", "lazy_exports"]
 
+import importlib
 import logging
 import typing as t
 
@@ -32,6 +33,41 @@ if t.TYPE_CHECKING:
 _LOGGER = logging.getLogger("lightbulb.internal")
 
 
+def lazy_exports(
+    package: str, exports: t.Mapping[str, t.Sequence[str]]
+) -> t.Tuple[t.Callable[[str], t.Any], t.Callable[[], t.List[str]]]:
+    """
+    Create module-level ``__getattr__`` and ``__dir__`` functions for a package so that its submodules,
+    and the names they export, are only imported the first time they are accessed.
+
+    Args:
+        package (:obj:`str`): The ``__name__`` of the package.
+        exports (Mapping[:obj:`str`, Sequence[:obj:`str`]]): Mapping of submodule name to the names that
+            the submodule exports. This should match the submodule's ``__all__``.
+
+    Returns:
+        Tuple[Callable[[:obj:`str`], Any], Callable[[], List[:obj:`str`]]]: The ``__getattr__`` and ``__dir__``
+            functions for the package.
+    """
+    module_for_name = {name: module for module, names in exports.items() for name in names}
+    package_globals = vars(importlib.import_module(package))
+
+    def __getattr__(name: str) -> t.Any:
+        if name in exports:
+            # Importing a submodule binds it as an attribute of the package
+            return importlib.import_module(f"{package}.{name}")
+        if (module := module_for_name.get(name)) is not None:
+            value = getattr(importlib.import_module(f"{package}.{module}"), name)
+            package_globals[name] = value
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> t.List[str]:
+        return sorted({*package_globals, *exports, *module_for_name})
+
+    return __getattr__, __dir__
+
+
 class _GuildIDCollection:
     __slots__ = ("ids",)
 
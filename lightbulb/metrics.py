@@ -0,0 +1,501 @@
+# -*- coding: utf-8 -*-
+# Copyright © tandemdude 2020-present
+#
+# This file is part of Lightbulb.
+#
+# Lightbulb is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Lightbulb is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "InvocationPhase",
+    "Histogram",
+    "HistogramSnapshot",
+    "CommandMetricsSnapshot",
+    "MetricsSnapshot",
+    "MetricsCollector",
+    "render_prometheus",
+    "PrometheusExporter",
+]
+
+import asyncio
+import bisect
+import dataclasses
+import enum
+import logging
+import time
+import typing as t
+
+from lightbulb import errors
+
+DEFAULT_BUCKETS: t.Final[t.Tuple[float, ...]] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Default histogram bucket upper bounds, in seconds."""
+
+_LOGGER = logging.getLogger("lightbulb.metrics")
+
+
+class InvocationPhase(enum.Enum):
+    """Enum representing the phases of a command invocation that are timed."""
+
+    PREFIX_RESOLUTION = "prefix_resolution"
+    """Resolving the prefix and command name from a message. This is not recorded per command."""
+    CONTEXT_BUILD = "context_build"
+    """Creating the context (and parser, for prefix commands) for the invocation."""
+    PARSING = "parsing"
+    """Parsing and converting the arguments for a prefix command."""
+    CHECKS = "checks"
+    """Evaluating the command's checks."""
+    COOLDOWNS = "cooldowns"
+    """Evaluating the command's cooldown."""
+    CALLBACK = "callback"
+    """Running the command's callback. This includes any time spent waiting for a concurrency slot."""
+    ERROR_HANDLING = "error_handling"
+    """Handling an error raised during the invocation."""
+
+
+@dataclasses.dataclass(frozen=True)
+class HistogramSnapshot:
+    """Point-in-time copy of the data held by a :obj:`~Histogram`."""
+
+    buckets: t.Tuple[float, ...]
+    """The upper bounds of the histogram's buckets, in seconds."""
+    counts: t.Tuple[int, ...]
+    """Number of observations per bucket. This has one more item than ``buckets`` - observations
+    larger than the largest bucket bound."""
+    sum: float
+    """Sum of all the observations."""
+    count: int
+    """Number of observations."""
+
+
+class Histogram:
+    """
+    Histogram with fixed bucket bounds.
+
+    Args:
+        buckets (Sequence[:obj:`float`]): The upper bounds of the buckets. These must be sorted in ascending order.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: t.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: t.Tuple[float, ...] = tuple(buckets)
+        self.counts: t.List[int] = [0] * (len(self.buckets) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Record a single observation.
+
+        Args:
+            value (:obj:`float`): The value to record.
+
+        Returns:
+            ``None``
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> HistogramSnapshot:
+        """
+        Get a copy of the histogram's current data.
+
+        Returns:
+            :obj:`~HistogramSnapshot`: Copy of the histogram's data.
+        """
+        return HistogramSnapshot(self.buckets, tuple(self.counts), self.sum, self.count)
+
+
+@dataclasses.dataclass(frozen=True)
+class CommandMetricsSnapshot:
+    """Point-in-time copy of the metrics recorded for a single command."""
+
+    invocations: int
+    """Number of times the command was invoked."""
+    errors: t.Mapping[str, int]
+    """Mapping of error class name to number of invocations that raised that error."""
+    check_failures: int
+    """Number of invocations rejected because a check failed."""
+    cooldown_rejections: int
+    """Number of invocations rejected because the command was on cooldown."""
+    phases: t.Mapping[InvocationPhase, HistogramSnapshot]
+    """Mapping of invocation phase to the latency histogram for that phase."""
+
+
+@dataclasses.dataclass(frozen=True)
+class MetricsSnapshot:
+    """Point-in-time copy of all the metrics recorded by a :obj:`~MetricsCollector`."""
+
+    commands: t.Mapping[str, CommandMetricsSnapshot]
+    """Mapping of command qualified name to the metrics for that command."""
+    phases: t.Mapping[InvocationPhase, HistogramSnapshot]
+    """Mapping of invocation phase to latency histogram for phases not attributable to a single command."""
+    errors: t.Mapping[str, int]
+    """
+    Mapping of error class name to count for errors not attributable to a single command. These are rendered
+    with an empty ``command`` label.
+    """
+
+
+class _CommandMetrics:
+    __slots__ = ("invocations", "errors", "check_failures", "cooldown_rejections", "phases")
+
+    def __init__(self) -> None:
+        self.invocations: int = 0
+        self.errors: t.Dict[str, int] = {}
+        self.check_failures: int = 0
+        self.cooldown_rejections: int = 0
+        self.phases: t.Dict[InvocationPhase, Histogram] = {}
+
+
+class _PhaseTimer:
+    __slots__ = ("_collector", "_qualname", "_phase", "_start")
+
+    def __init__(self, collector: MetricsCollector, qualname: t.Optional[str], phase: InvocationPhase) -> None:
+        self._collector = collector
+        self._qualname = qualname
+        self._phase = phase
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *_: t.Any) -> None:
+        self._collector.observe(self._qualname, self._phase, time.perf_counter() - self._start)
+
+
+class MetricsCollector:
+    """
+    Collects invocation counts, error counts and per-phase latency histograms for commands. Pass an instance
+    to :obj:`~.app.BotApp` using the ``metrics`` kwarg to enable collection, and use
+    :obj:`~.app.BotApp.metrics_snapshot` to retrieve the collected data.
+
+    Args:
+        buckets (Sequence[:obj:`float`]): The upper bounds, in seconds, of the buckets to use for
+            the latency histograms. Defaults to :obj:`~DEFAULT_BUCKETS`.
+    """
+
+    __slots__ = ("buckets", "_commands", "_phases", "_errors")
+
+    def __init__(self, buckets: t.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: t.Tuple[float, ...] = tuple(sorted(buckets))
+        """The upper bounds of the buckets used for the latency histograms."""
+        self._commands: t.Dict[str, _CommandMetrics] = {}
+        self._phases: t.Dict[InvocationPhase, Histogram] = {}
+        self._errors: t.Dict[str, int] = {}
+
+    def _get_command(self, qualname: str) -> _CommandMetrics:
+        metrics = self._commands.get(qualname)
+        if metrics is None:
+            metrics = self._commands[qualname] = _CommandMetrics()
+        return metrics
+
+    def observe(self, qualname: t.Optional[str], phase: InvocationPhase, seconds: float) -> None:
+        """
+        Record the time taken by a phase of an invocation.
+
+        Args:
+            qualname (Optional[:obj:`str`]): Qualified name of the command the phase belongs to, or ``None``
+                if the phase is not attributable to a single command.
+            phase (:obj:`~InvocationPhase`): The phase that was timed.
+            seconds (:obj:`float`): The time taken, in seconds.
+
+        Returns:
+            ``None``
+        """
+        phases = self._phases if qualname is None else self._get_command(qualname).phases
+        histogram = phases.get(phase)
+        if histogram is None:
+            histogram = phases[phase] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def time(self, qualname: t.Optional[str], phase: InvocationPhase) -> t.ContextManager[None]:
+        """
+        Get a context manager which records the time spent inside it as the given phase.
+
+        Args:
+            qualname (Optional[:obj:`str`]): Qualified name of the command the phase belongs to, or ``None``
+                if the phase is not attributable to a single command.
+            phase (:obj:`~InvocationPhase`): The phase being timed.
+
+        Returns:
+            ContextManager[``None``]: Context manager timing the phase.
+        """
+        return _PhaseTimer(self, qualname, phase)
+
+    def record_invocation(self, qualname: str) -> None:
+        """
+        Increment the invocation counter for a command.
+
+        Args:
+            qualname (:obj:`str`): Qualified name of the command that was invoked.
+
+        Returns:
+            ``None``
+        """
+        self._get_command(qualname).invocations += 1
+
+    def record_error(self, qualname: t.Optional[str], error: BaseException) -> None:
+        """
+        Increment the error counter for a command. Errors are counted under the name of their concrete class -
+        :obj:`~.errors.CommandInvocationError` is counted under the name of the original error, and a
+        :obj:`~.errors.CheckFailure` raised because a check raised a more specific check failure (e.g.
+        :obj:`~.errors.NotOwner`) is counted under the name of that error. :obj:`~.errors.CheckFailure` and
+        :obj:`~.errors.CommandIsOnCooldown` errors are additionally counted as check failures and cooldown
+        rejections respectively.
+
+        Args:
+            qualname (Optional[:obj:`str`]): Qualified name of the command that raised the error, or ``None`` if
+                the error is not attributable to a single command (e.g. :obj:`~.errors.CommandNotFound`).
+            error (:obj:`BaseException`): The error that was raised.
+
+        Returns:
+            ``None``
+        """
+        name = _error_name(error)
+        if qualname is None:
+            self._errors[name] = self._errors.get(name, 0) + 1
+            return
+
+        metrics = self._get_command(qualname)
+        metrics.errors[name] = metrics.errors.get(name, 0) + 1
+        if isinstance(error, errors.CheckFailure):
+            metrics.check_failures += 1
+        elif isinstance(error, errors.CommandIsOnCooldown):
+            metrics.cooldown_rejections += 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        """
+        Get a copy of all the metrics collected so far.
+
+        Returns:
+            :obj:`~MetricsSnapshot`: Copy of the collected metrics.
+        """
+        return MetricsSnapshot(
+            commands={
+                qualname: CommandMetricsSnapshot(
+                    invocations=metrics.invocations,
+                    errors=dict(metrics.errors),
+                    check_failures=metrics.check_failures,
+                    cooldown_rejections=metrics.cooldown_rejections,
+                    phases={phase: hist.snapshot() for phase, hist in metrics.phases.items()},
+                )
+                for qualname, metrics in self._commands.items()
+            },
+            phases={phase: hist.snapshot() for phase, hist in self._phases.items()},
+            errors=dict(self._errors),
+        )
+
+    def reset(self) -> None:
+        """
+        Discard all the metrics collected so far.
+
+        Returns:
+            ``None``
+        """
+        self._commands.clear()
+        self._phases.clear()
+        self._errors.clear()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _error_name(error: BaseException) -> str:
+    if isinstance(error, errors.CommandInvocationError):
+        return type(error.original).__name__
+    if type(error) is errors.CheckFailure and isinstance(error.__cause__, errors.CheckFailure):
+        return type(error.__cause__).__name__
+    return type(error).__name__
+
+
+def _format_labels(labels: t.Sequence[t.Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _render_histogram(
+    lines: t.List[str], name: str, labels: t.Sequence[t.Tuple[str, str]], histogram: HistogramSnapshot
+) -> None:
+    cumulative = 0
+    for bound, count in zip((*histogram.buckets, float("inf")), histogram.counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{_format_labels((*labels, ('le', _format_value(bound))))} {cumulative}")
+    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+    lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+
+def render_prometheus(snapshot: MetricsSnapshot) -> str:
+    """
+    Render a metrics snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot (:obj:`~MetricsSnapshot`): The snapshot to render.
+
+    Returns:
+        :obj:`str`: The rendered metrics.
+    """
+    lines: t.List[str] = []
+    commands = sorted(snapshot.commands.items())
+
+    lines.append("# HELP lightbulb_command_invocations_total Number of command invocations.")
+    lines.append("# TYPE lightbulb_command_invocations_total counter")
+    for qualname, metrics in commands:
+        lines.append(
+            f"lightbulb_command_invocations_total{_format_labels((('command', qualname),))} {metrics.invocations}"
+        )
+
+    lines.append("# HELP lightbulb_command_errors_total Number of command invocations that raised an error.")
+    lines.append("# TYPE lightbulb_command_errors_total counter")
+    for qualname, metrics in commands:
+        for error, count in sorted(metrics.errors.items()):
+            labels = (("command", qualname), ("error", error))
+            lines.append(f"lightbulb_command_errors_total{_format_labels(labels)} {count}")
+    for error, count in sorted(snapshot.errors.items()):
+        # Errors not attributable to a command use an empty label so every series has the same label set
+        labels = (("command", ""), ("error", error))
+        lines.append(f"lightbulb_command_errors_total{_format_labels(labels)} {count}")
+
+    lines.append("# HELP lightbulb_command_check_failures_total Number of command invocations rejected by a check.")
+    lines.append("# TYPE lightbulb_command_check_failures_total counter")
+    for qualname, metrics in commands:
+        labels = (("command", qualname),)
+        lines.append(f"lightbulb_command_check_failures_total{_format_labels(labels)} {metrics.check_failures}")
+
+    lines.append(
+        "# HELP lightbulb_command_cooldown_rejections_total Number of command invocations rejected by a cooldown."
+    )
+    lines.append("# TYPE lightbulb_command_cooldown_rejections_total counter")
+    for qualname, metrics in commands:
+        labels = (("command", qualname),)
+        lines.append(
+            f"lightbulb_command_cooldown_rejections_total{_format_labels(labels)} {metrics.cooldown_rejections}"
+        )
+
+    lines.append("# HELP lightbulb_command_phase_duration_seconds Time spent in each phase of command invocations.")
+    lines.append("# TYPE lightbulb_command_phase_duration_seconds histogram")
+    for qualname, metrics in commands:
+        for phase, histogram in metrics.phases.items():
+            labels = (("command", qualname), ("phase", phase.value))
+            _render_histogram(lines, "lightbulb_command_phase_duration_seconds", labels, histogram)
+    for phase, histogram in snapshot.phases.items():
+        labels = (("command", ""), ("phase", phase.value))
+        _render_histogram(lines, "lightbulb_command_phase_duration_seconds", labels, histogram)
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+class PrometheusExporter:
+    """
+    Minimal HTTP server exposing the metrics recorded by a :obj:`~MetricsCollector` in the Prometheus
+    text exposition format. Any ``GET`` request path is answered with the current metrics, so the server
+    should only be bound to an interface that the scraper can reach.
+
+    You will not usually need to create this yourself - pass ``metrics_port`` to :obj:`~.app.BotApp`
+    and it will be started and stopped alongside the bot.
+
+    Args:
+        collector (:obj:`~MetricsCollector`): The collector to export the metrics of.
+        port (:obj:`int`): The port to listen on.
+        host (:obj:`str`): The host to listen on. Defaults to ``127.0.0.1``.
+    """
+
+    __slots__ = ("collector", "host", "port", "_server")
+
+    def __init__(self, collector: MetricsCollector, port: int, host: str = "127.0.0.1") -> None:
+        self.collector = collector
+        """The collector whose metrics are exported."""
+        self.host = host
+        """The host the server listens on."""
+        self.port = port
+        """The port the server listens on."""
+        self._server: t.Optional[asyncio.AbstractServer] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the server is currently running."""
+        return self._server is not None
+
+    async def start(self) -> None:
+        """
+        Start the server. This does nothing if the server is already running.
+
+        Returns:
+            ``None``
+        """
+        if self._server is not None:
+            return
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        _LOGGER.info("serving prometheus metrics on http://%s:%s/metrics", self.host, self.port)
+
+    async def close(self) -> None:
+        """
+        Stop the server. This does nothing if the server is not running.
+
+        Returns:
+            ``None``
+        """
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=10)
+            method = request.split(b" ", 1)[0]
+            if method not in (b"GET", b"HEAD"):
+                status, body = "405 Method Not Allowed", b""
+            else:
+                status, body = "200 OK", render_prometheus(self.collector.snapshot()).encode("utf-8")
+
+            headers = (
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            )
+            writer.write(headers.encode("ascii") + (body if method == b"GET" else b""))
+            await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
@@ -24,7 +24,7 @@ from collections import defaultdict
 
 import hikari
 
-from lightbulb.utils import data_store
+from lightbulb import utils
 
 if t.TYPE_CHECKING:
     from lightbulb import app as app_
@@ -63,13 +63,13 @@ class Plugin:
         """The plugin's name."""
         self.description = description or ""
         """The plugin's description."""
-        self.d: t.Optional[data_store.DataStore] = None
+        self.d: t.Optional[utils.data_store.DataStore] = None
         """A :obj:`~.utils.data_store.DataStore` instance enabling storage of custom data without subclassing.
         This will be ``None`` unless you explicitly specify you want the data storage instance included by passing
         in the kwarg ``include_datastore=True`` to the constructor.
         """
         if include_datastore:
-            self.d = data_store.DataStore()
+            self.d = utils.data_store.DataStore()
 
         self._raw_commands: t.List[commands.base.CommandLike] = []
         self._all_commands: t.List[commands.base.Command] = []
@@ -285,3 +285,5 @@ class Plugin:
             ``None``
         """
         self._checks.extend(checks)
+        if self._app is not None:
+            self._app.invalidate_check_chains()
@@ -15,15 +15,45 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
-from lightbulb.utils import data_store
-from lightbulb.utils import nav
-from lightbulb.utils import pag
-from lightbulb.utils import parser
-from lightbulb.utils import permissions
-from lightbulb.utils import search
-from lightbulb.utils.data_store import *
-from lightbulb.utils.nav import *
-from lightbulb.utils.pag import *
-from lightbulb.utils.parser import *
-from lightbulb.utils.permissions import *
-from lightbulb.utils.search import *
+import typing as t
+
+from lightbulb import internal
+
+if t.TYPE_CHECKING:
+    from lightbulb.utils import data_store
+    from lightbulb.utils import nav
+    from lightbulb.utils import pag
+    from lightbulb.utils import parser
+    from lightbulb.utils import permissions
+    from lightbulb.utils import search
+    from lightbulb.utils.data_store import *
+    from lightbulb.utils.nav import *
+    from lightbulb.utils.pag import *
+    from lightbulb.utils.parser import *
+    from lightbulb.utils.permissions import *
+    from lightbulb.utils.search import *
+
+# Submodules are imported on first access, as most bots only use a few of them.
+# The exported names must match the __all__ of each submodule, which is checked by the test suite.
+_EXPORTS: t.Final[t.Mapping[str, t.Sequence[str]]] = {
+    "data_store": ["DataStore"],
+    "nav": [
+        "ReactionNavigator",
+        "ButtonNavigator",
+        "ReactionButton",
+        "ComponentButton",
+        "next_page",
+        "prev_page",
+        "first_page",
+        "last_page",
+        "stop",
+    ],
+    "pag": ["StringPaginator", "EmbedPaginator", "Paginator"],
+    "parser": ["BaseParser", "Parser"],
+    "permissions": ["permissions_for", "permissions_in", "permissions_in_bulk", "PermissionCache"],
+    "search": ["get", "find", "SearchIndex", "NameIndex", "NameMatch"],
+}
+
+__all__ = [*_EXPORTS, *(name for names in _EXPORTS.values() for name in names)]
+
+__getattr__, __dir__ = internal.lazy_exports(__name__, _EXPORTS)
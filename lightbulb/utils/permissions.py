@@ -17,10 +17,14 @@
 # along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-__all__ = ["permissions_for", "permissions_in"]
+__all__ = ["permissions_for", "permissions_in", "permissions_in_bulk", "PermissionCache"]
+
+import typing as t
 
 import hikari
 
+_RolesKeyT = t.Tuple[int, ...]
+
 
 def permissions_for(member: hikari.Member) -> hikari.Permissions:
     """
@@ -47,7 +51,11 @@ def permissions_for(member: hikari.Member) -> hikari.Permissions:
 
 
 def permissions_in(
-    channel: hikari.GuildChannel, member: hikari.Member, include_guild_permissions: bool = True
+    channel: hikari.GuildChannel,
+    member: hikari.Member,
+    include_guild_permissions: bool = True,
+    *,
+    guild_permissions: t.Optional[hikari.Permissions] = None,
 ) -> hikari.Permissions:
     """
     Get the permissions for the given member in the given guild channel.
@@ -58,15 +66,38 @@ def permissions_in(
         include_guild_permissions (:obj:`bool`): Whether or not to include the member's guild permissions. If ``False``,
             only permissions granted by overwrites will be included. Defaults to ``True``.
 
+    Keyword Args:
+        guild_permissions (Optional[:obj:`hikari.Permissions`]): The member's guild permissions, if they have already
+            been calculated using :obj:`~permissions_for`. Defaults to ``None`` - they will be calculated if required.
+
     Returns:
         :obj:`hikari.Permissions`: Member's permissions in the given channel.
     """
+    permissions = _role_permissions_in(channel, member, include_guild_permissions, guild_permissions)
+    if permissions is None:
+        return hikari.Permissions.all_permissions()
+
+    if overwrite_member := channel.permission_overwrites.get(member.id):
+        permissions &= ~overwrite_member.deny
+        permissions |= overwrite_member.allow
+
+    return permissions
+
+
+def _role_permissions_in(
+    channel: hikari.GuildChannel,
+    member: hikari.Member,
+    include_guild_permissions: bool,
+    guild_permissions: t.Optional[hikari.Permissions] = None,
+) -> t.Optional[hikari.Permissions]:
+    # Permissions in the channel before applying the member's own overwrite, which only depend on the
+    # member's roles. Returns None if the member is an administrator.
     allowed_perms = hikari.Permissions.NONE
     if include_guild_permissions:
-        allowed_perms |= permissions_for(member)
+        allowed_perms |= guild_permissions if guild_permissions is not None else permissions_for(member)
 
     if hikari.Permissions.ADMINISTRATOR in allowed_perms:
-        return hikari.Permissions.all_permissions()
+        return None
 
     overwrites = channel.permission_overwrites
 
@@ -84,9 +115,155 @@ def permissions_in(
 
     permissions &= ~deny
     permissions |= allow
+    return permissions
 
-    if overwrite_member := overwrites.get(member.id):
-        permissions &= ~overwrite_member.deny
-        permissions |= overwrite_member.allow
 
-    return permissions
+def permissions_in_bulk(
+    channel: hikari.GuildChannel, members: t.Iterable[hikari.Member], include_guild_permissions: bool = True
+) -> t.Iterator[t.Tuple[hikari.Member, hikari.Permissions]]:
+    """
+    Get the permissions for each of the given members in the given guild channel. This is equivalent to
+    calling :obj:`~permissions_in` for each member, but the roles and overwrites are only resolved once for
+    each distinct set of roles, so it is much faster for large numbers of members.
+
+    Members are consumed lazily, so this can be used with a large iterable of members without first
+    collecting them into a list.
+
+    Args:
+        channel (:obj:`hikari.GuildChannel`): Channel to get the permissions in.
+        members (Iterable[:obj:`hikari.Member`]): Members to get the permissions for.
+        include_guild_permissions (:obj:`bool`): Whether or not to include the members' guild permissions. If
+            ``False``, only permissions granted by overwrites will be included. Defaults to ``True``.
+
+    Returns:
+        Iterator[Tuple[:obj:`hikari.Member`, :obj:`hikari.Permissions`]]: Iterator of each member and their
+            permissions in the channel, in the order the members were given.
+    """
+    overwrites = channel.permission_overwrites
+    all_permissions = hikari.Permissions.all_permissions()
+    by_roles: t.Dict[_RolesKeyT, t.Optional[hikari.Permissions]] = {}
+    for member in members:
+        roles = tuple(sorted(member.role_ids))
+        if roles in by_roles:
+            permissions = by_roles[roles]
+        else:
+            permissions = by_roles[roles] = _role_permissions_in(channel, member, include_guild_permissions)
+
+        if permissions is None:
+            yield member, all_permissions
+        elif overwrite_member := overwrites.get(member.id):
+            yield member, (permissions & ~overwrite_member.deny) | overwrite_member.allow
+        else:
+            yield member, permissions
+
+
+class _GuildPermissions:
+    __slots__ = ("guild", "channels")
+
+    def __init__(self) -> None:
+        self.guild: t.Dict[_RolesKeyT, hikari.Permissions] = {}
+        self.channels: t.Dict[int, t.Dict[t.Tuple[_RolesKeyT, t.Optional[int], bool], hikari.Permissions]] = {}
+
+
+class PermissionCache:
+    """
+    Cache of the results of :obj:`~permissions_for` and :obj:`~permissions_in`. Results are keyed by the
+    member's set of roles instead of by member, so members with the same roles share a single result. Results
+    in a channel are only keyed by member if the channel has a permission overwrite for that member.
+
+    Cached results are not updated automatically - :obj:`~PermissionCache.clear_guild` must be called when
+    a guild's roles change, and :obj:`~PermissionCache.clear_channel` when a channel's overwrites change.
+    The :obj:`~.app.BotApp` does this automatically for its :obj:`~.app.BotApp.permission_cache`. Changes
+    to a member's roles change the key used, so do not need the cache to be cleared.
+    """
+
+    __slots__ = ("_guilds",)
+
+    def __init__(self) -> None:
+        self._guilds: t.Dict[int, _GuildPermissions] = {}
+
+    def _for_guild(self, guild_id: int) -> _GuildPermissions:
+        if (guild := self._guilds.get(guild_id)) is None:
+            guild = self._guilds[guild_id] = _GuildPermissions()
+        return guild
+
+    def permissions_for(self, member: hikari.Member) -> hikari.Permissions:
+        """
+        Get the guild permissions for the given member, using the cached result for the member's
+        roles if there is one. See :obj:`~permissions_for`.
+
+        Args:
+            member (:obj:`hikari.Member`): Member to get permissions for.
+
+        Returns:
+            :obj:`hikari.Permissions`: Member's guild permissions.
+        """
+        cached = self._for_guild(member.guild_id).guild
+        roles = tuple(sorted(member.role_ids))
+        if (perms := cached.get(roles)) is None:
+            perms = cached[roles] = permissions_for(member)
+        return perms
+
+    def permissions_in(
+        self, channel: hikari.GuildChannel, member: hikari.Member, include_guild_permissions: bool = True
+    ) -> hikari.Permissions:
+        """
+        Get the permissions for the given member in the given guild channel, using the cached result for the
+        member's roles if there is one. See :obj:`~permissions_in`.
+
+        Args:
+            channel (:obj:`hikari.GuildChannel`): Channel to get the permissions in.
+            member (:obj:`hikari.Member`): Member to get the permissions for.
+            include_guild_permissions (:obj:`bool`): Whether or not to include the member's guild permissions.
+                Defaults to ``True``.
+
+        Returns:
+            :obj:`hikari.Permissions`: Member's permissions in the given channel.
+        """
+        guild = self._for_guild(channel.guild_id)
+        if (cached := guild.channels.get(channel.id)) is None:
+            cached = guild.channels[channel.id] = {}
+
+        member_id = member.id if member.id in channel.permission_overwrites else None
+        key = (tuple(sorted(member.role_ids)), member_id, include_guild_permissions)
+        if (perms := cached.get(key)) is None:
+            guild_perms = self.permissions_for(member) if include_guild_permissions else None
+            perms = cached[key] = permissions_in(
+                channel, member, include_guild_permissions, guild_permissions=guild_perms
+            )
+        return perms
+
+    def clear_guild(self, guild_id: int) -> None:
+        """
+        Remove all cached results for the given guild, including those for its channels.
+
+        Args:
+            guild_id (:obj:`int`): ID of the guild to remove cached results for.
+
+        Returns:
+            ``None``
+        """
+        self._guilds.pop(guild_id, None)
+
+    def clear_channel(self, guild_id: int, channel_id: int) -> None:
+        """
+        Remove all cached results for the given channel.
+
+        Args:
+            guild_id (:obj:`int`): ID of the guild that the channel is in.
+            channel_id (:obj:`int`): ID of the channel to remove cached results for.
+
+        Returns:
+            ``None``
+        """
+        if (guild := self._guilds.get(guild_id)) is not None:
+            guild.channels.pop(channel_id, None)
+
+    def clear(self) -> None:
+        """
+        Remove all cached results.
+
+        Returns:
+            ``None``
+        """
+        self._guilds.clear()
@@ -17,11 +17,15 @@
 # along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-__all__ = ["get", "find"]
+__all__ = ["get", "find", "SearchIndex", "NameIndex", "NameMatch"]
 
+import bisect
+import itertools
 import typing as t
 from operator import attrgetter
 
+import hikari
+
 T = t.TypeVar("T")
 
 
@@ -47,10 +51,20 @@ def get(sequence: t.Iterable[T], **attrs: t.Any) -> t.Optional[T]:
     See Also:
         :obj:`~find`
     """
-    flattened = [(attrgetter(attr), value) for attr, value in attrs.items()]
+    if len(attrs) == 1:
+        [(attr, value)] = attrs.items()
+        getter = attrgetter(attr)
+        for item in sequence:
+            if getter(item) == value:
+                return item
+        return None
 
+    flattened = tuple((attrgetter(attr), value) for attr, value in attrs.items())
     for item in sequence:
-        if all([getter(item) == value for getter, value in flattened]):
+        for getter, value in flattened:
+            if getter(item) != value:
+                break
+        else:
             return item
     return None
 
@@ -80,3 +94,806 @@ def find(sequence: t.Iterable[T], predicate: t.Callable[[T], bool]) -> t.Optiona
         if predicate(item):
             return item
     return None
+
+
+class SearchIndex(t.Generic[T]):
+    """
+    Index over a collection of items, allowing items to be looked up by the value of the given attributes
+    without scanning the entire collection. Items are identified by a key, which defaults to their ``id``
+    attribute; adding an item with the same key as an existing item replaces it.
+
+    Indexes for cached guild members, channels, roles and emojis which are kept up to date from gateway
+    events can be created using :obj:`~SearchIndex.for_members`, :obj:`~SearchIndex.for_channels`,
+    :obj:`~SearchIndex.for_roles` and :obj:`~SearchIndex.for_emojis`.
+
+    Args:
+        *attrs (:obj:`str`): Attributes to index the items by. Dotted names such as ``user.username`` are supported.
+
+    Keyword Args:
+        items (Iterable[ T ]): Items to initially add to the index. Defaults to an empty tuple.
+        key (Callable[ [ T ], Hashable ]): Function returning the key for an item. Defaults to the item's ``id``
+            attribute.
+
+    Example:
+        Searching for a role with a specific name.
+
+        .. code-block:: python
+
+            index = lightbulb.utils.SearchIndex.for_roles(bot, guild_id, "name")
+            role = index.get(name="foo")
+    """
+
+    __slots__ = ("attrs", "_getters", "_key", "_items", "_index", "_source", "_app", "_listeners")
+
+    def __init__(
+        self, *attrs: str, items: t.Iterable[T] = (), key: t.Callable[[T], t.Hashable] = attrgetter("id")
+    ) -> None:
+        self.attrs: t.Tuple[str, ...] = attrs
+        """The attributes that the items are indexed by."""
+        self._getters = {attr: attrgetter(attr) for attr in attrs}
+        self._key = key
+        self._items: t.Dict[t.Hashable, T] = {}
+        # Attribute -> value -> items with that value, keyed by the item's key so that they can be replaced
+        self._index: t.Dict[str, t.Dict[t.Any, t.Dict[t.Hashable, T]]] = {attr: {} for attr in attrs}
+        self._source: t.Optional[t.Callable[[], t.Iterable[T]]] = None
+        self._app: t.Optional[hikari.GatewayBot] = None
+        self._listeners: t.List[t.Tuple[t.Type[t.Any], t.Callable[[t.Any], t.Coroutine[t.Any, t.Any, None]]]] = []
+        self.update(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> t.Iterator[T]:
+        return iter(self._items.values())
+
+    def __contains__(self, key: t.Hashable) -> bool:
+        return key in self._items
+
+    def add(self, item: T) -> None:
+        """
+        Add an item to the index, replacing any existing item with the same key.
+
+        Args:
+            item (T): Item to add.
+
+        Returns:
+            ``None``
+        """
+        key = self._key(item)
+        old = self._items.get(key)
+        self._items[key] = item
+        for attr, getter in self._getters.items():
+            values, value = self._index[attr], getter(item)
+            if old is not None and (old_value := getter(old)) != value:
+                self._unindex(values, old_value, key)
+            values.setdefault(value, {})[key] = item
+
+    def update(self, items: t.Iterable[T]) -> None:
+        """
+        Add each of the given items to the index, replacing any existing items with the same keys.
+
+        Args:
+            items (Iterable[ T ]): Items to add.
+
+        Returns:
+            ``None``
+        """
+        for item in items:
+            self.add(item)
+
+    def remove(self, key: t.Hashable) -> t.Optional[T]:
+        """
+        Remove the item with the given key from the index.
+
+        Args:
+            key (Hashable): Key of the item to remove.
+
+        Returns:
+            Optional[ T ]: The removed item, or ``None`` if there was no item with the given key.
+        """
+        item = self._items.pop(key, None)
+        if item is not None:
+            for attr, getter in self._getters.items():
+                self._unindex(self._index[attr], getter(item), key)
+        return item
+
+    @staticmethod
+    def _unindex(values: t.Dict[t.Any, t.Dict[t.Hashable, T]], value: t.Any, key: t.Hashable) -> None:
+        items = values[value]
+        del items[key]
+        if not items:
+            del values[value]
+
+    def clear(self) -> None:
+        """
+        Remove all items from the index.
+
+        Returns:
+            ``None``
+        """
+        self._items.clear()
+        for values in self._index.values():
+            values.clear()
+
+    def rebuild(self) -> None:
+        """
+        Replace the contents of the index with the current contents of the cache view that it was created
+        for. Does nothing if the index was not created for a cache view.
+
+        Returns:
+            ``None``
+        """
+        if self._source is not None:
+            self.clear()
+            self.update(self._source())
+
+    def get(self, **attrs: t.Any) -> t.Optional[T]:
+        """
+        Get an item matching all the parameters specified, or return ``None`` if no matching item was
+        found. Parameters for indexed attributes are resolved using the index, and any other parameters are
+        checked against only the items which matched them. If none of the parameters are for indexed attributes,
+        all items are searched.
+
+        Keyword Args:
+            **attrs: Attributes to match.
+
+        Returns:
+            Optional[ T ]: The first matching item that was added to the index, or ``None``.
+
+        See Also:
+            :obj:`~get`
+        """
+        candidates: t.Optional[t.Dict[t.Hashable, T]] = None
+        for attr, value in attrs.items():
+            if (values := self._index.get(attr)) is None:
+                continue
+            try:
+                items = values.get(value)
+            except TypeError:
+                # Unhashable values can't be looked up, but may still compare equal to an item's value
+                continue
+            if items is None:
+                return None
+            if candidates is None or len(items) < len(candidates):
+                candidates = items
+
+        if candidates is None:
+            candidates = self._items
+        elif len(attrs) == 1:
+            return next(iter(candidates.values()))
+        return get(candidates.values(), **attrs)
+
+    def find(self, predicate: t.Callable[[T], bool]) -> t.Optional[T]:
+        """
+        Find the first item in the index that passes for the predicate specified, or return ``None`` if
+        no matching item was found. This searches all items.
+
+        Args:
+            predicate (Callable[ [ T ], :obj:`bool` ]): Function to evaluate if the item is the correct one or not.
+
+        Returns:
+            Optional[ T ]: The first matching item that was added to the index, or ``None``.
+
+        See Also:
+            :obj:`~find`
+        """
+        return find(self._items.values(), predicate)
+
+    def close(self) -> None:
+        """
+        Stop keeping the index up to date from gateway events. Does nothing if the index was not
+        created for a cache view.
+
+        Returns:
+            ``None``
+        """
+        if self._app is not None:
+            for event_type, listener in self._listeners:
+                self._app.unsubscribe(event_type, listener)
+        self._app, self._listeners = None, []
+
+    def _bind(
+        self,
+        app: hikari.GatewayBot,
+        guild_id: hikari.Snowflakeish,
+        source: t.Callable[[], t.Iterable[T]],
+        handlers: t.Mapping[t.Type[hikari.Event], t.Callable[[t.Any], object]],
+    ) -> None:
+        # Populates the index from the given cache view and keeps it up to date from events for the guild
+        self._source, self._app = source, app
+        self.rebuild()
+        handlers = {
+            **handlers,
+            # The cache is repopulated when the guild becomes available again after an outage or reconnect,
+            # or when the bot rejoins the guild
+            hikari.GuildAvailableEvent: lambda _: self.rebuild(),
+            hikari.GuildJoinEvent: lambda _: self.rebuild(),
+            hikari.GuildLeaveEvent: lambda _: self.clear(),
+        }
+        for event_type, handler in handlers.items():
+            self._subscribe(app, event_type, int(guild_id), handler)
+
+    def _subscribe(
+        self,
+        app: hikari.GatewayBot,
+        event_type: t.Type[hikari.Event],
+        guild_id: int,
+        handler: t.Callable[[t.Any], object],
+    ) -> None:
+        # Every event handled has a guild_id, but they don't share a base class which declares it
+        async def listener(event: t.Any) -> None:
+            if event.guild_id == guild_id:
+                handler(event)
+
+        app.subscribe(event_type, listener)
+        self._listeners.append((event_type, listener))
+
+    @classmethod
+    def for_members(
+        cls: t.Type[SearchIndex[hikari.Member]], app: hikari.GatewayBot, guild_id: hikari.Snowflakeish, *attrs: str
+    ) -> SearchIndex[hikari.Member]:
+        """
+        Create an index over the cached members of the given guild, which is kept up to date from
+        gateway events until :obj:`~SearchIndex.close` is called.
+
+        Args:
+            app (:obj:`hikari.GatewayBot`): The app whose cache and events to use.
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild to index the members of.
+            *attrs (:obj:`str`): Attributes to index the members by.
+
+        Returns:
+            :obj:`~SearchIndex` [ :obj:`hikari.Member` ]: The created index.
+        """
+        index = cls(*attrs)
+        index._bind(
+            app,
+            guild_id,
+            lambda: app.cache.get_members_view_for_guild(guild_id).values(),
+            {
+                hikari.MemberCreateEvent: lambda event: index.add(event.member),
+                hikari.MemberUpdateEvent: lambda event: index.add(event.member),
+                hikari.MemberDeleteEvent: lambda event: index.remove(event.user_id),
+                hikari.MemberChunkEvent: lambda event: index.update(event.members.values()),
+            },
+        )
+        return index
+
+    @classmethod
+    def for_channels(
+        cls: t.Type[SearchIndex[hikari.GuildChannel]],
+        app: hikari.GatewayBot,
+        guild_id: hikari.Snowflakeish,
+        *attrs: str,
+    ) -> SearchIndex[hikari.GuildChannel]:
+        """
+        Create an index over the cached channels of the given guild, which is kept up to date from
+        gateway events until :obj:`~SearchIndex.close` is called.
+
+        Args:
+            app (:obj:`hikari.GatewayBot`): The app whose cache and events to use.
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild to index the channels of.
+            *attrs (:obj:`str`): Attributes to index the channels by.
+
+        Returns:
+            :obj:`~SearchIndex` [ :obj:`hikari.GuildChannel` ]: The created index.
+        """
+        index = cls(*attrs)
+        index._bind(
+            app,
+            guild_id,
+            lambda: app.cache.get_guild_channels_view_for_guild(guild_id).values(),
+            {
+                hikari.GuildChannelCreateEvent: lambda event: index.add(event.channel),
+                hikari.GuildChannelUpdateEvent: lambda event: index.add(event.channel),
+                hikari.GuildChannelDeleteEvent: lambda event: index.remove(event.channel_id),
+            },
+        )
+        return index
+
+    @classmethod
+    def for_roles(
+        cls: t.Type[SearchIndex[hikari.Role]], app: hikari.GatewayBot, guild_id: hikari.Snowflakeish, *attrs: str
+    ) -> SearchIndex[hikari.Role]:
+        """
+        Create an index over the cached roles of the given guild, which is kept up to date from
+        gateway events until :obj:`~SearchIndex.close` is called.
+
+        Args:
+            app (:obj:`hikari.GatewayBot`): The app whose cache and events to use.
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild to index the roles of.
+            *attrs (:obj:`str`): Attributes to index the roles by.
+
+        Returns:
+            :obj:`~SearchIndex` [ :obj:`hikari.Role` ]: The created index.
+        """
+        index = cls(*attrs)
+        index._bind(
+            app,
+            guild_id,
+            lambda: app.cache.get_roles_view_for_guild(guild_id).values(),
+            {
+                hikari.RoleCreateEvent: lambda event: index.add(event.role),
+                hikari.RoleUpdateEvent: lambda event: index.add(event.role),
+                hikari.RoleDeleteEvent: lambda event: index.remove(event.role_id),
+            },
+        )
+        return index
+
+    @classmethod
+    def for_emojis(
+        cls: t.Type[SearchIndex[hikari.KnownCustomEmoji]],
+        app: hikari.GatewayBot,
+        guild_id: hikari.Snowflakeish,
+        *attrs: str,
+    ) -> SearchIndex[hikari.KnownCustomEmoji]:
+        """
+        Create an index over the cached custom emojis of the given guild, which is kept up to date from
+        gateway events until :obj:`~SearchIndex.close` is called.
+
+        Args:
+            app (:obj:`hikari.GatewayBot`): The app whose cache and events to use.
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild to index the emojis of.
+            *attrs (:obj:`str`): Attributes to index the emojis by.
+
+        Returns:
+            :obj:`~SearchIndex` [ :obj:`hikari.KnownCustomEmoji` ]: The created index.
+        """
+        index = cls(*attrs)
+        index._bind(
+            app,
+            guild_id,
+            lambda: app.cache.get_emojis_view_for_guild(guild_id).values(),
+            {
+                # The event contains the guild's full set of emojis, which are cached before listeners are called
+                hikari.EmojisUpdateEvent: lambda _: index.rebuild(),
+            },
+        )
+        return index
+
+
+class NameMatch(t.NamedTuple):
+    """A name which matched a query made to a :obj:`~NameIndex`."""
+
+    id: hikari.Snowflake
+    """ID of the object with the matching name."""
+    name: str
+    """The name which matched."""
+    rank: int
+    """How closely the name matched. ``0`` if it matched exactly, ignoring case, otherwise the number
+    of characters in the name after the query. Lower is better."""
+
+
+class _SortedNames:
+    # Casefolded names sorted by length then by name, so that the names starting with a prefix are found in
+    # order of how closely they match. The list is split into blocks so that adding or removing a name only
+    # moves the items of one block rather than the whole list.
+    __slots__ = ("blocks", "maxes")
+
+    _BLOCK_SIZE: t.Final[int] = 256
+
+    def __init__(self) -> None:
+        self.blocks: t.List[t.List[t.Tuple[int, str]]] = []
+        # Last (largest) item of each block
+        self.maxes: t.List[t.Tuple[int, str]] = []
+
+    def add(self, name: str) -> None:
+        item = (len(name), name)
+        if not self.blocks:
+            self.blocks.append([item])
+            self.maxes.append(item)
+            return
+
+        i = bisect.bisect_left(self.maxes, item)
+        if i == len(self.blocks):
+            i -= 1
+            self.blocks[i].append(item)
+            self.maxes[i] = item
+        else:
+            bisect.insort(self.blocks[i], item)
+
+        if len(block := self.blocks[i]) > 2 * self._BLOCK_SIZE:
+            self.blocks[i : i + 1] = [block[: self._BLOCK_SIZE], block[self._BLOCK_SIZE :]]
+            self.maxes.insert(i, block[self._BLOCK_SIZE - 1])
+
+    def remove(self, name: str) -> None:
+        item = (len(name), name)
+        i = bisect.bisect_left(self.maxes, item)
+        block = self.blocks[i]
+        del block[bisect.bisect_left(block, item)]
+        if block:
+            self.maxes[i] = block[-1]
+        else:
+            del self.blocks[i]
+            del self.maxes[i]
+
+    def _iter_from(self, item: t.Tuple[int, str]) -> t.Iterator[t.Tuple[int, str]]:
+        i = bisect.bisect_left(self.maxes, item)
+        if i == len(self.blocks):
+            return
+        block = self.blocks[i]
+        yield from itertools.islice(block, bisect.bisect_left(block, item), None)
+        for block in itertools.islice(self.blocks, i + 1, None):
+            yield from block
+
+    def starting_with(self, prefix: str) -> t.Iterator[str]:
+        # Names of each length starting with the prefix are contiguous, so they are read from a single
+        # position found by bisection, then the search skips to the next length
+        key = (len(prefix), prefix)
+        while True:
+            for length, name in self._iter_from(key):
+                if not name.startswith(prefix):
+                    key = (max(length, key[0] + 1), prefix)
+                    break
+                yield name
+            else:
+                return
+
+
+class _NameMap:
+    __slots__ = ("names_by_id", "ids_by_name", "ids_by_folded", "sorted_names")
+
+    def __init__(self, prefixes: bool = False) -> None:
+        self.names_by_id: t.Dict[int, t.Tuple[str, ...]] = {}
+        # Values are used as ordered sets so that the first ID added under a name is returned first
+        self.ids_by_name: t.Dict[str, t.Dict[int, None]] = {}
+        self.ids_by_folded: t.Dict[str, t.Dict[int, None]] = {}
+        self.sorted_names: t.Optional[_SortedNames] = _SortedNames() if prefixes else None
+
+    def set(self, id_: int, names: t.Iterable[t.Optional[str]]) -> None:
+        new = tuple(dict.fromkeys(name for name in names if name is not None))
+        old = self.names_by_id.get(id_)
+        if old == new:
+            return
+        if old is not None:
+            self._unindex(id_, old)
+        self.names_by_id[id_] = new
+        for name in new:
+            self.ids_by_name.setdefault(name, {})[id_] = None
+        for folded in dict.fromkeys(name.casefold() for name in new):
+            if (ids := self.ids_by_folded.get(folded)) is None:
+                ids = self.ids_by_folded[folded] = {}
+                if self.sorted_names is not None:
+                    self.sorted_names.add(folded)
+            ids[id_] = None
+
+    def remove(self, id_: int) -> None:
+        if (old := self.names_by_id.pop(id_, None)) is not None:
+            self._unindex(id_, old)
+
+    def _unindex(self, id_: int, names: t.Iterable[str]) -> None:
+        for name in names:
+            ids = self.ids_by_name[name]
+            del ids[id_]
+            if not ids:
+                del self.ids_by_name[name]
+        for folded in dict.fromkeys(name.casefold() for name in names):
+            ids = self.ids_by_folded[folded]
+            del ids[id_]
+            if ids:
+                continue
+            del self.ids_by_folded[folded]
+            if self.sorted_names is not None:
+                self.sorted_names.remove(folded)
+
+    def get(self, name: str) -> t.Optional[hikari.Snowflake]:
+        if (ids := self.ids_by_name.get(name)) is None:
+            return None
+        return hikari.Snowflake(next(iter(ids)))
+
+    def match(self, query: str, limit: int) -> t.List[NameMatch]:
+        query = query.casefold()
+        candidates: t.Iterable[str]
+        if self.sorted_names is not None:
+            # Shorter names are closer matches, so each ID is first seen under its best matching name
+            candidates = self.sorted_names.starting_with(query)
+        else:
+            candidates = (query,) if query in self.ids_by_folded else ()
+
+        matches: t.List[NameMatch] = []
+        seen: t.Set[int] = set()
+        for folded in candidates:
+            for id_ in self.ids_by_folded[folded]:
+                if id_ in seen:
+                    continue
+                seen.add(id_)
+                # Report the name as it was given rather than casefolded
+                name = next(name for name in self.names_by_id[id_] if name.casefold() == folded)
+                matches.append(NameMatch(hikari.Snowflake(id_), name, len(folded) - len(query)))
+                if len(matches) >= limit:
+                    return matches
+        return matches
+
+
+class _GuildNames:
+    __slots__ = ("members", "roles", "channels")
+
+    def __init__(self, prefixes: bool) -> None:
+        self.members = _NameMap(prefixes)
+        self.roles = _NameMap(prefixes)
+        self.channels = _NameMap(prefixes)
+
+
+class NameIndex:
+    """
+    Index from the names of cached users, guild members, roles and guild channels to their IDs, used by the
+    built-in converters to resolve names without searching the entire cache. Users are indexed by username and
+    ``username#discriminator``, members additionally by nickname, and roles and channels by name.
+
+    The index is kept up to date by passing gateway events to :obj:`~NameIndex.update_from_event`. An instance
+    is maintained by the :obj:`~.app.BotApp` if it was created with ``index_names=True``.
+
+    If prefix matching is enabled, member, role and channel names can also be searched case-insensitively
+    by prefix, for example ``mod`` matching ``Moderators``. The built-in converters then fall back to
+    prefix matching when no name matches exactly.
+
+    Args:
+        prefix_matching (:obj:`bool`): Whether to keep the names sorted to allow matching names by prefix.
+            Defaults to ``False``.
+
+    Note:
+        Users are only indexed while they are a member of at least one indexed guild. Users cached without
+        sharing a guild with the bot (e.g. the authors of direct messages) are not indexed, so the built-in
+        user converter searches the cache for them if a name is not found in the index.
+    """
+
+    __slots__ = ("prefix_matching", "_guilds", "_users", "_user_guild_counts")
+
+    def __init__(self, prefix_matching: bool = False) -> None:
+        self.prefix_matching = prefix_matching
+        """Whether names are kept sorted to allow matching names by prefix."""
+        self._guilds: t.Dict[int, _GuildNames] = {}
+        self._users = _NameMap()
+        self._user_guild_counts: t.Dict[int, int] = {}
+
+    def _guild(self, guild_id: int) -> _GuildNames:
+        if (guild := self._guilds.get(guild_id)) is None:
+            guild = self._guilds[guild_id] = _GuildNames(self.prefix_matching)
+        return guild
+
+    def get_user_id(self, name: str) -> t.Optional[hikari.Snowflake]:
+        """
+        Get the ID of a user with the given username or ``username#discriminator``.
+
+        Args:
+            name (:obj:`str`): The name to look up.
+
+        Returns:
+            Optional[:obj:`hikari.Snowflake`]: ID of the user, or ``None`` if no user has the given name.
+        """
+        return self._users.get(name)
+
+    def get_member_id(self, guild_id: hikari.Snowflakeish, name: str) -> t.Optional[hikari.Snowflake]:
+        """
+        Get the ID of a member of the given guild with the given username, nickname or
+        ``username#discriminator``.
+
+        Args:
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild to look up the member in.
+            name (:obj:`str`): The name to look up.
+
+        Returns:
+            Optional[:obj:`hikari.Snowflake`]: ID of the member, or ``None`` if no member has the given name.
+        """
+        guild = self._guilds.get(int(guild_id))
+        return guild.members.get(name) if guild is not None else None
+
+    def get_role_id(self, guild_id: hikari.Snowflakeish, name: str) -> t.Optional[hikari.Snowflake]:
+        """
+        Get the ID of a role in the given guild with the given name.
+
+        Args:
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild to look up the role in.
+            name (:obj:`str`): The name to look up.
+
+        Returns:
+            Optional[:obj:`hikari.Snowflake`]: ID of the role, or ``None`` if no role has the given name.
+        """
+        guild = self._guilds.get(int(guild_id))
+        return guild.roles.get(name) if guild is not None else None
+
+    def get_channel_id(self, guild_id: hikari.Snowflakeish, name: str) -> t.Optional[hikari.Snowflake]:
+        """
+        Get the ID of a channel in the given guild with the given name.
+
+        Args:
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild to look up the channel in.
+            name (:obj:`str`): The name to look up.
+
+        Returns:
+            Optional[:obj:`hikari.Snowflake`]: ID of the channel, or ``None`` if no channel has the given name.
+        """
+        guild = self._guilds.get(int(guild_id))
+        return guild.channels.get(name) if guild is not None else None
+
+    def match_member_names(self, guild_id: hikari.Snowflakeish, query: str, limit: int = 10) -> t.List[NameMatch]:
+        """
+        Get the members of the given guild whose username, nickname or ``username#discriminator`` matches the
+        given query, ignoring case. If prefix matching is enabled, names starting with the query also match.
+
+        Args:
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild to look up the members in.
+            query (:obj:`str`): The name, or start of the name, to look up.
+            limit (:obj:`int`): Maximum number of matches to return. Defaults to ``10``.
+
+        Returns:
+            List[:obj:`~NameMatch`]: The best matching name of each matching member, from best to worst match.
+        """
+        guild = self._guilds.get(int(guild_id))
+        return guild.members.match(query, limit) if guild is not None else []
+
+    def match_role_names(self, guild_id: hikari.Snowflakeish, query: str, limit: int = 10) -> t.List[NameMatch]:
+        """
+        Get the roles in the given guild whose name matches the given query, ignoring case. If prefix
+        matching is enabled, names starting with the query also match.
+
+        Args:
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild to look up the roles in.
+            query (:obj:`str`): The name, or start of the name, to look up.
+            limit (:obj:`int`): Maximum number of matches to return. Defaults to ``10``.
+
+        Returns:
+            List[:obj:`~NameMatch`]: The matching roles, from best to worst match.
+        """
+        guild = self._guilds.get(int(guild_id))
+        return guild.roles.match(query, limit) if guild is not None else []
+
+    def match_channel_names(self, guild_id: hikari.Snowflakeish, query: str, limit: int = 10) -> t.List[NameMatch]:
+        """
+        Get the channels in the given guild whose name matches the given query, ignoring case. If prefix
+        matching is enabled, names starting with the query also match.
+
+        Args:
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild to look up the channels in.
+            query (:obj:`str`): The name, or start of the name, to look up.
+            limit (:obj:`int`): Maximum number of matches to return. Defaults to ``10``.
+
+        Returns:
+            List[:obj:`~NameMatch`]: The matching channels, from best to worst match.
+        """
+        guild = self._guilds.get(int(guild_id))
+        return guild.channels.match(query, limit) if guild is not None else []
+
+    def set_member(self, member: hikari.Member) -> None:
+        """
+        Add or update the names of a member of a guild.
+
+        Args:
+            member (:obj:`hikari.Member`): The member to index.
+
+        Returns:
+            ``None``
+        """
+        members, user_id = self._guild(member.guild_id).members, member.id
+        if user_id not in members.names_by_id:
+            self._user_guild_counts[user_id] = self._user_guild_counts.get(user_id, 0) + 1
+        tag = f"{member.username}#{member.discriminator}"
+        members.set(user_id, (member.username, member.nickname, tag))
+        self._users.set(user_id, (member.username, tag))
+
+    def remove_member(self, guild_id: hikari.Snowflakeish, user_id: hikari.Snowflakeish) -> None:
+        """
+        Remove a member of a guild from the index.
+
+        Args:
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild the member was removed from.
+            user_id (:obj:`hikari.Snowflakeish`): ID of the member.
+
+        Returns:
+            ``None``
+        """
+        guild, user_id = self._guilds.get(int(guild_id)), int(user_id)
+        if guild is None or user_id not in guild.members.names_by_id:
+            return
+        guild.members.remove(user_id)
+        self._release_user(user_id)
+
+    def _release_user(self, user_id: int) -> None:
+        if (count := self._user_guild_counts[user_id]) > 1:
+            self._user_guild_counts[user_id] = count - 1
+            return
+        del self._user_guild_counts[user_id]
+        self._users.remove(user_id)
+
+    def set_role(self, role: hikari.Role) -> None:
+        """
+        Add or update the name of a role.
+
+        Args:
+            role (:obj:`hikari.Role`): The role to index.
+
+        Returns:
+            ``None``
+        """
+        self._guild(role.guild_id).roles.set(role.id, (role.name,))
+
+    def remove_role(self, guild_id: hikari.Snowflakeish, role_id: hikari.Snowflakeish) -> None:
+        """
+        Remove a role from the index.
+
+        Args:
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild the role was deleted from.
+            role_id (:obj:`hikari.Snowflakeish`): ID of the role.
+
+        Returns:
+            ``None``
+        """
+        if (guild := self._guilds.get(int(guild_id))) is not None:
+            guild.roles.remove(int(role_id))
+
+    def set_channel(self, channel: hikari.GuildChannel) -> None:
+        """
+        Add or update the name of a guild channel.
+
+        Args:
+            channel (:obj:`hikari.GuildChannel`): The channel to index.
+
+        Returns:
+            ``None``
+        """
+        self._guild(channel.guild_id).channels.set(channel.id, (channel.name,))
+
+    def remove_channel(self, guild_id: hikari.Snowflakeish, channel_id: hikari.Snowflakeish) -> None:
+        """
+        Remove a guild channel from the index.
+
+        Args:
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild the channel was deleted from.
+            channel_id (:obj:`hikari.Snowflakeish`): ID of the channel.
+
+        Returns:
+            ``None``
+        """
+        if (guild := self._guilds.get(int(guild_id))) is not None:
+            guild.channels.remove(int(channel_id))
+
+    def clear_guild(self, guild_id: hikari.Snowflakeish) -> None:
+        """
+        Remove all the members, roles and channels of a guild from the index.
+
+        Args:
+            guild_id (:obj:`hikari.Snowflakeish`): ID of the guild to remove.
+
+        Returns:
+            ``None``
+        """
+        if (guild := self._guilds.pop(int(guild_id), None)) is not None:
+            for user_id in guild.members.names_by_id:
+                self._release_user(user_id)
+
+    def update_from_event(self, event: hikari.Event) -> None:
+        """
+        Update the index from a gateway event. Member, member chunk, role, guild channel, guild available,
+        guild join and guild leave events are handled; any other events are ignored.
+
+        Args:
+            event (:obj:`hikari.Event`): The event to update the index from.
+
+        Returns:
+            ``None``
+        """
+        if isinstance(event, (hikari.MemberCreateEvent, hikari.MemberUpdateEvent)):
+            self.set_member(event.member)
+        elif isinstance(event, hikari.MemberDeleteEvent):
+            self.remove_member(event.guild_id, event.user_id)
+        elif isinstance(event, hikari.MemberChunkEvent):
+            for member in event.members.values():
+                self.set_member(member)
+        elif isinstance(event, (hikari.RoleCreateEvent, hikari.RoleUpdateEvent)):
+            self.set_role(event.role)
+        elif isinstance(event, hikari.RoleDeleteEvent):
+            self.remove_role(event.guild_id, event.role_id)
+        elif isinstance(event, (hikari.GuildChannelCreateEvent, hikari.GuildChannelUpdateEvent)):
+            self.set_channel(event.channel)
+        elif isinstance(event, hikari.GuildChannelDeleteEvent):
+            self.remove_channel(event.guild_id, event.channel_id)
+        elif isinstance(event, (hikari.GuildAvailableEvent, hikari.GuildJoinEvent)):
+            # Sent with the guild's full state when it is first received, recovers from an outage or is joined
+            self.clear_guild(event.guild_id)
+            for member in event.members.values():
+                self.set_member(member)
+            for role in event.roles.values():
+                self.set_role(role)
+            for channel in event.channels.values():
+                self.set_channel(channel)
+        elif isinstance(event, hikari.GuildLeaveEvent):
+            self.clear_guild(event.guild_id)
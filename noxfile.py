@@ -21,14 +21,17 @@ import nox
 from nox import options
 
 PATH_TO_PROJECT = os.path.join(".", "lightbulb")
+BENCHMARKS = ["cooldown_algorithms", "cooldown_memory", "import_time", "name_matching", "permissions_bulk"]
 SCRIPT_PATHS = [
     PATH_TO_PROJECT,
+    "benchmarks",
     "noxfile.py",
     "release_webhook.py",
+    "tests",
     "docs/source/conf.py",
 ]
 
-options.sessions = ["format_fix", "mypy", "sphinx"]
+options.sessions = ["format_fix", "mypy", "pytest", "sphinx"]
 
 
 @nox.session()
@@ -50,7 +53,15 @@ def format(session):
 def mypy(session):
     session.install("-Ur", "requirements.txt")
     session.install("-U", "mypy")
-    session.run("python", "-m", "mypy", "lightbulb")
+    session.run("python", "-m", "mypy", "lightbulb", "benchmarks")
+
+
+@nox.session(reuse_venv=True)
+def pytest(session):
+    session.install("-Ur", "requirements.txt")
+    session.install("-U", "pytest")
+    session.install("-e", ".")
+    session.run("python", "-m", "pytest", "tests")
 
 
 @nox.session(reuse_venv=True)
@@ -58,3 +69,12 @@ def sphinx(session):
     session.install("-Ur", "docs_requirements.txt")
     session.install("-Ur", "requirements.txt")
     session.run("python", "-m", "sphinx.cmd.build", "docs/source", "docs/build", "-b", "html")
+
+
+@nox.session(reuse_venv=True)
+@nox.parametrize("name", BENCHMARKS)
+def benchmark(session, name):
+    # Usage: nox -s "benchmark(name='<benchmark>')" [-- <benchmark arguments>]
+    session.install("-Ur", "requirements.txt")
+    session.install("-e", ".")
+    session.run("python", "-m", f"benchmarks.{name}", *session.posargs)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright © tandemdude 2020-present
+#
+# This file is part of Lightbulb.
+#
+# Lightbulb is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Lightbulb is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import bisect
+import random
+import types
+
+import pytest
+
+from lightbulb import cooldowns
+
+LENGTH = 10.0
+USAGES = 5
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+class Bucket(cooldowns.Bucket):
+    __slots__ = ()
+
+    @classmethod
+    def extract_hash(cls, context):
+        return 0
+
+
+def _context(user_id):
+    return types.SimpleNamespace(author=types.SimpleNamespace(id=user_id))
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cooldowns, "time", clock)
+    return clock
+
+
+@pytest.fixture(scope="module")
+def requests():
+    rng = random.Random(0)
+    requests, now = [], 0.0
+    while now < 3600.0:
+        # Bursty traffic averaging four times the permitted rate
+        now += rng.expovariate(4 * USAGES / LENGTH) * rng.choice((0.1, 1.9))
+        requests.append(now)
+    return requests
+
+
+@pytest.mark.parametrize(
+    "algorithm, window_limit",
+    [
+        (None, 2 * USAGES),
+        (cooldowns.SlidingWindowLog, USAGES),
+        # The counter assumes usages in the previous window were evenly spread, so can be exceeded in a true window
+        (cooldowns.SlidingWindowCounter, 2 * USAGES),
+        # A full bucket can be emptied at the start of a window and then refilled once during it
+        (cooldowns.TokenBucket, 2 * USAGES),
+    ],
+)
+def test_algorithm_never_exceeds_window_limit(clock, requests, algorithm, window_limit):
+    bucket_type = Bucket if algorithm is None else cooldowns._bucket_with_algorithm(Bucket, algorithm)
+    admitted, bucket = [], None
+    for clock.now in requests:
+        # Mirrors CooldownManager - expired buckets are replaced with a new one
+        status = bucket.acquire() if bucket is not None else cooldowns.CooldownStatus.EXPIRED
+        if status is cooldowns.CooldownStatus.EXPIRED:
+            bucket = bucket_type(LENGTH, USAGES)
+            status = bucket.acquire()
+        if status is cooldowns.CooldownStatus.INACTIVE:
+            admitted.append(clock.now)
+
+    assert admitted
+    worst = max(bisect.bisect_left(admitted, at + LENGTH) - i for i, at in enumerate(admitted))
+    assert worst <= window_limit
+
+
+def _token_bucket_manager(burst):
+    bucket = cooldowns._bucket_with_algorithm(cooldowns.UserBucket, cooldowns.TokenBucket)
+    return cooldowns.CooldownManager(cooldowns._StaticBucketFactory(bucket, 60.0, 2, burst=burst))
+
+
+@pytest.mark.parametrize("burst, restored", [(3, 1), (5, 0)])
+def test_snapshot_only_restores_matching_algorithm_arguments(tmp_path, burst, restored):
+    path = tmp_path / "cooldowns.bin"
+    saved = _token_bucket_manager(3)
+    asyncio.run(saved.add_cooldown(_context(1)))
+    assert cooldowns.save_cooldown_snapshot({"command": saved}, path) == 1
+
+    loaded = _token_bucket_manager(burst)
+    assert cooldowns.load_cooldown_snapshot({"command": loaded}, path) == restored
+    assert len(loaded.cooldowns) == restored
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Copyright © tandemdude 2020-present
+#
+# This file is part of Lightbulb.
+#
+# Lightbulb is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Lightbulb is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Lightbulb. If not, see <https://www.gnu.org/licenses/>.
+import importlib
+
+import pytest
+
+
+@pytest.mark.parametrize("package_name", ["lightbulb", "lightbulb.converters", "lightbulb.utils"])
+def test_lazy_exports_match_module_all(package_name):
+    package = importlib.import_module(package_name)
+    for module_name, names in package._EXPORTS.items():
+        module = importlib.import_module(f"{package_name}.{module_name}")
+        # Subpackages are only exposed as an attribute, their contents are not re-exported
+        expected = () if hasattr(module, "__path__") else module.__all__
+        assert list(names) == list(expected), f"exports for {module.__name__} do not match its __all__"